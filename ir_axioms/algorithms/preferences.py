@@ -0,0 +1,150 @@
+from dataclasses import dataclass, field
+from typing import Generic, Optional, Sequence, Tuple
+
+from numpy import (
+    arange,
+    asarray,
+    bool_,
+    fill_diagonal,
+    float_,
+    full,
+    intp,
+    ix_,
+    nan,
+    searchsorted,
+    union1d,
+    zeros,
+)
+from numpy.typing import ArrayLike, NDArray
+
+from ir_axioms.axiom import Axiom, ScoreAxiom
+from ir_axioms.model import Input, Output, Preference, PreferenceMatrix
+
+
+@dataclass(kw_only=True)
+class LazyPreferenceMatrix(Generic[Input, Output]):
+    """
+    A preference matrix of an axiom for a fixed input and outputs, whose entries are only computed when they are first accessed, and then memoized.
+
+    Comparison-based algorithms (e.g., KwikSort) typically only need a fraction of all pairwise preferences, so that computing the full preference matrix upfront would be wasteful.
+    For antisymmetric axioms, computing one entry also fills the mirrored entry.
+    """
+
+    axiom: Axiom[Input, Output]
+    input: Input
+    outputs: Sequence[Output]
+
+    _preferences: NDArray[float_] = field(init=False, repr=False)
+    _computed: NDArray[bool_] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        size = len(self.outputs)
+        self._preferences = full((size, size), nan, dtype=float_)
+        self._computed = zeros((size, size), dtype=bool_)
+        if self.antisymmetric:
+            fill_diagonal(self._preferences, 0)
+            fill_diagonal(self._computed, True)
+
+    @property
+    def antisymmetric(self) -> bool:
+        return self.axiom.antisymmetric
+
+    @property
+    def num_computed(self) -> int:
+        """
+        Number of entries that have been computed so far (including mirrored entries).
+        """
+        return int(self._computed.sum())
+
+    def __len__(self) -> int:
+        return len(self.outputs)
+
+    def __getitem__(self, index: Tuple[int, int]) -> Preference:
+        row, column = index
+        if not self._computed[row, column]:
+            preference = self.axiom.preference(
+                input=self.input,
+                output1=self.outputs[row],
+                output2=self.outputs[column],
+            )
+            self._preferences[row, column] = preference
+            self._computed[row, column] = True
+            if self.antisymmetric:
+                self._preferences[column, row] = -preference
+                self._computed[column, row] = True
+        return float(self._preferences[row, column])
+
+    def block(
+        self,
+        rows: ArrayLike,
+        columns: ArrayLike,
+    ) -> PreferenceMatrix:
+        """
+        Get the preferences between the outputs at the given row and column indices, computing only missing entries.
+        The missing entries are computed at once with the axiom's ``masked_preferences()``, such that combinators (e.g., ``CascadeAxiom``) can share work between them, but no other entries are computed.
+        Score axioms instead score all outputs once.
+
+        :param rows: Indices of the first outputs.
+        :param columns: Indices of the second outputs.
+        :return: A preference matrix, where the ij-th entry corresponds to the preference between the output at the i-th row index and the output at the j-th column index.
+        """
+        rows = asarray(rows, dtype=intp)
+        columns = asarray(columns, dtype=intp)
+        missing = ~self._computed[ix_(rows, columns)]
+        if missing.any() and isinstance(self.axiom, ScoreAxiom):
+            # The first column (e.g., KwikSort's first pivot) already needs almost all scores,
+            # so score all outputs once and derive the full preference matrix from these scores.
+            self._preferences[:] = self.axiom.preferences(self.input, self.outputs)
+            self._computed[:] = True
+        elif missing.any():
+            indices = union1d(rows, columns)
+            mask = zeros((len(indices), len(indices)), dtype=bool_)
+            mask[ix_(searchsorted(indices, rows), searchsorted(indices, columns))] = (
+                missing
+            )
+            values = self.axiom.masked_preferences(
+                input=self.input,
+                outputs=[self.outputs[index] for index in indices],
+                mask=mask,
+            )
+            preferences = self._preferences[ix_(indices, indices)]
+            computed = self._computed[ix_(indices, indices)]
+            preferences[mask] = values[mask]
+            computed |= mask
+            if self.antisymmetric:
+                preferences[mask.T] = -values.T[mask.T]
+                computed |= mask.T
+            self._preferences[ix_(indices, indices)] = preferences
+            self._computed[ix_(indices, indices)] = computed
+        return self._preferences[ix_(rows, columns)].copy()
+
+    def row(
+        self,
+        row: int,
+        columns: Optional[ArrayLike] = None,
+    ) -> NDArray[float_]:
+        """
+        Get the preferences between the output at the given row index and the outputs at the given column indices (or all outputs).
+        """
+        if columns is None:
+            columns = arange(len(self.outputs))
+        return self.block([row], columns)[0]
+
+    def column(
+        self,
+        column: int,
+        rows: Optional[ArrayLike] = None,
+    ) -> NDArray[float_]:
+        """
+        Get the preferences between the outputs at the given row indices (or all outputs) and the output at the given column index.
+        """
+        if rows is None:
+            rows = arange(len(self.outputs))
+        return self.block(rows, [column])[:, 0]
+
+    def full(self) -> PreferenceMatrix:
+        """
+        Get the full preference matrix, computing only missing entries.
+        """
+        indices = arange(len(self.outputs))
+        return self.block(indices, indices)
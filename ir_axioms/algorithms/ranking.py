@@ -1,56 +1,167 @@
-from typing import Sequence
+from typing import List, Optional, Sequence, Tuple, TypeVar, Union, overload
 
+from numpy import arange, argmax, asarray, delete, empty, intp
+from numpy.typing import NDArray
+
+from ir_axioms.algorithms.preferences import LazyPreferenceMatrix
 from ir_axioms.axiom import Axiom
 from ir_axioms.logging import logger
-from ir_axioms.model import Input, Output
+from ir_axioms.model import Input, Output, PreferenceMatrix
 from ir_axioms.tools.pivot import RandomPivotSelection, PivotSelection
 
+_T = TypeVar("_T")
 
-def kwiksort(
-    axiom: Axiom[Input, Output],
+
+class _PartitionVertices(Sequence[_T]):
+    """
+    View of the vertices of a partition that does not copy the vertices.
+    Remembers the last accessed position, such that the position of the selected pivot is known without searching the partition.
+    """
+
+    def __init__(self, vertices: Sequence[_T], indices: NDArray[intp]) -> None:
+        self.vertices = vertices
+        self.indices = indices
+        self.last_position: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    @overload
+    def __getitem__(self, position: int) -> _T: ...
+
+    @overload
+    def __getitem__(self, position: slice) -> Sequence[_T]: ...
+
+    def __getitem__(self, position: Union[int, slice]) -> Union[_T, Sequence[_T]]:
+        if isinstance(position, slice):
+            return [self.vertices[index] for index in self.indices[position]]
+        position = range(len(self.indices))[position]
+        self.last_position = position
+        return self.vertices[self.indices[position]]
+
+
+def _select_pivot_position(
+    input: Input,
+    vertices: Sequence[Output],
+    indices: NDArray[intp],
+    pivot_selection: PivotSelection[Input, Output],
+) -> int:
+    partition = _PartitionVertices(vertices, indices)
+    pivot = pivot_selection.select_pivot(input, partition)
+    position = partition.last_position
+    if position is not None and vertices[indices[position]] is pivot:
+        return position
+    for position, index in enumerate(indices):
+        if vertices[index] is pivot:
+            return position
+    raise ValueError(f"Pivot {pivot} is not a vertex of the partition.")
+
+
+def kwiksort_indices(
+    axiom: Optional[Axiom[Input, Output]],
     input: Input,
     vertices: Sequence[Output],
     pivot_selection: PivotSelection[Input, Output] = RandomPivotSelection(),
-) -> Sequence[Output]:
-    if len(vertices) == 0:
-        return []
+    preferences: Optional[
+        Union[LazyPreferenceMatrix[Input, Output], PreferenceMatrix]
+    ] = None,
+) -> NDArray[intp]:
+    """
+    Rank the vertices with KwikSort, i.e., quicksort using the axiom's preferences, and return the ranked vertices' indices.
 
-    vertices_left = []
-    vertices_right = []
+    The partitions are sorted iteratively (not recursively), and each partition is split with NumPy masks on the preferences of its vertices over the pivot.
+    Preferences are looked up from a lazy preference matrix, such that only the preferences actually needed for sorting are computed (and each at most once), or from a precomputed preference matrix.
 
-    # Select random pivot.
-    logger.debug("Selecting reranking pivot.")
-    pivot = pivot_selection.select_pivot(input, vertices)
+    :param axiom: Axiom to compute the preferences with. Can be omitted if the preferences are given.
+    :param input: Common input for all vertices.
+    :param vertices: The vertices (outputs) to rank.
+    :param pivot_selection: Strategy to select the pivot of each partition.
+    :param preferences: Optional lazy or precomputed preference matrix for the vertices, e.g., to share computed preferences with other algorithms.
+    :return: The indices of the vertices, in ranked order.
+    """
+    if preferences is None:
+        if axiom is None:
+            raise ValueError("Either an axiom or a preference matrix is required.")
+        preferences = LazyPreferenceMatrix(
+            axiom=axiom,
+            input=input,
+            outputs=vertices,
+        )
+    elif len(preferences) != len(vertices):
+        raise ValueError("Preference matrix does not match the vertices.")
+    if not isinstance(preferences, LazyPreferenceMatrix):
+        preferences = asarray(preferences)
+        if preferences.shape != (len(vertices), len(vertices)):
+            raise ValueError("Preference matrix does not match the vertices.")
 
-    for vertex in vertices:
-        if vertex is pivot:
+    ranking = empty(len(vertices), dtype=intp)
+    # Partitions left to sort, with the rank offset of their first vertex.
+    # The left partition is sorted first (as in a recursive KwikSort), such that the same pivots are selected.
+    partitions: List[Tuple[int, NDArray[intp]]] = [(0, arange(len(vertices)))]
+    while len(partitions) > 0:
+        offset, indices = partitions.pop()
+        if len(indices) == 0:
             continue
 
-        preference = axiom.preference(input, vertex, pivot)
-        if preference > 0:
-            vertices_left.append(vertex)
-        elif preference < 0:
-            vertices_right.append(vertex)
+        logger.debug("Selecting reranking pivot.")
+        pivot_position = _select_pivot_position(
+            input, vertices, indices, pivot_selection
+        )
+        pivot_index = indices[pivot_position]
+        other_indices = delete(indices, pivot_position)
+        if len(other_indices) == 0:
+            ranking[offset] = pivot_index
+            continue
+
+        if isinstance(preferences, LazyPreferenceMatrix):
+            pivot_preferences = preferences.column(pivot_index, other_indices)
         else:
+            pivot_preferences = preferences[other_indices, pivot_index]
+        left = pivot_preferences > 0
+        right = pivot_preferences < 0
+        ties = ~(left | right)
+        if ties.any():
             raise RuntimeError(
                 f"Tie during reranking. "
-                f"Document {vertex} has same preference "
-                f"as pivot document {pivot}. "
+                f"Document {vertices[other_indices[argmax(ties)]]} has same preference "
+                f"as pivot document {vertices[pivot_index]}. "
                 f"Consider using a ORIG axiom as fallback, "
                 f"to break ties."
             )
 
-    vertices_left_sorted = kwiksort(
-        axiom=axiom,
-        input=input,
-        vertices=vertices_left,
-        pivot_selection=pivot_selection,
-    )
-    vertices_right_sorted = kwiksort(
+        indices_left = other_indices[left]
+        indices_right = other_indices[right]
+        ranking[offset + len(indices_left)] = pivot_index
+        partitions.append((offset + len(indices_left) + 1, indices_right))
+        partitions.append((offset, indices_left))
+
+    return ranking
+
+
+def kwiksort(
+    axiom: Optional[Axiom[Input, Output]],
+    input: Input,
+    vertices: Sequence[Output],
+    pivot_selection: PivotSelection[Input, Output] = RandomPivotSelection(),
+    preferences: Optional[
+        Union[LazyPreferenceMatrix[Input, Output], PreferenceMatrix]
+    ] = None,
+) -> Sequence[Output]:
+    """
+    Rank the vertices with KwikSort, i.e., quicksort using the axiom's preferences (see ``kwiksort_indices()``).
+
+    :param axiom: Axiom to compute the preferences with. Can be omitted if the preferences are given.
+    :param input: Common input for all vertices.
+    :param vertices: The vertices (outputs) to rank.
+    :param pivot_selection: Strategy to select the pivot of each partition.
+    :param preferences: Optional lazy or precomputed preference matrix for the vertices, e.g., to share computed preferences with other algorithms.
+    :return: The ranked vertices.
+    """
+    ranking = kwiksort_indices(
         axiom=axiom,
         input=input,
-        vertices=vertices_right,
+        vertices=vertices,
         pivot_selection=pivot_selection,
+        preferences=preferences,
     )
-
-    return [*vertices_left_sorted, pivot, *vertices_right_sorted]
+    return [vertices[index] for index in ranking]
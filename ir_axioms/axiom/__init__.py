@@ -152,6 +152,14 @@ from ir_axioms.axiom.base import (  # noqa: F401
 
 from ir_axioms.axiom.cache import (  # noqa: F401
     CachedAxiom,
+    DbmCachedAxiom,
+    DbmPreferenceCache,
+    LruPreferenceCache,
+    MatrixCachedAxiom,
+    PreferenceCache,
+    PreferenceCacheStatistics,
+    ScoreCachedAxiom,
+    SqlitePreferenceCache,
 )
 
 from ir_axioms.axiom.estimator import (  # noqa: F401
@@ -164,10 +172,19 @@ from ir_axioms.axiom.parallel import (  # noqa: F401
     ParallelAxiom,
 )
 
+from ir_axioms.axiom.planner import (  # noqa: F401
+    SharedAxiom,
+    plan_axioms,
+)
+
 from ir_axioms.axiom.precondition import (  # noqa: F401
     PreconditionMixin,
 )
 
+from ir_axioms.axiom.score import (  # noqa: F401
+    ScoreAxiom,
+)
+
 from ir_axioms.axiom.simple import (  # noqa: F401
     NopAxiom,
     NOP,
@@ -1,20 +1,76 @@
-from dataclasses import dataclass
+from abc import ABC
+from contextvars import copy_context
+from dataclasses import dataclass, field, replace
 from functools import reduce
 from math import isclose, ceil
 from operator import mul
-from typing import Iterable, Sequence, Any
-
-from numpy import full, stack, zeros
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from joblib import Parallel, delayed
+
+from numpy import (
+    array,
+    bool_,
+    divide,
+    full,
+    int16,
+    logical_not,
+    ones,
+    sign,
+    where,
+    zeros,
+)
+from numpy.typing import NDArray
 from tqdm.auto import tqdm
 
 from ir_axioms.axiom.base import Axiom
 from ir_axioms.model import Input, Output, Preference, PreferenceMatrix
 
 
+def _cost_ordered(
+    axioms: Iterable[Axiom[Input, Output]],
+    costs: Dict[int, float],
+) -> Sequence[Tuple[int, Axiom[Input, Output]]]:
+    # Axioms without measured cost come first (in their original order),
+    # so that their cost is measured.
+    return sorted(enumerate(axioms), key=lambda item: costs.get(item[0], 0))
+
+
+def _measured_masked_preferences(
+    axiom: Axiom[Input, Output],
+    input: Input,
+    outputs: Sequence[Output],
+    mask: NDArray[bool_],
+    costs: Dict[int, float],
+    index: int,
+) -> PreferenceMatrix:
+    start = perf_counter()
+    preferences = axiom.masked_preferences(input, outputs, mask)
+    # Measure the cost per masked pair, smoothed over previous evaluations.
+    cost = (perf_counter() - start) / max(1, int(mask.sum()))
+    costs[index] = cost if index not in costs else (costs[index] + cost) / 2
+    return preferences
+
+
 @dataclass(frozen=True, kw_only=True)
 class UniformAxiom(Axiom[Any, Any]):
     scalar: float
 
+    @property
+    def input_dependent(self) -> bool:
+        return False
+
     def preference(
         self,
         input: Any,
@@ -32,8 +88,60 @@ class UniformAxiom(Axiom[Any, Any]):
 
 
 @dataclass(frozen=True, kw_only=True)
-class SumAxiom(Axiom[Input, Output]):
+class _ConcurrentAxiomsMixin(Axiom[Input, Output], ABC):
     axioms: Iterable[Axiom[Input, Output]]
+    n_jobs: Optional[int] = None
+    """
+    Number of child axioms to evaluate concurrently when batch-computing preferences (e.g., ``-1`` for all CPUs), or ``None`` to evaluate them sequentially.
+    """
+    prefer: Literal["threads", "processes"] = "threads"
+    """
+    Whether to evaluate the child axioms in a thread pool (e.g., for axioms waiting on I/O, the JVM, or native code) or in a process pool.
+    Only threads share the active analysis session.
+    """
+
+    @property
+    def concurrent(self) -> bool:
+        return self.n_jobs is not None and self.n_jobs != 1
+
+    def _evaluate_axioms(
+        self,
+        evaluate: Callable[[Axiom[Input, Output]], PreferenceMatrix],
+        desc: Optional[str] = None,
+    ) -> Iterator[PreferenceMatrix]:
+        """
+        Evaluate the child axioms, yielding their preference matrices one by one (in order), such that they can be reduced without keeping all matrices in memory.
+        """
+        axioms = list(self.axioms)
+        if not self.concurrent or len(axioms) <= 1:
+            for axiom in tqdm(axioms, desc=desc, disable=desc is None):
+                yield evaluate(axiom)
+            return
+
+        with Parallel(
+            n_jobs=self.n_jobs,
+            prefer=self.prefer,
+            return_as="generator",
+        ) as parallel:
+            if self.prefer == "threads":
+                # Threads do not inherit context variables (e.g., the active analysis session),
+                # so evaluate each axiom in a copy of the current context.
+                yield from parallel(
+                    delayed(copy_context().run)(evaluate, axiom) for axiom in axioms
+                )
+            else:
+                yield from parallel(delayed(evaluate)(axiom) for axiom in axioms)
+
+
+@dataclass(frozen=True, kw_only=True)
+class SumAxiom(_ConcurrentAxiomsMixin[Input, Output]):
+    @property
+    def antisymmetric(self) -> bool:
+        return all(axiom.antisymmetric for axiom in self.axioms)
+
+    @property
+    def input_dependent(self) -> bool:
+        return any(axiom.input_dependent for axiom in self.axioms)
 
     def preference(
         self,
@@ -48,17 +156,47 @@ class SumAxiom(Axiom[Input, Output]):
         input: Input,
         outputs: Sequence[Output],
     ) -> PreferenceMatrix:
-        return stack([axiom.preferences(input, outputs) for axiom in self.axioms]).sum(
-            axis=0
-        )
+        aggregated_preferences = zeros((len(outputs), len(outputs)))
+        for preferences in self._evaluate_axioms(
+            lambda axiom: axiom.preferences(input, outputs)
+        ):
+            aggregated_preferences += preferences
+        return aggregated_preferences
+
+    def masked_preferences(
+        self,
+        input: Input,
+        outputs: Sequence[Output],
+        mask: NDArray[bool_],
+    ) -> PreferenceMatrix:
+        aggregated_preferences = zeros((len(outputs), len(outputs)))
+        for preferences in self._evaluate_axioms(
+            lambda axiom: axiom.masked_preferences(input, outputs, mask)
+        ):
+            aggregated_preferences += preferences
+        return aggregated_preferences
 
     def __add__(self, other: Axiom[Input, Output]) -> Axiom[Input, Output]:
-        return SumAxiom(axioms=[*self.axioms, other])
+        return replace(self, axioms=[*self.axioms, other])
 
 
 @dataclass(frozen=True, kw_only=True)
-class ProductAxiom(Axiom[Input, Output]):
-    axioms: Iterable[Axiom[Input, Output]]
+class ProductAxiom(_ConcurrentAxiomsMixin[Input, Output]):
+    @property
+    def antisymmetric(self) -> bool:
+        # Constant factors (e.g., for negation) do not change antisymmetry,
+        # but an even number of antisymmetric factors cancels it out.
+        antisymmetric_factors = 0
+        for axiom in self.axioms:
+            if axiom.antisymmetric:
+                antisymmetric_factors += 1
+            elif not isinstance(axiom, UniformAxiom):
+                return False
+        return antisymmetric_factors % 2 == 1
+
+    @property
+    def input_dependent(self) -> bool:
+        return any(axiom.input_dependent for axiom in self.axioms)
 
     def preference(
         self,
@@ -75,19 +213,43 @@ class ProductAxiom(Axiom[Input, Output]):
         input: Input,
         outputs: Sequence[Output],
     ) -> PreferenceMatrix:
-        return stack([axiom.preferences(input, outputs) for axiom in self.axioms]).prod(
-            axis=0
-        )
+        aggregated_preferences = ones((len(outputs), len(outputs)))
+        for preferences in self._evaluate_axioms(
+            lambda axiom: axiom.preferences(input, outputs)
+        ):
+            aggregated_preferences *= preferences
+        return aggregated_preferences
+
+    def masked_preferences(
+        self,
+        input: Input,
+        outputs: Sequence[Output],
+        mask: NDArray[bool_],
+    ) -> PreferenceMatrix:
+        aggregated_preferences = ones((len(outputs), len(outputs)))
+        for preferences in self._evaluate_axioms(
+            lambda axiom: axiom.masked_preferences(input, outputs, mask)
+        ):
+            aggregated_preferences *= preferences
+        return aggregated_preferences
 
     def __mul__(self, other: Axiom[Input, Output]) -> Axiom[Input, Output]:
         # Avoid chaining operators.
-        return ProductAxiom(axioms=[*self.axioms, other])
+        return replace(self, axioms=[*self.axioms, other])
 
 
 @dataclass(frozen=True, kw_only=True)
 class MultiplicativeInverseAxiom(Axiom[Input, Output]):
     axiom: Axiom[Input, Output]
 
+    @property
+    def antisymmetric(self) -> bool:
+        return self.axiom.antisymmetric
+
+    @property
+    def input_dependent(self) -> bool:
+        return self.axiom.input_dependent
+
     def preference(
         self,
         input: Input,
@@ -103,14 +265,42 @@ class MultiplicativeInverseAxiom(Axiom[Input, Output]):
     ) -> PreferenceMatrix:
         return 1 / self.axiom.preferences(input, outputs)
 
+    def masked_preferences(
+        self,
+        input: Input,
+        outputs: Sequence[Output],
+        mask: NDArray[bool_],
+    ) -> PreferenceMatrix:
+        preferences = self.axiom.masked_preferences(input, outputs, mask)
+        return divide(1, preferences, out=zeros(preferences.shape), where=mask)
+
     def __rtruediv__(self, other: Axiom[Input, Output]) -> Axiom[Input, Output]:
         # Avoid chaining operators.
         return self.axiom * other
 
 
 @dataclass(frozen=True, kw_only=True)
-class ConjunctionAxiom(Axiom[Input, Output]):
-    axioms: Iterable[Axiom[Input, Output]]
+class ConjunctionAxiom(_ConcurrentAxiomsMixin[Input, Output]):
+    early_exit: bool = True
+    """
+    Stop evaluating the axioms for pairs for which an axiom already disagreed, and evaluate the cheapest axioms (as measured in previous evaluations) first.
+    Concurrent evaluation takes precedence over early exit.
+    """
+
+    _costs: Dict[int, float] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    @property
+    def antisymmetric(self) -> bool:
+        return all(axiom.antisymmetric for axiom in self.axioms)
+
+    @property
+    def input_dependent(self) -> bool:
+        return any(axiom.input_dependent for axiom in self.axioms)
 
     def preference(
         self,
@@ -118,12 +308,24 @@ class ConjunctionAxiom(Axiom[Input, Output]):
         output1: Output,
         output2: Output,
     ) -> Preference:
+        if self.early_exit:
+            first_sign = None
+            for _, axiom in _cost_ordered(self.axioms, self._costs):
+                preference_sign = sign(axiom.preference(input, output1, output2))
+                if preference_sign == 0:
+                    return 0
+                if first_sign is None:
+                    first_sign = preference_sign
+                elif preference_sign != first_sign:
+                    return 0
+            return 1 if first_sign is None else int(first_sign)
+
         preferences = [
             axiom.preference(input, output1, output2) for axiom in self.axioms
         ]
         if all(preference > 0 for preference in preferences):
             return 1
-        elif all(preference > 0 for preference in preferences):
+        elif all(preference < 0 for preference in preferences):
             return -1
         else:
             return 0
@@ -133,22 +335,60 @@ class ConjunctionAxiom(Axiom[Input, Output]):
         input: Input,
         outputs: Sequence[Output],
     ) -> PreferenceMatrix:
-        preferences = stack(
-            [axiom.preferences(input, outputs) for axiom in self.axioms]
-        )
+        if self.early_exit and not self.concurrent:
+            return self.masked_preferences(
+                input=input,
+                outputs=outputs,
+                mask=ones((len(outputs), len(outputs)), dtype=bool_),
+            )
+
+        all_positive = ones((len(outputs), len(outputs)), dtype=bool_)
+        all_negative = ones((len(outputs), len(outputs)), dtype=bool_)
+        for preferences in self._evaluate_axioms(
+            lambda axiom: axiom.preferences(input, outputs)
+        ):
+            all_positive &= preferences > 0
+            all_negative &= preferences < 0
         aggregated_preferences = zeros((len(outputs), len(outputs)))
-        aggregated_preferences += (preferences > 0).all(axis=0) * 1
-        aggregated_preferences += (preferences < 0).all(axis=0) * -1
+        aggregated_preferences += all_positive * 1
+        aggregated_preferences += all_negative * -1
         return aggregated_preferences
 
+    def masked_preferences(
+        self,
+        input: Input,
+        outputs: Sequence[Output],
+        mask: NDArray[bool_],
+    ) -> PreferenceMatrix:
+        if not self.early_exit or self.concurrent:
+            return super().masked_preferences(input, outputs, mask)
+
+        # Sign of the first evaluated axiom, that all other axioms must agree with.
+        signs = zeros((len(outputs), len(outputs)))
+        # Pairs for which all evaluated axioms agreed so far.
+        undecided = array(mask, dtype=bool_)
+        for position, (index, axiom) in enumerate(
+            _cost_ordered(self.axioms, self._costs)
+        ):
+            if not undecided.any():
+                break
+            preference_signs = sign(
+                _measured_masked_preferences(
+                    axiom, input, outputs, undecided, self._costs, index
+                )
+            )
+            if position == 0:
+                signs = preference_signs
+            undecided &= (preference_signs != 0) & (preference_signs == signs)
+        return where(undecided, signs, 0)
+
     def __and__(self, other: Axiom[Input, Output]) -> Axiom[Input, Output]:
         # Avoid chaining operators.
-        return ConjunctionAxiom(axioms=[*self.axioms, other])
+        return replace(self, axioms=[*self.axioms, other])
 
 
 @dataclass(frozen=True, kw_only=True)
-class VoteAxiom(Axiom[Input, Output]):
-    axioms: Iterable[Axiom[Input, Output]]
+class VoteAxiom(_ConcurrentAxiomsMixin[Input, Output]):
     minimum_votes: float = 0.5
     """
     Minimum portion of votes in favor or against either document,
@@ -156,6 +396,53 @@ class VoteAxiom(Axiom[Input, Output]):
     for example, 0.5 for absolute majority, 0.6 for qualified majority,
     0 for relative majority, or 1 for consensus.
     """
+    early_exit: bool = True
+    """
+    Stop evaluating the axioms for pairs for which the majority is already decided (or can no longer be reached), and evaluate the cheapest axioms (as measured in previous evaluations) first.
+    Concurrent evaluation takes precedence over early exit.
+    """
+
+    _costs: Dict[int, float] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    @property
+    def antisymmetric(self) -> bool:
+        return all(axiom.antisymmetric for axiom in self.axioms)
+
+    @property
+    def input_dependent(self) -> bool:
+        return any(axiom.input_dependent for axiom in self.axioms)
+
+    @staticmethod
+    def _decided(
+        positive_votes: Any,
+        negative_votes: Any,
+        remaining_votes: int,
+        minimum_votes: int,
+    ) -> Any:
+        # A majority is decided if the remaining votes cannot overturn it.
+        positive_decided = (positive_votes > negative_votes + remaining_votes) & (
+            positive_votes >= minimum_votes
+        )
+        negative_decided = (negative_votes > positive_votes + remaining_votes) & (
+            negative_votes >= minimum_votes
+        )
+        # A draw is decided if neither majority can be reached anymore.
+        positive_reachable = (positive_votes + remaining_votes > negative_votes) & (
+            positive_votes + remaining_votes >= minimum_votes
+        )
+        negative_reachable = (negative_votes + remaining_votes > positive_votes) & (
+            negative_votes + remaining_votes >= minimum_votes
+        )
+        return (
+            positive_decided
+            | negative_decided
+            | logical_not(positive_reachable | negative_reachable)
+        )
 
     def preference(
         self,
@@ -163,6 +450,9 @@ class VoteAxiom(Axiom[Input, Output]):
         output1: Output,
         output2: Output,
     ) -> Preference:
+        if self.early_exit:
+            return self._preference_early_exit(input, output1, output2)
+
         preferences = [
             axiom.preference(input, output1, output2) for axiom in self.axioms
         ]
@@ -186,31 +476,63 @@ class VoteAxiom(Axiom[Input, Output]):
             # Draw.
             return 0
 
+    def _preference_early_exit(
+        self,
+        input: Input,
+        output1: Output,
+        output2: Output,
+    ) -> Preference:
+        axioms = _cost_ordered(self.axioms, self._costs)
+        count = len(axioms)
+        minimum_votes = ceil(self.minimum_votes * count)
+        positive_votes = 0
+        negative_votes = 0
+        for evaluated, (_, axiom) in enumerate(axioms, start=1):
+            preference = axiom.preference(input, output1, output2)
+            if preference > 0:
+                positive_votes += 1
+            elif preference < 0:
+                negative_votes += 1
+            if self._decided(
+                positive_votes, negative_votes, count - evaluated, minimum_votes
+            ):
+                break
+
+        if positive_votes > negative_votes and positive_votes >= minimum_votes:
+            return 1
+        elif negative_votes > positive_votes and negative_votes >= minimum_votes:
+            return -1
+        else:
+            # Draw.
+            return 0
+
     def preferences(
         self,
         input: Input,
         outputs: Sequence[Output],
     ) -> PreferenceMatrix:
-        preferences = stack(
-            [
-                axiom.preferences(input, outputs)
-                for axiom in tqdm(
-                    self.axioms,
-                    desc="Compute preferences",
-                )
-            ]
-        )
+        if self.early_exit and not self.concurrent:
+            return self.masked_preferences(
+                input=input,
+                outputs=outputs,
+                mask=ones((len(outputs), len(outputs)), dtype=bool_),
+            )
 
         # Total count of possible votes.
-        count: int = preferences.shape[0]
+        count: int = len(list(self.axioms))
 
         # Minimum (absolute) number of votes to reach a majority.
         minimum_votes: int = ceil(self.minimum_votes * count)
 
-        # Number of observed positive votes.
-        positive_votes = (preferences > 0).sum(axis=0)
-        # Number of observed negative votes.
-        negative_votes = (preferences < 0).sum(axis=0)
+        # Number of observed positive and negative votes.
+        positive_votes = zeros((len(outputs), len(outputs)), dtype=int16)
+        negative_votes = zeros((len(outputs), len(outputs)), dtype=int16)
+        for preferences in self._evaluate_axioms(
+            lambda axiom: axiom.preferences(input, outputs),
+            desc="Compute preferences",
+        ):
+            positive_votes += preferences > 0
+            negative_votes += preferences < 0
 
         mask_positive = (positive_votes > negative_votes) & (
             positive_votes >= minimum_votes
@@ -225,11 +547,62 @@ class VoteAxiom(Axiom[Input, Output]):
 
         return aggregated_preferences
 
+    def masked_preferences(
+        self,
+        input: Input,
+        outputs: Sequence[Output],
+        mask: NDArray[bool_],
+    ) -> PreferenceMatrix:
+        if not self.early_exit or self.concurrent:
+            return super().masked_preferences(input, outputs, mask)
+
+        axioms = _cost_ordered(self.axioms, self._costs)
+
+        # Total count of possible votes.
+        count: int = len(axioms)
+
+        # Minimum (absolute) number of votes to reach a majority.
+        minimum_votes: int = ceil(self.minimum_votes * count)
+
+        # Number of observed positive and negative votes.
+        positive_votes = zeros((len(outputs), len(outputs)), dtype=int16)
+        negative_votes = zeros((len(outputs), len(outputs)), dtype=int16)
+
+        # Pairs for which the majority is not yet decided.
+        undecided = array(mask, dtype=bool_)
+        for evaluated, (index, axiom) in enumerate(
+            tqdm(axioms, desc="Compute preferences"),
+            start=1,
+        ):
+            if not undecided.any():
+                break
+            preferences = _measured_masked_preferences(
+                axiom, input, outputs, undecided, self._costs, index
+            )
+            positive_votes += undecided & (preferences > 0)
+            negative_votes += undecided & (preferences < 0)
+            undecided &= ~self._decided(
+                positive_votes, negative_votes, count - evaluated, minimum_votes
+            )
+
+        mask_positive = (positive_votes > negative_votes) & (
+            positive_votes >= minimum_votes
+        )
+        mask_negative = (negative_votes > positive_votes) & (
+            negative_votes >= minimum_votes
+        )
+
+        aggregated_preferences = zeros((len(outputs), len(outputs)))
+        aggregated_preferences[mask & mask_positive] = 1
+        aggregated_preferences[mask & mask_negative] = -1
+
+        return aggregated_preferences
+
     def __mod__(self, other: Axiom[Input, Output]) -> Axiom[Input, Output]:
         if isclose(self.minimum_votes, 0.5):
             # Avoid chaining operators
             # if this vote has the default minimum vote proportion.
-            return VoteAxiom(axioms=[*self.axioms, other])
+            return replace(self, axioms=[*self.axioms, other])
         else:
             return super().__mod__(other)
 
@@ -242,6 +615,14 @@ class MajorityVoteAxiom(VoteAxiom[Input, Output]):
 class CascadeAxiom(Axiom[Input, Output]):
     axioms: Iterable[Axiom[Input, Output]]
 
+    @property
+    def antisymmetric(self) -> bool:
+        return all(axiom.antisymmetric for axiom in self.axioms)
+
+    @property
+    def input_dependent(self) -> bool:
+        return any(axiom.input_dependent for axiom in self.axioms)
+
     def preference(
         self,
         input: Input,
@@ -256,6 +637,35 @@ class CascadeAxiom(Axiom[Input, Output]):
         )
         return next(decisive_preferences, 0)
 
+    def preferences(
+        self,
+        input: Input,
+        outputs: Sequence[Output],
+    ) -> PreferenceMatrix:
+        return self.masked_preferences(
+            input=input,
+            outputs=outputs,
+            mask=ones((len(outputs), len(outputs)), dtype=bool_),
+        )
+
+    def masked_preferences(
+        self,
+        input: Input,
+        outputs: Sequence[Output],
+        mask: NDArray[bool_],
+    ) -> PreferenceMatrix:
+        preferences = zeros((len(outputs), len(outputs)))
+        undecided = array(mask, dtype=bool_)
+        for axiom in self.axioms:
+            if not undecided.any():
+                break
+            # Only compute the next axiom's preferences where no previous axiom decided.
+            axiom_preferences = axiom.masked_preferences(input, outputs, undecided)
+            decided = undecided & (axiom_preferences != 0)
+            preferences[decided] = axiom_preferences[decided]
+            undecided &= ~decided
+        return preferences
+
     def __or__(self, other: Axiom[Input, Output]) -> Axiom[Input, Output]:
         # Avoid chaining operators.
         return CascadeAxiom(axioms=[*self.axioms, other])
@@ -265,6 +675,14 @@ class CascadeAxiom(Axiom[Input, Output]):
 class NormalizedAxiom(Axiom[Input, Output]):
     axiom: Axiom[Input, Output]
 
+    @property
+    def antisymmetric(self) -> bool:
+        return self.axiom.antisymmetric
+
+    @property
+    def input_dependent(self) -> bool:
+        return self.axiom.input_dependent
+
     def preference(
         self,
         input: Input,
@@ -289,6 +707,17 @@ class NormalizedAxiom(Axiom[Input, Output]):
         preferences[preferences < 0] = -1
         return preferences
 
+    def masked_preferences(
+        self,
+        input: Input,
+        outputs: Sequence[Output],
+        mask: NDArray[bool_],
+    ) -> PreferenceMatrix:
+        preferences = self.axiom.masked_preferences(input, outputs, mask)
+        preferences[preferences > 0] = 1
+        preferences[preferences < 0] = -1
+        return preferences
+
     def __pos__(self) -> Axiom[Input, Output]:
         # This axiom is already normalized.
         return self
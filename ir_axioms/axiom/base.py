@@ -1,13 +1,18 @@
 from abc import ABC, abstractmethod
+from asyncio import gather
 from pathlib import Path
 from typing import Generic, Literal, Sequence, Optional, final
 
-from numpy import float_, array
+from numpy import asarray, bool_, float_, array, nonzero, triu, where, zeros
+from numpy.typing import NDArray
 from tqdm.auto import tqdm
 
 from ir_axioms.model import Input, Output, Preference, PreferenceMatrix
+from ir_axioms.tools.analysis import analysis_session
 from ir_axioms.tools.pivot import PivotSelection, RandomPivotSelection
 from ir_axioms.precondition.base import Precondition
+from ir_axioms.utils.concurrency import run_blocking
+from ir_axioms.utils.matrix import antisymmetric_matrix, upper_triangle_indices
 
 
 class Axiom(ABC, Generic[Input, Output]):
@@ -15,6 +20,8 @@ class Axiom(ABC, Generic[Input, Output]):
     An axiom describes a pairwise constraint between two outputs given the same input, as expressed as a preference.
 
     Subclasses must implement the ``preference()`` method that determines the pairwise preference between two outputs, and can optionally also override ``preference_matrix()`` to batch-compute a full preference matrix of arbitrarily many outputs more efficiently.
+    Combinators can additionally override ``masked_preferences()`` to only evaluate their child axioms where needed.
+    Subclasses whose preferences are guaranteed to be antisymmetric should also override ``antisymmetric`` so that only half of the pairwise preferences need to be computed.
 
     This base class also exposes various operators (i.e., ``+``, ``-``, ``*``, ``/``, ``%``, ``&``, ``~``) for combining and manipulating axioms, as well as ``rerank()`` for KwikSort re-ranking the outputs, and other methods for evaluating rankings of outputs in comparison to the axiom's preferences.
     """
@@ -41,6 +48,26 @@ class Axiom(ABC, Generic[Input, Output]):
         """
         pass
 
+    @property
+    def antisymmetric(self) -> bool:
+        """
+        Whether this axiom's preferences are guaranteed to be antisymmetric, i.e., ``preference(input, output1, output2) == -preference(input, output2, output1)`` for all outputs.
+
+        If so, a preference matrix can be computed from only the pairs above the diagonal.
+        Because some axioms (e.g., ``UniformAxiom``) deliberately violate this property, it defaults to ``False``.
+        """
+        return False
+
+    @property
+    def input_dependent(self) -> bool:
+        """
+        Whether this axiom's preferences may depend on the input, e.g., on the query.
+
+        Axioms that only compare the outputs themselves (e.g., their readability or length) should override this to return ``False``, so that caches can share their preferences across all inputs.
+        To be safe, it defaults to ``True``.
+        """
+        return True
+
     def preferences(
         self,
         input: Input,
@@ -49,12 +76,31 @@ class Axiom(ABC, Generic[Input, Output]):
         """
         Batch-compute the preferences for a sequence of potential outputs.
         While the naive default implementation just delegates to `preference()`, it might make sense to override it to avoid computating certain costly features again and again for the same output.
+        For antisymmetric axioms, the default implementation only computes the preferences above the diagonal and mirrors them.
 
         :param input: Common input for all outputs.
         :param outputs: The outputs for the common input.
         :return: A preference matrix, where the ij-th entry corresponds to the preference between the i-th and j-th output.
         """
 
+        if self.antisymmetric:
+            rows, columns = upper_triangle_indices(len(outputs))
+            return antisymmetric_matrix(
+                len(outputs),
+                [
+                    self.preference(
+                        input=input,
+                        output1=outputs[i1],
+                        output2=outputs[i2],
+                    )
+                    for i1, i2 in tqdm(
+                        zip(rows, columns),
+                        desc="Preferences",
+                        total=len(rows),
+                    )
+                ],
+            )
+
         return array(
             list(
                 tqdm(
@@ -74,6 +120,122 @@ class Axiom(ABC, Generic[Input, Output]):
             dtype=float_,
         ).reshape((len(outputs), len(outputs)))
 
+    def masked_preferences(
+        self,
+        input: Input,
+        outputs: Sequence[Output],
+        mask: NDArray[bool_],
+    ) -> PreferenceMatrix:
+        """
+        Batch-compute the preferences for a sequence of potential outputs, but only where the mask is ``True``.
+        Combinators use the mask to skip pairs whose preference is already known, e.g., ``CascadeAxiom`` only evaluates the next axiom on the pairs that are still undecided.
+
+        By default, axioms that override ``preferences()`` compute the full preference matrix in batch (which is typically cheaper than computing fewer preferences individually), while other axioms only compute the masked preferences with ``preference()``.
+
+        :param input: Common input for all outputs.
+        :param outputs: The outputs for the common input.
+        :param mask: A boolean matrix, where the ij-th entry determines whether to compute the preference between the i-th and j-th output.
+        :return: A preference matrix, where the ij-th entry corresponds to the preference between the i-th and j-th output, or zero if the entry is not masked.
+        """
+        mask = asarray(mask, dtype=bool_)
+        if mask.shape != (len(outputs), len(outputs)):
+            raise ValueError(
+                f"Mask of shape {mask.shape} does not match {len(outputs)} outputs."
+            )
+        if not mask.any():
+            return zeros(mask.shape, dtype=float_)
+
+        if type(self).preferences is not Axiom.preferences:
+            return where(mask, self.preferences(input, outputs), 0)
+
+        preferences = zeros(mask.shape, dtype=float_)
+        if self.antisymmetric:
+            # Compute each unordered pair once and mirror it.
+            rows, columns = nonzero(triu(mask | mask.T, k=1))
+        else:
+            rows, columns = nonzero(mask)
+        values = array(
+            [
+                self.preference(
+                    input=input,
+                    output1=outputs[i1],
+                    output2=outputs[i2],
+                )
+                for i1, i2 in tqdm(
+                    zip(rows, columns),
+                    desc="Preferences",
+                    total=len(rows),
+                )
+            ],
+            dtype=float_,
+        )
+        preferences[rows, columns] = values
+        if self.antisymmetric:
+            preferences[columns, rows] = -values
+            preferences[~mask] = 0
+        return preferences
+
+    async def apreference(
+        self,
+        input: Input,
+        output1: Output,
+        output2: Output,
+    ) -> Preference:
+        """
+        Asynchronously compute the pairwise preference between two outputs for the same input (see ``preference()``).
+
+        By default, ``preference()`` is run in a worker thread, such that axioms waiting on I/O (e.g., on remote services) can overlap.
+        Axioms with natively asynchronous tools can override this method.
+        Use ``concurrency_limit()`` from ``ir_axioms.utils.concurrency`` to bound the number of concurrent blocking calls.
+
+        :param input: Common input for both outputs.
+        :param output1: One output for the common input.
+        :param output2: Another output for the common input.
+        :return: >0 if ``output1`` should be preferred,
+        <0 if ``output2`` should be preferred,
+        or 0 if neither of the outputs should be preferred over the other.
+        """
+        return await run_blocking(self.preference, input, output1, output2)
+
+    async def apreferences(
+        self,
+        input: Input,
+        outputs: Sequence[Output],
+    ) -> PreferenceMatrix:
+        """
+        Asynchronously batch-compute the preferences for a sequence of potential outputs (see ``preferences()``).
+        Awaiting the preferences of many inputs concurrently (e.g., with ``asyncio.gather()``) overlaps their I/O as well.
+
+        By default, axioms that override ``preferences()`` run it in a worker thread, while other axioms compute all pairwise preferences concurrently with ``apreference()``.
+
+        :param input: Common input for all outputs.
+        :param outputs: The outputs for the common input.
+        :return: A preference matrix, where the ij-th entry corresponds to the preference between the i-th and j-th output.
+        """
+        if type(self).preferences is not Axiom.preferences:
+            return await run_blocking(self.preferences, input, outputs)
+
+        if self.antisymmetric:
+            rows, columns = upper_triangle_indices(len(outputs))
+            return antisymmetric_matrix(
+                len(outputs),
+                await gather(
+                    *(
+                        self.apreference(input, outputs[i1], outputs[i2])
+                        for i1, i2 in zip(rows, columns)
+                    )
+                ),
+            )
+
+        values = await gather(
+            *(
+                self.apreference(input, output1, output2)
+                for output1 in outputs
+                for output2 in outputs
+            )
+        )
+        return array(values, dtype=float_).reshape((len(outputs), len(outputs)))
+
     def __add__(self, other: "Axiom[Input, Output]") -> "Axiom[Input, Output]":
         from ir_axioms.axiom.arithmetic import SumAxiom
 
@@ -154,15 +316,20 @@ class Axiom(ABC, Generic[Input, Output]):
         """
         return +self
 
-    def cached(self, cache_path: Path) -> "Axiom[Input, Output]":
+    def cached(
+        self,
+        cache_path: Path,
+        backend: Literal["dbm", "sqlite"] = "dbm",
+    ) -> "Axiom[Input, Output]":
         """
         Cache this axiom's preferences in the given cache path,
         meaning the ``preference()`` method will only be called once
         for each query-documents tuple.
+        Use the ``"sqlite"`` backend to share the cache between parallel worker processes.
         """
         from ir_axioms.axiom.cache import CachedAxiom
 
-        return CachedAxiom(axiom=self, cache_path=cache_path)
+        return CachedAxiom(axiom=self, cache_path=cache_path, backend=backend)
 
     def parallel(self, n_jobs: Optional[int] = None) -> "Axiom[Input, Output]":
         """
@@ -194,10 +361,11 @@ class Axiom(ABC, Generic[Input, Output]):
     ) -> Sequence[Output]:
         from ir_axioms.algorithms.ranking import kwiksort
 
-        ranking = kwiksort(
-            axiom=self,
-            input=input,
-            vertices=ranking,
-            pivot_selection=pivot_selection,
-        )
+        with analysis_session():
+            ranking = kwiksort(
+                axiom=self,
+                input=input,
+                vertices=ranking,
+                pivot_selection=pivot_selection,
+            )
         return ranking
@@ -1,14 +1,58 @@
-from dataclasses import dataclass
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from dbm import open as dbm_open
+from functools import cached_property
+from hashlib import blake2b
+from os import getpid
 from pathlib import Path
-from struct import pack, unpack
-from typing import Iterable, Iterator, Protocol, Sequence, Tuple, TypeVar
+from sqlite3 import Connection, connect
+from struct import Struct, pack, unpack
+from threading import Lock, RLock
+from time import time
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from weakref import WeakValueDictionary, finalize
+from zlib import compress, decompress
 
-from numpy import array, float_, ndarray, isnan, nan
+from numpy import (
+    array,
+    float_,
+    float32,
+    frombuffer,
+    full,
+    indices,
+    int8,
+    isnan,
+    ix_,
+    nan,
+    ndarray,
+    nonzero,
+    where,
+)
+from numpy.typing import NDArray
 from typing_extensions import TypeAlias  # type: ignore
 
 from ir_axioms.axiom.base import Axiom
+from ir_axioms.axiom.score import ScoreAxiom
 from ir_axioms.model import Preference, PreferenceMatrix
+from ir_axioms.utils.fingerprint import fingerprint
+from ir_axioms.utils.matrix import antisymmetric_matrix, upper_triangle_indices
 
 
 class SupportsRepr(Protocol):
@@ -18,36 +62,1014 @@ class SupportsRepr(Protocol):
 _Input = TypeVar("_Input", bound=SupportsRepr)
 _Output = TypeVar("_Output", bound=SupportsRepr)
 
+_NAMESPACE_SIZE = 8
+_INPUT_DIGEST_SIZE = 8
+_IDENTITY_SIZE = 16
+_KEY_SIZE = _NAMESPACE_SIZE + _INPUT_DIGEST_SIZE + _IDENTITY_SIZE
+_DESCRIPTION_KEY_PREFIX = b"axiom:"
+# Entries of input-independent axioms are shared by all inputs.
+_ANY_INPUT_DIGEST = bytes(_INPUT_DIGEST_SIZE)
+_ANY_INPUT_IDENTITY = bytes(_IDENTITY_SIZE)
+
+
+def input_digest(input_id: Any) -> bytes:
+    """
+    Digest of an input's ID that cache keys start with, after the axiom's namespace.
+    Inputs without an ID are digested by their representation.
+
+    :param input_id: The input's ID, e.g., a query ID.
+    :return: The input digest.
+    """
+    return blake2b(
+        repr(input_id).encode(encoding="utf-8"),
+        digest_size=_INPUT_DIGEST_SIZE,
+    ).digest()
+
+
+class PreferenceCacheEntry(NamedTuple):
+    """
+    Raw entry of a preference cache, e.g., to export or import the cache.
+    """
+
+    key: bytes
+    value: bytes
+    created: int
+    """
+    Time when the entry was written, in seconds since the epoch.
+    """
+
+
+class PreferenceCache(ABC):
+    """
+    Persistent key-value store of cached preferences.
+    """
+
+    @abstractmethod
+    def get_many(self, keys: Sequence[bytes]) -> Sequence[Optional[Preference]]:
+        """
+        Look up many preferences at once.
+
+        :param keys: Keys of the preferences.
+        :return: The cached preferences, in the same order, or ``None`` for keys that are not cached.
+        """
+        pass
+
+    @abstractmethod
+    def set_many(self, preferences: Mapping[bytes, Preference]) -> None:
+        """
+        Store many preferences at once. Writes may be buffered until ``flush()``.
+
+        :param preferences: Preferences by their keys.
+        """
+        pass
+
+    @abstractmethod
+    def get_blob(self, key: bytes) -> Optional[bytes]:
+        """
+        Look up a binary value, e.g., a whole preference matrix.
+
+        :param key: Key of the value.
+        :return: The cached value, or ``None`` if the key is not cached.
+        """
+        pass
+
+    def get_blobs(self, keys: Sequence[bytes]) -> Sequence[Optional[bytes]]:
+        """
+        Look up many binary values at once, e.g., the cached scores of many outputs.
+
+        :param keys: Keys of the values.
+        :return: The cached values, in the same order, or ``None`` for keys that are not cached.
+        """
+        return [self.get_blob(key) for key in keys]
+
+    @abstractmethod
+    def set_blob(self, key: bytes, value: bytes) -> None:
+        """
+        Store a binary value. Writes may be buffered until ``flush()``.
+
+        :param key: Key of the value.
+        :param value: The value to store.
+        """
+        pass
+
+    @abstractmethod
+    def entries(self) -> Iterator[PreferenceCacheEntry]:
+        """
+        Iterate over all raw entries of the cache, including buffered entries.
+        """
+        pass
+
+    @abstractmethod
+    def set_entries(self, entries: Iterable[PreferenceCacheEntry]) -> int:
+        """
+        Store raw entries, e.g., from another cache, and keep their creation time.
+        Existing entries are only replaced by newer entries.
+
+        :param entries: The entries to store.
+        :return: Number of stored entries.
+        """
+        pass
+
+    @abstractmethod
+    def delete_many(self, keys: Iterable[bytes]) -> int:
+        """
+        Delete many entries at once.
+
+        :param keys: Keys of the entries to delete.
+        :return: Number of deleted entries.
+        """
+        pass
+
+    def compact(self) -> None:
+        """
+        Reclaim the space of deleted or replaced entries.
+        """
+        pass
+
+    def flush(self) -> None:
+        """
+        Write all buffered preferences.
+        """
+        pass
+
+    def close(self) -> None:
+        """
+        Write all buffered preferences and close the cache.
+        """
+        self.flush()
+
+    def __enter__(self) -> "PreferenceCache":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+_TIMESTAMP = Struct("<I")
+
+
+def _timestamp() -> int:
+    return int(time())
+
+
+def _close_dbm(database: Any, buffer: Dict[bytes, bytes]) -> None:
+    for key, value in buffer.items():
+        database[key] = value
+    buffer.clear()
+    database.close()
+
+
+# Files of the different DBM implementations, relative to the database path.
+_DBM_SUFFIXES = ("", ".db", ".dat", ".dir", ".bak", ".pag")
+
+_open_dbm_caches: "WeakValueDictionary[Path, DbmPreferenceCache]" = (
+    WeakValueDictionary()
+)
+_open_dbm_caches_lock = Lock()
+
+
+class DbmPreferenceCache(PreferenceCache):
+    """
+    Preference cache in a DBM database that is kept open until it is closed or no longer referenced.
+
+    Preferences are stored as 32-bit floats, together with the time they were written.
+    New preferences are buffered in memory and written in batches.
+    As DBM databases do not support concurrent writers, use ``open()`` to share one open database per path within a process.
+    """
+
+    path: Path
+    batch_size: int
+    _database: Any
+    _buffer: Dict[bytes, bytes]
+    _lock: RLock
+    _finalizer: finalize
+
+    def __init__(self, path: Path, batch_size: int = 10_000) -> None:
+        """
+        :param path: Path of the DBM database.
+        :param batch_size: Number of preferences to buffer before writing them to the database.
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self._buffer = {}
+        self._lock = RLock()
+        self._open()
+
+    def _open(self) -> None:
+        self.path.parent.mkdir(exist_ok=True, parents=True)
+        self._database = dbm_open(self.path, flag="c")
+        # Write buffered preferences even if the cache is never closed explicitly.
+        self._finalizer = finalize(self, _close_dbm, self._database, self._buffer)
+
+    @classmethod
+    def open(cls, path: Path, batch_size: int = 10_000) -> "DbmPreferenceCache":
+        """
+        Open the DBM database at the given path, or return the already open database at that path.
+
+        :param path: Path of the DBM database.
+        :param batch_size: Number of preferences to buffer before writing them to the database, if the database is not yet open.
+        :return: The open preference cache.
+        """
+        key = path.absolute()
+        with _open_dbm_caches_lock:
+            cache = _open_dbm_caches.get(key)
+            if cache is None or cache.closed:
+                cache = cls(path=path, batch_size=batch_size)
+                _open_dbm_caches[key] = cache
+            return cache
+
+    @property
+    def closed(self) -> bool:
+        return not self._finalizer.alive
+
+    def _get_value(self, key: bytes) -> Optional[bytes]:
+        value = self._buffer.get(key)
+        if value is None:
+            value = self._database.get(key)
+        if value is None:
+            return None
+        return value[_TIMESTAMP.size :]
+
+    def _set_values(self, values: Mapping[bytes, bytes]) -> None:
+        timestamp = _TIMESTAMP.pack(_timestamp())
+        for key, value in values.items():
+            self._buffer[key] = timestamp + value
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def get_many(self, keys: Sequence[bytes]) -> Sequence[Optional[Preference]]:
+        preferences: List[Optional[Preference]] = []
+        with self._lock:
+            for key in keys:
+                value = self._get_value(key)
+                if value is None:
+                    preferences.append(None)
+                else:
+                    (preference,) = unpack("f", value)
+                    preferences.append(preference)
+        return preferences
+
+    def set_many(self, preferences: Mapping[bytes, Preference]) -> None:
+        with self._lock:
+            self._set_values(
+                {key: pack("f", preference) for key, preference in preferences.items()}
+            )
+
+    def get_blob(self, key: bytes) -> Optional[bytes]:
+        with self._lock:
+            return self._get_value(key)
+
+    def get_blobs(self, keys: Sequence[bytes]) -> Sequence[Optional[bytes]]:
+        with self._lock:
+            return [self._get_value(key) for key in keys]
+
+    def set_blob(self, key: bytes, value: bytes) -> None:
+        with self._lock:
+            self._set_values({key: value})
+
+    def entries(self) -> Iterator[PreferenceCacheEntry]:
+        with self._lock:
+            self.flush()
+            keys = list(self._database.keys())
+        for key in keys:
+            with self._lock:
+                value = self._database.get(key)
+            if value is None or len(value) < _TIMESTAMP.size:
+                # Skip deleted or invalid entries.
+                continue
+            (created,) = _TIMESTAMP.unpack_from(value)
+            yield PreferenceCacheEntry(
+                key=key,
+                value=value[_TIMESTAMP.size :],
+                created=created,
+            )
+
+    def set_entries(self, entries: Iterable[PreferenceCacheEntry]) -> int:
+        count = 0
+        with self._lock:
+            for entry in entries:
+                existing = self._buffer.get(entry.key)
+                if existing is None:
+                    existing = self._database.get(entry.key)
+                if (
+                    existing is not None
+                    and len(existing) >= _TIMESTAMP.size
+                    and _TIMESTAMP.unpack_from(existing)[0] >= entry.created
+                ):
+                    continue
+                self._buffer[entry.key] = _TIMESTAMP.pack(entry.created) + entry.value
+                count += 1
+                if len(self._buffer) >= self.batch_size:
+                    self.flush()
+            self.flush()
+        return count
+
+    def delete_many(self, keys: Iterable[bytes]) -> int:
+        count = 0
+        with self._lock:
+            self.flush()
+            for key in keys:
+                if key in self._database:
+                    del self._database[key]
+                    count += 1
+            self.flush()
+        return count
+
+    def compact(self) -> None:
+        with self._lock:
+            self.flush()
+            if hasattr(self._database, "reorganize"):
+                self._database.reorganize()
+                return
+
+            # Copy all entries into a new database and replace the old database.
+            compact_path = self.path.with_name(f"{self.path.name}.compact")
+            with dbm_open(compact_path, flag="n") as compact_database:
+                for key in self._database.keys():
+                    compact_database[key] = self._database[key]
+            self._finalizer()
+            for suffix in _DBM_SUFFIXES:
+                file = self.path.with_name(self.path.name + suffix)
+                compact_file = compact_path.with_name(compact_path.name + suffix)
+                if compact_file.exists():
+                    compact_file.replace(file)
+                elif file.exists():
+                    file.unlink()
+            self._open()
+
+    def flush(self) -> None:
+        with self._lock:
+            for key, value in self._buffer.items():
+                self._database[key] = value
+            self._buffer.clear()
+            if hasattr(self._database, "sync"):
+                self._database.sync()
+
+    def close(self) -> None:
+        with self._lock:
+            self._finalizer()
+
+
+def _write_sqlite(
+    connection: Connection, buffer: Dict[bytes, Tuple[bytes, int]]
+) -> None:
+    with connection:
+        # Commit the whole batch in a single transaction.
+        connection.execute("BEGIN IMMEDIATE")
+        connection.executemany(
+            "INSERT OR REPLACE INTO entries (key, value, created) VALUES (?, ?, ?)",
+            ((key, value, created) for key, (value, created) in buffer.items()),
+        )
+    buffer.clear()
+
+
+def _close_sqlite(
+    connections: Dict[int, Connection],
+    pid: int,
+    buffer: Dict[bytes, Tuple[bytes, int]],
+) -> None:
+    connection = connections.pop(pid, None)
+    if connection is None:
+        return
+    if len(buffer) > 0:
+        _write_sqlite(connection, buffer)
+    connection.close()
+
+
+_SQLITE_MAX_VARIABLES = 500
+
+
+class SqlitePreferenceCache(PreferenceCache):
+    """
+    Preference cache in an SQLite database in write-ahead logging (WAL) mode.
+
+    Many processes (e.g., parallel workers) can read and write the same database concurrently: Readers never block, and writers only briefly wait for each other while committing a batch.
+    Each process opens its own connection, so the cache can be passed to worker processes.
+    """
+
+    path: Path
+    batch_size: int
+    timeout: float
+    _connections: Dict[int, Connection]
+    _buffer: Dict[bytes, Tuple[bytes, int]]
+    _lock: RLock
+    _finalizer: Optional[finalize]
+
+    def __init__(
+        self,
+        path: Path,
+        batch_size: int = 10_000,
+        timeout: float = 60,
+    ) -> None:
+        """
+        :param path: Path of the SQLite database.
+        :param batch_size: Number of preferences to buffer before writing them to the database in a single transaction.
+        :param timeout: Seconds to wait for other processes to finish writing.
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self._connections = {}
+        self._buffer = {}
+        self._lock = RLock()
+        self._finalizer = None
+
+    @property
+    def _connection(self) -> Connection:
+        # Connections must not be shared with forked processes.
+        pid = getpid()
+        connection = self._connections.get(pid)
+        if connection is not None:
+            return connection
+
+        if self._finalizer is not None:
+            # Buffered preferences are written by the process that buffered them.
+            self._finalizer.detach()
+            self._connections.clear()
+            self._buffer.clear()
+        self.path.parent.mkdir(exist_ok=True, parents=True)
+        connection = connect(
+            self.path,
+            timeout=self.timeout,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries "
+            "(key BLOB PRIMARY KEY, value BLOB NOT NULL, created INTEGER NOT NULL) "
+            "WITHOUT ROWID"
+        )
+        self._connections[pid] = connection
+        # Write buffered preferences even if the cache is never closed explicitly.
+        self._finalizer = finalize(
+            self, _close_sqlite, self._connections, pid, self._buffer
+        )
+        return connection
+
+    def _get_values(self, keys: Sequence[bytes]) -> Sequence[Optional[bytes]]:
+        with self._lock:
+            values: Dict[bytes, bytes] = {}
+            missing_keys = [
+                key for key in dict.fromkeys(keys) if key not in self._buffer
+            ]
+            connection = self._connection
+            for start in range(0, len(missing_keys), _SQLITE_MAX_VARIABLES):
+                chunk = missing_keys[start : start + _SQLITE_MAX_VARIABLES]
+                values.update(
+                    connection.execute(
+                        "SELECT key, value FROM entries WHERE key IN "
+                        f"({', '.join('?' * len(chunk))})",
+                        chunk,
+                    ).fetchall()
+                )
+            return [
+                self._buffer[key][0] if key in self._buffer else values.get(key)
+                for key in keys
+            ]
+
+    def _set_values(self, values: Mapping[bytes, bytes]) -> None:
+        with self._lock:
+            created = _timestamp()
+            for key, value in values.items():
+                self._buffer[key] = (value, created)
+            if len(self._buffer) >= self.batch_size:
+                self.flush()
+
+    def get_many(self, keys: Sequence[bytes]) -> Sequence[Optional[Preference]]:
+        return [
+            None if value is None else unpack("f", value)[0]
+            for value in self._get_values(keys)
+        ]
+
+    def set_many(self, preferences: Mapping[bytes, Preference]) -> None:
+        self._set_values(
+            {key: pack("f", preference) for key, preference in preferences.items()}
+        )
+
+    def get_blob(self, key: bytes) -> Optional[bytes]:
+        (value,) = self._get_values([key])
+        return value
+
+    def get_blobs(self, keys: Sequence[bytes]) -> Sequence[Optional[bytes]]:
+        return self._get_values(keys)
+
+    def set_blob(self, key: bytes, value: bytes) -> None:
+        self._set_values({key: value})
+
+    def entries(self) -> Iterator[PreferenceCacheEntry]:
+        with self._lock:
+            self.flush()
+            cursor = self._connection.execute("SELECT key, value, created FROM entries")
+        for key, value, created in cursor:
+            yield PreferenceCacheEntry(key=key, value=value, created=created)
+
+    def set_entries(self, entries: Iterable[PreferenceCacheEntry]) -> int:
+        with self._lock:
+            self.flush()
+            connection = self._connection
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                changes = connection.total_changes
+                connection.executemany(
+                    "INSERT INTO entries (key, value, created) VALUES (?, ?, ?) "
+                    "ON CONFLICT (key) DO UPDATE "
+                    "SET value = excluded.value, created = excluded.created "
+                    "WHERE excluded.created > entries.created",
+                    ((entry.key, entry.value, entry.created) for entry in entries),
+                )
+                return connection.total_changes - changes
+
+    def delete_many(self, keys: Iterable[bytes]) -> int:
+        with self._lock:
+            self.flush()
+            connection = self._connection
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                changes = connection.total_changes
+                connection.executemany(
+                    "DELETE FROM entries WHERE key = ?",
+                    ((key,) for key in keys),
+                )
+                return connection.total_changes - changes
+
+    def compact(self) -> None:
+        with self._lock:
+            self.flush()
+            connection = self._connection
+            connection.execute("VACUUM")
+            connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def flush(self) -> None:
+        with self._lock:
+            if len(self._buffer) == 0:
+                return
+            _write_sqlite(self._connection, self._buffer)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._finalizer is not None:
+                self._finalizer()
+
+
+@dataclass(kw_only=True)
+class PreferenceCacheStatistics:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        if total == 0:
+            return 0
+        return self.hits / total
+
+
+_CacheValue = Union[Preference, bytes]
+
+
+def _value_size(key: bytes, value: _CacheValue) -> int:
+    if isinstance(value, bytes):
+        return len(key) + len(value)
+    return len(key) + 8
+
+
+def _write_back(
+    cache: PreferenceCache,
+    entries: "OrderedDict[bytes, _CacheValue]",
+    dirty_keys: Set[bytes],
+) -> None:
+    preferences: Dict[bytes, Preference] = {}
+    for key in dirty_keys:
+        value = entries[key]
+        if isinstance(value, bytes):
+            cache.set_blob(key, value)
+        else:
+            preferences[key] = value
+    if len(preferences) > 0:
+        cache.set_many(preferences)
+    dirty_keys.clear()
+    cache.flush()
+
+
+class LruPreferenceCache(PreferenceCache):
+    """
+    Bounded in-memory LRU cache in front of a persistent preference cache.
+
+    With the ``"write-through"`` policy, new preferences are immediately passed on to the persistent cache.
+    With the ``"write-back"`` policy, new preferences are only passed on when they are evicted from memory or when the cache is flushed.
+    """
+
+    cache: PreferenceCache
+    max_entries: Optional[int]
+    max_bytes: Optional[int]
+    policy: Literal["write-through", "write-back"]
+    statistics: PreferenceCacheStatistics
+    _entries: "OrderedDict[bytes, _CacheValue]"
+    _dirty_keys: Set[bytes]
+    _size: int
+    _lock: RLock
+    _finalizer: finalize
+
+    def __init__(
+        self,
+        cache: PreferenceCache,
+        max_entries: Optional[int] = 100_000,
+        max_bytes: Optional[int] = None,
+        policy: Literal["write-through", "write-back"] = "write-through",
+        statistics: Optional[PreferenceCacheStatistics] = None,
+    ) -> None:
+        """
+        :param cache: Persistent preference cache to read from and write to.
+        :param max_entries: Maximum number of entries kept in memory, or ``None`` for no limit.
+        :param max_bytes: Maximum (approximate) number of bytes kept in memory, or ``None`` for no limit.
+        :param policy: Whether to write new preferences to the persistent cache immediately, or only on eviction or flush.
+        :param statistics: Statistics to count hits, misses, and evictions in.
+        """
+        self.cache = cache
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.statistics = (
+            statistics if statistics is not None else PreferenceCacheStatistics()
+        )
+        self._entries = OrderedDict()
+        self._dirty_keys = set()
+        self._size = 0
+        self._lock = RLock()
+        # Write back dirty entries even if the cache is never flushed explicitly.
+        self._finalizer = finalize(
+            self, _write_back, cache, self._entries, self._dirty_keys
+        )
+
+    def _remember(self, key: bytes, value: _CacheValue, dirty: bool) -> None:
+        if key in self._entries:
+            self._size -= _value_size(key, self._entries[key])
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        self._size += _value_size(key, value)
+        if dirty:
+            self._dirty_keys.add(key)
+        self._evict()
+
+    def _evict(self) -> None:
+        evicted_preferences: Dict[bytes, Preference] = {}
+        while len(self._entries) > 0 and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._size > self.max_bytes)
+        ):
+            key, value = self._entries.popitem(last=False)
+            self._size -= _value_size(key, value)
+            self.statistics.evictions += 1
+            if key in self._dirty_keys:
+                self._dirty_keys.remove(key)
+                if isinstance(value, bytes):
+                    self.cache.set_blob(key, value)
+                else:
+                    evicted_preferences[key] = value
+        if len(evicted_preferences) > 0:
+            self.cache.set_many(evicted_preferences)
+
+    def _lookup(self, key: bytes) -> Optional[_CacheValue]:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def get_many(self, keys: Sequence[bytes]) -> Sequence[Optional[Preference]]:
+        with self._lock:
+            preferences: List[Optional[Preference]] = []
+            missing_indices: List[int] = []
+            for index, key in enumerate(keys):
+                value = self._lookup(key)
+                if value is None or isinstance(value, bytes):
+                    preferences.append(None)
+                    missing_indices.append(index)
+                else:
+                    preferences.append(value)
+            self.statistics.memory_hits += len(keys) - len(missing_indices)
+            if len(missing_indices) == 0:
+                return preferences
+
+            cached_preferences = self.cache.get_many(
+                [keys[index] for index in missing_indices]
+            )
+            for index, preference in zip(missing_indices, cached_preferences):
+                if preference is None:
+                    self.statistics.misses += 1
+                else:
+                    self.statistics.disk_hits += 1
+                    preferences[index] = preference
+                    self._remember(keys[index], preference, dirty=False)
+            return preferences
+
+    def set_many(self, preferences: Mapping[bytes, Preference]) -> None:
+        with self._lock:
+            write_back = self.policy == "write-back"
+            for key, preference in preferences.items():
+                self._remember(key, preference, dirty=write_back)
+            if not write_back:
+                self.cache.set_many(preferences)
+
+    def get_blob(self, key: bytes) -> Optional[bytes]:
+        with self._lock:
+            value = self._lookup(key)
+            if isinstance(value, bytes):
+                self.statistics.memory_hits += 1
+                return value
+            value = self.cache.get_blob(key)
+            if value is None:
+                self.statistics.misses += 1
+            else:
+                self.statistics.disk_hits += 1
+                self._remember(key, value, dirty=False)
+            return value
+
+    def get_blobs(self, keys: Sequence[bytes]) -> Sequence[Optional[bytes]]:
+        with self._lock:
+            values: List[Optional[bytes]] = []
+            missing_indices: List[int] = []
+            for index, key in enumerate(keys):
+                value = self._lookup(key)
+                if isinstance(value, bytes):
+                    values.append(value)
+                else:
+                    values.append(None)
+                    missing_indices.append(index)
+            self.statistics.memory_hits += len(keys) - len(missing_indices)
+            if len(missing_indices) == 0:
+                return values
+
+            cached_values = self.cache.get_blobs(
+                [keys[index] for index in missing_indices]
+            )
+            for index, value in zip(missing_indices, cached_values):
+                if value is None:
+                    self.statistics.misses += 1
+                else:
+                    self.statistics.disk_hits += 1
+                    values[index] = value
+                    self._remember(keys[index], value, dirty=False)
+            return values
+
+    def set_blob(self, key: bytes, value: bytes) -> None:
+        with self._lock:
+            write_back = self.policy == "write-back"
+            self._remember(key, value, dirty=write_back)
+            if not write_back:
+                self.cache.set_blob(key, value)
+
+    def entries(self) -> Iterator[PreferenceCacheEntry]:
+        self.flush()
+        return self.cache.entries()
+
+    def set_entries(self, entries: Iterable[PreferenceCacheEntry]) -> int:
+        with self._lock:
+            self.flush()
+            # Entries in memory might be outdated.
+            self._entries.clear()
+            self._size = 0
+            return self.cache.set_entries(entries)
+
+    def delete_many(self, keys: Iterable[bytes]) -> int:
+        with self._lock:
+            self.flush()
+            keys = list(keys)
+            for key in keys:
+                value = self._entries.pop(key, None)
+                if value is not None:
+                    self._size -= _value_size(key, value)
+            return self.cache.delete_many(keys)
+
+    def compact(self) -> None:
+        with self._lock:
+            self.flush()
+            self.cache.compact()
+
+    def flush(self) -> None:
+        with self._lock:
+            _write_back(self.cache, self._entries, self._dirty_keys)
+
+    def close(self) -> None:
+        with self._lock:
+            self._finalizer()
+
 
 @dataclass(frozen=True, kw_only=True)
 class DbmCachedAxiom(Axiom[_Input, _Output]):
+    """
+    Axiom that caches the wrapped axiom's preferences in a DBM database, or in an SQLite database that can be shared by parallel worker processes.
+
+    The cache file is kept open while the axiom is in use, and newly computed preferences are written in batches.
+    Use the axiom as a context manager, or call ``close()``, to write all remaining preferences.
+    Cache keys are compact digests of the input's and outputs' identities, namespaced by a fingerprint of the wrapped axiom's class and configuration, such that different axioms can safely share the same cache.
+    Keys start with the namespace and a digest of the input's ID, such that the entries of an axiom or an input can be summarized or pruned (see ``ir_axioms.axiom.cache_maintenance``).
+    If the wrapped axiom is not input-dependent, the input is left out of the keys, such that the cached preferences are re-used across all inputs (e.g., for the same documents retrieved for many queries).
+    """
+
     axiom: Axiom[_Input, _Output]
     cache_path: Path
+    identity: Literal["id", "id_text"] = "id_text"
+    """
+    Identify inputs and outputs by their ID only (e.g., for static collections), or by their ID and their text (e.g., for generated outputs).
+    Inputs and outputs without an ID are identified by their representation.
+    """
+    backend: Literal["dbm", "sqlite"] = "dbm"
+    """
+    Store the cache in a DBM database (only safe to use from a single process), or in an SQLite database (safe to use from many processes concurrently, e.g., with ``ParallelAxiom``).
+    """
+    batch_size: int = 10_000
+    """
+    Number of newly computed preferences to buffer in memory before writing them to the cache file.
+    """
+    max_memory_entries: Optional[int] = None
+    """
+    Maximum number of preferences to keep in an in-memory LRU cache in front of the cache file, or ``None`` for no limit.
+    The in-memory cache is only used if ``max_memory_entries`` or ``max_memory_bytes`` is set.
+    """
+    max_memory_bytes: Optional[int] = None
+    """
+    Maximum (approximate) number of bytes to keep in an in-memory LRU cache in front of the cache file, or ``None`` for no limit.
+    """
+    write_policy: Literal["write-through", "write-back"] = "write-through"
+    """
+    Whether to write newly computed preferences through to the cache file immediately, or only when they are evicted from memory or the axiom is closed.
+    """
+
+    statistics: PreferenceCacheStatistics = field(
+        default_factory=PreferenceCacheStatistics,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    @property
+    def antisymmetric(self) -> bool:
+        return self.axiom.antisymmetric
+
+    @property
+    def input_dependent(self) -> bool:
+        return self.axiom.input_dependent
+
+    @cached_property
+    def _fingerprint(self) -> bytes:
+        return fingerprint(self.axiom).encode(encoding="utf-8")
+
+    def _identity(self, obj: Any) -> bytes:
+        id = getattr(obj, "id", None)
+        if id is None:
+            return blake2b(
+                repr(obj).encode(encoding="utf-8"),
+                digest_size=_IDENTITY_SIZE,
+            ).digest()
+        digest = blake2b(repr(id).encode(encoding="utf-8"), digest_size=_IDENTITY_SIZE)
+        if self.identity == "id_text":
+            text = getattr(obj, "text", None)
+            if text is not None:
+                digest.update(b"\0")
+                digest.update(str(text).encode(encoding="utf-8"))
+        return digest.digest()
+
+    @cached_property
+    def _namespace(self) -> bytes:
+        return blake2b(self._fingerprint, digest_size=_NAMESPACE_SIZE).digest()
+
+    @property
+    def namespace(self) -> str:
+        """
+        Namespace of this axiom's entries in the cache, e.g., to summarize or prune them.
+        """
+        return self._namespace.hex()
+
+    def _input_prefix(self, input: Any) -> bytes:
+        id = getattr(input, "id", None)
+        return self._namespace + input_digest(input if id is None else id)
+
+    def _prefix(self, input: Any) -> bytes:
+        if not self.input_dependent:
+            return self._namespace + _ANY_INPUT_DIGEST
+        return self._input_prefix(input)
+
+    def _input_identity(self, input: Any) -> bytes:
+        if not self.input_dependent:
+            return _ANY_INPUT_IDENTITY
+        return self._identity(input)
+
+    def _key(
+        self,
+        prefix: bytes,
+        input: bytes,
+        output1: bytes,
+        output2: bytes,
+    ) -> bytes:
+        digest = blake2b(self._fingerprint, digest_size=_IDENTITY_SIZE)
+        digest.update(input)
+        digest.update(output1)
+        digest.update(output2)
+        return prefix + digest.digest()
+
+    @cached_property
+    def _cache(self) -> PreferenceCache:
+        cache: PreferenceCache
+        if self.backend == "dbm":
+            cache = DbmPreferenceCache.open(
+                path=self.cache_path,
+                batch_size=self.batch_size,
+            )
+        elif self.backend == "sqlite":
+            cache = SqlitePreferenceCache(
+                path=self.cache_path,
+                batch_size=self.batch_size,
+            )
+        else:
+            raise ValueError(f"Unknown cache backend: {self.backend}")
+        # Describe the namespace for humans, e.g., to summarize the cache.
+        cache.set_blob(
+            _DESCRIPTION_KEY_PREFIX + self._namespace,
+            repr(self.axiom).encode(encoding="utf-8"),
+        )
+        if self.max_memory_entries is None and self.max_memory_bytes is None:
+            return cache
+        return LruPreferenceCache(
+            cache=cache,
+            max_entries=self.max_memory_entries,
+            max_bytes=self.max_memory_bytes,
+            policy=self.write_policy,
+            statistics=self.statistics,
+        )
 
-    def _iter_preferences(
+    def _lookup_preferences(
         self,
-        inputs_outputs: Iterable[Tuple[_Input, _Output, _Output]],
+        inputs_outputs: Sequence[Tuple[_Input, _Output, _Output]],
         only_cached: bool = False,
-    ) -> Iterator[Preference]:
-        self.cache_path.parent.mkdir(exist_ok=True, parents=True)
-        with dbm_open(self.cache_path, flag="c") as cache:
-            for input, output1, output2 in inputs_outputs:
-                key = repr((input, output1, output2)).encode(encoding="utf-8")
-                if key in cache:
-                    preference_bytes = cache[key]
-                    (preference,) = unpack("f", preference_bytes)
-                    if isnan(preference):
-                        raise RuntimeError(
-                            f"Invalid cache. Please delete cache file at: {self.cache_path}"
-                        )
-                    yield preference
-                elif only_cached:
-                    yield nan
-                else:
-                    preference = self.axiom.preference(input, output1, output2)
-                    preference_bytes = pack("f", preference)
-                    cache[key] = preference_bytes
-                    yield preference
+    ) -> Sequence[Preference]:
+        # Only compute the identity of each input and output once.
+        identities: Dict[int, bytes] = {}
+        prefixes: Dict[int, Tuple[bytes, bytes]] = {}
+
+        def _identity(obj: Any) -> bytes:
+            if id(obj) not in identities:
+                identities[id(obj)] = self._identity(obj)
+            return identities[id(obj)]
+
+        def _prefix(input: Any) -> Tuple[bytes, bytes]:
+            if id(input) not in prefixes:
+                prefixes[id(input)] = (
+                    self._prefix(input),
+                    self._input_identity(input),
+                )
+            return prefixes[id(input)]
+
+        keys: List[bytes] = []
+        flipped_keys: List[bytes] = []
+        for input, output1, output2 in inputs_outputs:
+            prefix, input_identity = _prefix(input)
+            output1_identity = _identity(output1)
+            output2_identity = _identity(output2)
+            keys.append(
+                self._key(prefix, input_identity, output1_identity, output2_identity)
+            )
+            if self.antisymmetric:
+                # Antisymmetric axioms only need one of both orders cached.
+                flipped_keys.append(
+                    self._key(
+                        prefix, input_identity, output2_identity, output1_identity
+                    )
+                )
+
+        # Look up all keys at once.
+        cached_preferences = self._cache.get_many([*keys, *flipped_keys])
+        flipped_cached_preferences = cached_preferences[len(keys) :]
+
+        preferences: List[Preference] = []
+        missing_preferences: Dict[bytes, Preference] = {}
+        for index, (input, output1, output2) in enumerate(inputs_outputs):
+            preference = cached_preferences[index]
+            if preference is None and self.antisymmetric:
+                flipped_preference = flipped_cached_preferences[index]
+                if flipped_preference is not None:
+                    preference = -flipped_preference
+            if preference is not None and isnan(preference):
+                raise RuntimeError(
+                    f"Invalid cache entry. Please prune the cache at: {self.cache_path}"
+                )
+            if preference is None and only_cached:
+                preference = nan
+            elif preference is None:
+                preference = self.axiom.preference(input, output1, output2)
+                missing_preferences[keys[index]] = preference
+            preferences.append(preference)
+
+        if len(missing_preferences) > 0:
+            self._cache.set_many(missing_preferences)
+        return preferences
 
     def preference(
         self,
@@ -55,27 +1077,37 @@ class DbmCachedAxiom(Axiom[_Input, _Output]):
         output1: _Output,
         output2: _Output,
     ) -> Preference:
-        return next(
-            self._iter_preferences(
-                inputs_outputs=((input, output1, output2),),
-            )
+        (preference,) = self._lookup_preferences(
+            inputs_outputs=((input, output1, output2),),
         )
+        return preference
 
     def _cached_preferences(
         self,
         input: _Input,
         outputs: Sequence[_Output],
     ) -> ndarray:
-        return array(
-            list(
-                self._iter_preferences(
-                    (
-                        (input, output1, output2)
-                        for output1 in outputs
-                        for output2 in outputs
-                    ),
+        if self.antisymmetric:
+            rows, columns = upper_triangle_indices(len(outputs))
+            return antisymmetric_matrix(
+                len(outputs),
+                self._lookup_preferences(
+                    [
+                        (input, outputs[i1], outputs[i2])
+                        for i1, i2 in zip(rows, columns)
+                    ],
                     only_cached=True,
-                )
+                ),
+            )
+
+        return array(
+            self._lookup_preferences(
+                [
+                    (input, output1, output2)
+                    for output1 in outputs
+                    for output2 in outputs
+                ],
+                only_cached=True,
             ),
             dtype=float_,
         ).reshape((len(outputs), len(outputs)))
@@ -92,22 +1124,316 @@ class DbmCachedAxiom(Axiom[_Input, _Output]):
             return preferences
 
         preferences = self.axiom.preferences(input, outputs)
-        with dbm_open(self.cache_path, flag="c") as cache:
-            for i1, output1 in enumerate(outputs):
-                for i2, output2 in enumerate(outputs):
-                    key = repr((input, output1, output2)).encode(encoding="utf-8")
-                    preference = float(preferences[i1, i2])
-                    if isnan(preference):
-                        raise RuntimeError("Missing preferences.")
-                    preference_bytes = pack("f", preference)
-                    cache[key] = preference_bytes
+        if self.antisymmetric:
+            rows, columns = upper_triangle_indices(len(outputs))
+        else:
+            rows, columns = indices((len(outputs), len(outputs))).reshape(2, -1)
+        if isnan(preferences[rows, columns]).any():
+            raise RuntimeError("Missing preferences.")
+        prefix = self._prefix(input)
+        input_identity = self._input_identity(input)
+        output_identities = [self._identity(output) for output in outputs]
+        self._cache.set_many(
+            {
+                self._key(
+                    prefix,
+                    input_identity,
+                    output_identities[i1],
+                    output_identities[i2],
+                ): float(preferences[i1, i2])
+                for i1, i2 in zip(rows, columns)
+            }
+        )
         return preferences
 
-    def cached(self, cache_path: Path) -> Axiom[_Input, _Output]:
-        if self.cache_path == cache_path:
+    def flush(self) -> None:
+        """
+        Write all buffered preferences to the cache file.
+        """
+        cache = self.__dict__.get("_cache")
+        if cache is not None:
+            cache.flush()
+
+    def close(self) -> None:
+        """
+        Write all buffered preferences to the cache file and release the cache file.
+        The cache file is closed once no other cached axiom uses it, and is re-opened on the next access.
+        """
+        cache: Optional[PreferenceCache] = self.__dict__.pop("_cache", None)
+        if cache is not None:
+            cache.flush()
+
+    def __enter__(self) -> "DbmCachedAxiom[_Input, _Output]":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Open cache files cannot be shared with other processes.
+        state = dict(self.__dict__)
+        state.pop("_cache", None)
+        return state
+
+    def cached(
+        self,
+        cache_path: Path,
+        backend: Literal["dbm", "sqlite"] = "dbm",
+    ) -> Axiom[_Input, _Output]:
+        if self.cache_path == cache_path and self.backend == backend:
             return self
         else:
-            return self.axiom.cached(cache_path)
+            return self.axiom.cached(cache_path, backend)
+
+
+_MATRIX_HEADER = Struct("<IB")
+_MATRIX_POSITION = Struct("<I")
+_MATRIX_POINTER_SIZE = _KEY_SIZE + _MATRIX_POSITION.size
+_MATRIX_DTYPES = (int8, float32)
+
+
+def _encode_matrix(identities: Sequence[bytes], matrix: ndarray) -> bytes:
+    # Most axioms only return -1, 0, or 1, which fit into a single byte.
+    dtype: type = float32
+    if (matrix == matrix.round()).all() and (abs(matrix) <= 127).all():
+        dtype = int8
+    return compress(
+        _MATRIX_HEADER.pack(len(identities), _MATRIX_DTYPES.index(dtype))
+        + b"".join(identities)
+        + matrix.astype(dtype).tobytes()
+    )
+
+
+def _decode_matrix(blob: bytes) -> Tuple[Sequence[bytes], ndarray]:
+    data = decompress(blob)
+    size, dtype_index = _MATRIX_HEADER.unpack_from(data)
+    offset = _MATRIX_HEADER.size
+    identities = [
+        data[offset + index * _IDENTITY_SIZE : offset + (index + 1) * _IDENTITY_SIZE]
+        for index in range(size)
+    ]
+    offset += size * _IDENTITY_SIZE
+    matrix = frombuffer(
+        data,
+        dtype=_MATRIX_DTYPES[dtype_index],
+        count=size * size,
+        offset=offset,
+    )
+    return identities, matrix.astype(float_).reshape((size, size))
+
+
+@dataclass(frozen=True, kw_only=True)
+class MatrixCachedAxiom(DbmCachedAxiom[_Input, _Output]):
+    """
+    Axiom that caches the wrapped axiom's whole preference matrices, as one compressed blob per input and ordered list of outputs.
+
+    For each output, the cache also points to the matrices that contain it, such that preference matrices for permutations or subsets of cached lists of outputs are remapped from the cached matrices without scanning all matrices of the input.
+    Pointers to matrices whose outputs are all contained in a newer matrix are dropped, as the newer matrix already covers all their pairs.
+    Only preferences between outputs that were never cached together in a matrix are looked up in the pair-level cache (e.g., written by ``DbmCachedAxiom``), or computed.
+    """
+
+    def _matrix_key(
+        self,
+        prefix: bytes,
+        input_identity: bytes,
+        output_identities: Sequence[bytes],
+    ) -> bytes:
+        digest = blake2b(
+            self._fingerprint, digest_size=_IDENTITY_SIZE, person=b"matrix"
+        )
+        digest.update(input_identity)
+        for output_identity in output_identities:
+            digest.update(output_identity)
+        return prefix + digest.digest()
+
+    def _index_key(
+        self,
+        prefix: bytes,
+        input_identity: bytes,
+        output_identity: bytes,
+    ) -> bytes:
+        digest = blake2b(self._fingerprint, digest_size=_IDENTITY_SIZE, person=b"index")
+        digest.update(input_identity)
+        digest.update(output_identity)
+        return prefix + digest.digest()
+
+    def _load_matrix(self, key: bytes) -> Optional[Tuple[Sequence[bytes], ndarray]]:
+        blob = self._cache.get_blob(key)
+        if blob is None:
+            return None
+        identities, matrix = _decode_matrix(blob)
+        if isnan(matrix).any():
+            raise RuntimeError(
+                f"Invalid cache entry. Please prune the cache at: {self.cache_path}"
+            )
+        return identities, matrix
+
+    def preferences(
+        self,
+        input: _Input,
+        outputs: Sequence[_Output],
+    ) -> PreferenceMatrix:
+        prefix = self._prefix(input)
+        input_identity = self._input_identity(input)
+        output_identities = [self._identity(output) for output in outputs]
+
+        # Fast path: The exact same outputs were cached before.
+        matrix_key = self._matrix_key(prefix, input_identity, output_identities)
+        cached = self._load_matrix(matrix_key)
+        if cached is not None:
+            return cached[1]
+
+        # Remap the preferences from the matrices of each output.
+        index_keys = [
+            self._index_key(prefix, input_identity, output_identity)
+            for output_identity in output_identities
+        ]
+        pointers = [pointer or b"" for pointer in self._cache.get_blobs(index_keys)]
+        matrix_rows: Dict[bytes, Tuple[List[int], List[int]]] = {}
+        for row, pointer in enumerate(pointers):
+            for offset in range(0, len(pointer), _MATRIX_POINTER_SIZE):
+                output_rows, positions = matrix_rows.setdefault(
+                    pointer[offset : offset + _KEY_SIZE], ([], [])
+                )
+                output_rows.append(row)
+                positions.append(
+                    _MATRIX_POSITION.unpack_from(pointer, offset + _KEY_SIZE)[0]
+                )
+        preferences = full((len(outputs), len(outputs)), nan, dtype=float_)
+        matrix_identities: Dict[bytes, Set[bytes]] = {}
+        for key, (output_rows, positions) in matrix_rows.items():
+            cached = self._load_matrix(key)
+            if cached is None:
+                continue
+            cached_identities, cached_matrix = cached
+            matrix_identities[key] = set(cached_identities)
+            block = preferences[ix_(output_rows, output_rows)]
+            preferences[ix_(output_rows, output_rows)] = where(
+                isnan(block),
+                cached_matrix[ix_(positions, positions)],
+                block,
+            )
+        if not isnan(preferences).any():
+            # Permutations or subsets of cached outputs are not cached again.
+            return preferences
+
+        # Fall back to the pair-level cache for pairs not cached in any matrix.
+        rows, columns = nonzero(isnan(preferences))
+        preferences[rows, columns] = self._lookup_preferences(
+            [
+                (input, outputs[i1], outputs[i2])
+                for i1, i2 in zip(rows.tolist(), columns.tolist())
+            ],
+            only_cached=True,
+        )
+
+        # Only compute the genuinely new preferences.
+        mask = isnan(preferences)
+        if mask.all():
+            preferences = self.axiom.preferences(input, outputs)
+        elif mask.any():
+            preferences = where(
+                mask,
+                self.axiom.masked_preferences(input, outputs, mask),
+                preferences,
+            )
+        if isnan(preferences).any():
+            raise RuntimeError("Missing preferences.")
+
+        self._cache.set_blob(matrix_key, _encode_matrix(output_identities, preferences))
+        # Keep only pointers to matrices that still cover pairs the new matrix does not.
+        new_identities = set(output_identities)
+        covered_keys = {
+            key
+            for key, identities in matrix_identities.items()
+            if identities <= new_identities
+        }
+        for position, (index_key, pointer) in enumerate(zip(index_keys, pointers)):
+            self._cache.set_blob(
+                index_key,
+                b"".join(
+                    pointer[offset : offset + _MATRIX_POINTER_SIZE]
+                    for offset in range(0, len(pointer), _MATRIX_POINTER_SIZE)
+                    if pointer[offset : offset + _KEY_SIZE] in matrix_identities
+                    and pointer[offset : offset + _KEY_SIZE] not in covered_keys
+                )
+                + matrix_key
+                + _MATRIX_POSITION.pack(position),
+            )
+        return preferences
+
+
+@dataclass(frozen=True, kw_only=True)
+class ScoreCachedAxiom(DbmCachedAxiom[_Input, _Output]):
+    """
+    Axiom that caches the wrapped score axiom's scores per (input and) output, instead of the preferences per pair of outputs.
+
+    The cache thus only grows linearly with the number of outputs.
+    As the scores do not depend on the margin fraction, preferences for any margin fraction are derived from the same cached scores.
+    """
+
+    axiom: ScoreAxiom[_Input, _Output]
+
+    @cached_property
+    def _fingerprint(self) -> bytes:
+        return fingerprint(self.axiom, exclude={"margin_fraction"}).encode(
+            encoding="utf-8"
+        )
+
+    def _score_key(
+        self,
+        prefix: bytes,
+        input_identity: bytes,
+        output_identity: bytes,
+    ) -> bytes:
+        digest = blake2b(self._fingerprint, digest_size=_IDENTITY_SIZE, person=b"score")
+        digest.update(input_identity)
+        digest.update(output_identity)
+        return prefix + digest.digest()
+
+    def scores(
+        self,
+        input: _Input,
+        outputs: Sequence[_Output],
+    ) -> NDArray[float_]:
+        prefix = self._prefix(input)
+        input_identity = self._input_identity(input)
+        keys = [
+            self._score_key(prefix, input_identity, self._identity(output))
+            for output in outputs
+        ]
+        scores = full(len(outputs), nan, dtype=float_)
+        missing_indices: List[int] = []
+        for index, value in enumerate(self._cache.get_blobs(keys)):
+            if value is None:
+                missing_indices.append(index)
+            else:
+                (scores[index],) = unpack("d", value)
+
+        if len(missing_indices) > 0:
+            missing_scores = self.axiom.scores(
+                input, [outputs[index] for index in missing_indices]
+            )
+            for index, score in zip(missing_indices, missing_scores):
+                scores[index] = score
+                self._cache.set_blob(keys[index], pack("d", score))
+        return scores
+
+    def preference(
+        self,
+        input: _Input,
+        output1: _Output,
+        output2: _Output,
+    ) -> Preference:
+        score1, score2 = self.scores(input, [output1, output2])
+        return self.axiom.preference_from_scores(score1, score2)
+
+    def preferences(
+        self,
+        input: _Input,
+        outputs: Sequence[_Output],
+    ) -> PreferenceMatrix:
+        return self.axiom.preferences_from_scores(self.scores(input, outputs))
 
 
 CachedAxiom: TypeAlias = DbmCachedAxiom
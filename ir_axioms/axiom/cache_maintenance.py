@@ -0,0 +1,284 @@
+from dataclasses import dataclass
+from datetime import timedelta
+from math import isnan
+from pathlib import Path
+from struct import unpack
+from typing import (
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Set,
+)
+
+from ir_axioms.axiom.cache import (
+    _DESCRIPTION_KEY_PREFIX,
+    _INPUT_DIGEST_SIZE,
+    _KEY_SIZE,
+    _NAMESPACE_SIZE,
+    DbmPreferenceCache,
+    PreferenceCache,
+    PreferenceCacheEntry,
+    SqlitePreferenceCache,
+    _timestamp,
+    input_digest,
+)
+
+_SQLITE_HEADER = b"SQLite format 3\0"
+
+
+def open_preference_cache(
+    path: Path,
+    backend: Optional[Literal["dbm", "sqlite"]] = None,
+) -> PreferenceCache:
+    """
+    Open the preference cache at the given path.
+
+    :param path: Path of the cache, as used by the cached axioms.
+    :param backend: Backend of the cache, or ``None`` to detect existing SQLite caches and use DBM otherwise.
+    :return: The opened preference cache.
+    """
+    if backend is None:
+        is_sqlite = False
+        if path.is_file():
+            with path.open("rb") as file:
+                is_sqlite = file.read(len(_SQLITE_HEADER)) == _SQLITE_HEADER
+        backend = "sqlite" if is_sqlite else "dbm"
+    if backend == "dbm":
+        return DbmPreferenceCache.open(path)
+    elif backend == "sqlite":
+        return SqlitePreferenceCache(path)
+    else:
+        raise ValueError(f"Unknown cache backend: {backend}")
+
+
+def _is_description(entry: PreferenceCacheEntry) -> bool:
+    return len(entry.key) == len(
+        _DESCRIPTION_KEY_PREFIX
+    ) + _NAMESPACE_SIZE and entry.key.startswith(_DESCRIPTION_KEY_PREFIX)
+
+
+def _is_invalid(entry: PreferenceCacheEntry) -> bool:
+    if _is_description(entry):
+        return False
+    if len(entry.key) != _KEY_SIZE or len(entry.value) == 0:
+        return True
+    # Preferences are stored as single 32-bit floats.
+    return len(entry.value) == 4 and isnan(unpack("f", entry.value)[0])
+
+
+def _namespace(entry: PreferenceCacheEntry) -> bytes:
+    if _is_description(entry):
+        return entry.key[len(_DESCRIPTION_KEY_PREFIX) :]
+    return entry.key[:_NAMESPACE_SIZE]
+
+
+@dataclass(frozen=True, kw_only=True)
+class PreferenceCacheSummary:
+    namespace: Optional[str]
+    """
+    Namespace of the cached axiom, or ``None`` for invalid entries.
+    """
+    description: Optional[str]
+    """
+    Representation of the cached axiom, if known.
+    """
+    entries: int
+    inputs: int
+    size: int
+    """
+    Total size of the entries' keys and values, in bytes.
+    """
+    first_created: int
+    last_created: int
+
+
+def summarize_preference_cache(
+    cache: PreferenceCache,
+) -> Sequence[PreferenceCacheSummary]:
+    """
+    Summarize the entries of a preference cache per axiom namespace.
+
+    :param cache: The preference cache.
+    :return: One summary per axiom namespace, and one summary of all invalid entries, if any.
+    """
+    descriptions: Dict[Optional[bytes], str] = {}
+    entries: Dict[Optional[bytes], int] = {}
+    inputs: Dict[Optional[bytes], Set[bytes]] = {}
+    sizes: Dict[Optional[bytes], int] = {}
+    first_created: Dict[Optional[bytes], int] = {}
+    last_created: Dict[Optional[bytes], int] = {}
+    for entry in cache.entries():
+        if _is_description(entry):
+            descriptions[_namespace(entry)] = entry.value.decode(encoding="utf-8")
+            continue
+        namespace = None if _is_invalid(entry) else _namespace(entry)
+        entries[namespace] = entries.get(namespace, 0) + 1
+        inputs.setdefault(namespace, set()).add(
+            entry.key[_NAMESPACE_SIZE : _NAMESPACE_SIZE + _INPUT_DIGEST_SIZE]
+        )
+        sizes[namespace] = sizes.get(namespace, 0) + len(entry.key) + len(entry.value)
+        first_created[namespace] = min(
+            first_created.get(namespace, entry.created), entry.created
+        )
+        last_created[namespace] = max(
+            last_created.get(namespace, entry.created), entry.created
+        )
+    return [
+        PreferenceCacheSummary(
+            namespace=namespace.hex() if namespace is not None else None,
+            description=descriptions.get(namespace),
+            entries=count,
+            inputs=len(inputs[namespace]),
+            size=sizes[namespace],
+            first_created=first_created[namespace],
+            last_created=last_created[namespace],
+        )
+        for namespace, count in sorted(
+            entries.items(), key=lambda item: item[1], reverse=True
+        )
+    ]
+
+
+def export_preference_cache(cache: PreferenceCache, path: Path) -> int:
+    """
+    Export all entries of a preference cache to a Parquet file, or to an Arrow (Feather) file if the path ends with ``.arrow`` or ``.feather``.
+
+    :param cache: The preference cache to export.
+    :param path: Path of the exported file.
+    :return: Number of exported entries.
+    """
+    from pandas import DataFrame
+
+    data = DataFrame(
+        [
+            {
+                "namespace": _namespace(entry).hex(),
+                "key": entry.key,
+                "value": entry.value,
+                "created": entry.created,
+            }
+            for entry in cache.entries()
+        ],
+        columns=["namespace", "key", "value", "created"],
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix in (".arrow", ".feather"):
+        data.to_feather(path)
+    else:
+        data.to_parquet(path, index=False)
+    return len(data)
+
+
+def _read_entries(path: Path) -> Iterator[PreferenceCacheEntry]:
+    from pandas import read_feather, read_parquet
+
+    if path.suffix in (".arrow", ".feather"):
+        data = read_feather(path, columns=["key", "value", "created"])
+    else:
+        data = read_parquet(path, columns=["key", "value", "created"])
+    for key, value, created in data.itertuples(index=False):
+        yield PreferenceCacheEntry(
+            key=bytes(key), value=bytes(value), created=int(created)
+        )
+
+
+def import_preference_cache(cache: PreferenceCache, path: Path) -> int:
+    """
+    Import the entries of an exported preference cache.
+    Existing entries are only replaced by newer entries.
+
+    :param cache: The preference cache to import into.
+    :param path: Path of the exported Parquet or Arrow file.
+    :return: Number of imported entries.
+    """
+    return cache.set_entries(_read_entries(path))
+
+
+def merge_preference_caches(
+    cache: PreferenceCache,
+    other_caches: Iterable[PreferenceCache],
+) -> int:
+    """
+    Merge the entries of other preference caches into a preference cache, e.g., to consolidate caches computed on different machines.
+    Existing entries are only replaced by newer entries.
+
+    :param cache: The preference cache to merge into.
+    :param other_caches: The preference caches to merge.
+    :return: Number of merged entries.
+    """
+    return sum(cache.set_entries(other_cache.entries()) for other_cache in other_caches)
+
+
+def prune_preference_cache(
+    cache: PreferenceCache,
+    namespaces: Optional[Collection[str]] = None,
+    input_ids: Optional[Collection[str]] = None,
+    older_than: Optional[timedelta] = None,
+    invalid: bool = False,
+) -> int:
+    """
+    Delete the entries of a preference cache that match all given criteria.
+
+    :param cache: The preference cache to prune.
+    :param namespaces: Only delete entries of the axioms with these namespaces.
+    :param input_ids: Only delete entries of the inputs with these IDs, e.g., query IDs. Entries of input-independent axioms are shared by all inputs and are thus never deleted by input ID.
+    :param older_than: Only delete entries that were written longer ago.
+    :param invalid: Delete invalid entries (e.g., from an older version), regardless of the other criteria.
+    :return: Number of deleted entries.
+    """
+    has_criteria = (
+        namespaces is not None or input_ids is not None or older_than is not None
+    )
+    if not has_criteria and not invalid:
+        raise ValueError("Refusing to prune all entries without any criterion.")
+
+    namespace_bytes = (
+        {bytes.fromhex(namespace) for namespace in namespaces}
+        if namespaces is not None
+        else None
+    )
+    input_digests = (
+        {input_digest(input_id) for input_id in input_ids}
+        if input_ids is not None
+        else None
+    )
+    created_before = (
+        _timestamp() - older_than.total_seconds() if older_than is not None else None
+    )
+
+    def _matches(entry: PreferenceCacheEntry) -> bool:
+        if not has_criteria:
+            return False
+        if namespace_bytes is not None and _namespace(entry) not in namespace_bytes:
+            return False
+        if input_digests is not None and (
+            _is_description(entry)
+            or entry.key[_NAMESPACE_SIZE : _NAMESPACE_SIZE + _INPUT_DIGEST_SIZE]
+            not in input_digests
+        ):
+            return False
+        if created_before is not None and entry.created >= created_before:
+            return False
+        return True
+
+    keys: List[bytes] = [
+        entry.key
+        for entry in cache.entries()
+        if (invalid and _is_invalid(entry))
+        or (not _is_invalid(entry) and _matches(entry))
+    ]
+    return cache.delete_many(keys)
+
+
+def compact_preference_cache(cache: PreferenceCache) -> None:
+    """
+    Reclaim the space of deleted or replaced entries of a preference cache.
+
+    :param cache: The preference cache to compact.
+    """
+    cache.compact()
@@ -1,5 +1,6 @@
 from abc import abstractmethod, ABC
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Sequence, Iterable
 
 from numpy import ndarray, stack, concatenate, array, expand_dims
@@ -8,7 +9,9 @@ from tqdm.auto import tqdm
 from typing_extensions import Protocol, Self  # type: ignore
 
 from ir_axioms.axiom.base import Axiom
+from ir_axioms.axiom.planner import plan_axioms
 from ir_axioms.model import Input, Output, Preference, PreferenceMatrix
+from ir_axioms.tools.analysis import analysis_session
 
 
 class EstimatorAxiom(Axiom[Input, Output], ABC):
@@ -31,52 +34,53 @@ class ScikitLearnEstimatorAxiom(EstimatorAxiom[Input, Output], ABC):
     axioms: Sequence[Axiom[Input, Output]]
     estimator: ScikitLearnEstimator
 
+    @cached_property
+    def _planned_axioms(self) -> Sequence[Axiom[Input, Output]]:
+        return plan_axioms(self.axioms)
+
     def fit(
         self,
         target: Axiom[Input, Output],
         inputs_outputs: Iterable[tuple[Input, Sequence[Output]]],
     ) -> None:
-        # Compute preferences of every axiom for the inputs and outputs.
-        # The individual preference matices for each common input will be flattened, so that, after stacking, the final array contains columns for each axiom and rows for each combination of input and two outputs.
-        # Shape: |input+output1+output2 combinations| x |axioms|
-        preferences_x = stack(
-            [
-                concatenate(
-                    [
-                        axiom.preferences(
-                            input=input,
-                            outputs=outputs,
-                        ).reshape(-1)
-                        for input, outputs in tqdm(
-                            inputs_outputs,
-                            desc="Feature preferences",
-                            unit="query",
-                        )
-                    ]
-                )
-                for axiom in self.axioms
-            ],
-            axis=-1,
-        )
-
         # If the estimator is a classifier, the targets need to be discretized.
         # By normalizing the target preferences, we ensure that the target values are one of -1, 0, and 1, i.e., the classes for the classifier.
         if is_classifier(self.estimator):
             target = target.normalized()
 
-        # Compute the target preferences for the inputs and outputs.
-        # The individual preference matrices for each common input will be flattened, so that, after concatenating, the final array contains the target preferences for each combination of input and two outputs.
-        # Shape: |input+output1+output2 combinations|
-        preferences_y = concatenate(
-            [
-                target.preferences(input, outputs).reshape(-1)
-                for input, outputs in tqdm(
-                    inputs_outputs,
-                    desc="Target preferences",
-                    unit="query",
+        # Plan the feature axioms together with the target axiom, so that common subexpressions (e.g., a target that is also used as a feature) are only computed once per input.
+        *feature_axioms, target = plan_axioms([*self.axioms, target])
+
+        # Compute preferences of every axiom and the target preferences for the inputs and outputs.
+        # The individual preference matices for each common input will be flattened, so that, after concatenating, the final arrays contain columns for each axiom and rows for each combination of input and two outputs.
+        features = []
+        targets = []
+        for input, outputs in tqdm(
+            inputs_outputs,
+            desc="Preferences",
+            unit="query",
+        ):
+            with analysis_session():
+                # Shape: (|outputs|*|outputs|) x |axioms|
+                features.append(
+                    stack(
+                        [
+                            axiom.preferences(
+                                input=input,
+                                outputs=outputs,
+                            ).reshape(-1)
+                            for axiom in feature_axioms
+                        ],
+                        axis=-1,
+                    )
                 )
-            ]
-        )
+                # Shape: (|outputs|*|outputs|)
+                targets.append(target.preferences(input, outputs).reshape(-1))
+
+        # Shape: |input+output1+output2 combinations| x |axioms|
+        preferences_x = concatenate(features)
+        # Shape: |input+output1+output2 combinations|
+        preferences_y = concatenate(targets)
 
         # With the flattened inputs and flattened targets, now fit the estimator.
         self.estimator.fit(preferences_x, preferences_y)
@@ -124,7 +128,7 @@ class ScikitLearnEstimatorAxiom(EstimatorAxiom[Input, Output], ABC):
                     input=input,
                     outputs=outputs,
                 ).reshape(-1)
-                for axiom in self.axioms
+                for axiom in self._planned_axioms
             ],
             axis=-1,
         )
@@ -9,24 +9,23 @@ For a definition of this utility dimension, see: https://doi.org/10.1145/3626772
 
 from dataclasses import dataclass
 from functools import cached_property
-from math import isclose, nan
-from typing import Final, Sequence, Any, Literal, Iterable
+from math import nan
+from typing import ClassVar, Final, Sequence, Any, Literal, Iterable
 from typing_extensions import TypeAlias  # type: ignore
 
 from injector import inject, NoInject
 from language_tool_python import LanguageTool
 from numpy import array, float_
+from numpy.typing import NDArray
 from tqdm.auto import tqdm
 from spacy import load as spacy_load
 from spacy.language import Language
 from textacy.text_stats import flesch_reading_ease
 
-from ir_axioms.axiom.base import Axiom
-from ir_axioms.axiom.utils import strictly_less
-from ir_axioms.model import PreferenceMatrix
-from ir_axioms.model.base import Preference
+from ir_axioms.axiom.score import ScoreAxiom
 from ir_axioms.model.generation import GenerationOutput
-from ir_axioms.tools import TextContents
+from ir_axioms.tools import TextContents, async_contents
+from ir_axioms.utils.concurrency import run_blocking
 from ir_axioms.utils.lazy import lazy_inject
 
 
@@ -55,17 +54,23 @@ _LanguageToolCategory: TypeAlias = Literal[
 
 @inject
 @dataclass(frozen=True, kw_only=True)
-class _LanguageToolErrorProportionClarityAxiom(Axiom[Any, GenerationOutput]):
+class _LanguageToolErrorProportionClarityAxiom(ScoreAxiom[Any, GenerationOutput]):
     """
     Prefer text with a lower proportion of characters covered by errors from LanguageTool.
     """
 
+    prefer_greater: ClassVar[bool] = False
+
     text_contents: TextContents[GenerationOutput]
 
     language: NoInject[str] = "en-US"
     enabled_categories: NoInject[Iterable[_LanguageToolCategory]] = frozenset()
     margin_fraction: NoInject[float] = 0.1
 
+    @property
+    def input_dependent(self) -> bool:
+        return False
+
     @cached_property
     def _language_tool(self) -> LanguageTool:
         # TODO: Make the grammar checker a configurable dependency.
@@ -74,87 +79,50 @@ class _LanguageToolErrorProportionClarityAxiom(Axiom[Any, GenerationOutput]):
         language_tool.enabled_rules_only = True
         return language_tool
 
-    def preference(
-        self,
-        input: Any,
-        output1: GenerationOutput,
-        output2: GenerationOutput,
-    ) -> Preference:
-        contents1 = self.text_contents.contents(output1)
-        contents2 = self.text_contents.contents(output2)
-        matches1 = self._language_tool.check(contents1)
-        matches2 = self._language_tool.check(contents2)
-        characters_matched1 = {
-            i
-            for match in matches1
-            for i in range(match.offset, match.offset + match.error_length)
-        }
-        characters_matched2 = {
+    def _error_coverage(self, contents: str) -> float:
+        matches = self._language_tool.check(contents)
+        characters_matched = {
             i
-            for match in matches2
+            for match in matches
             for i in range(match.offset, match.offset + match.error_length)
         }
-        num_characters_matched1 = len(characters_matched1)
-        num_characters_matched2 = len(characters_matched2)
-        error_coverage1 = (
-            num_characters_matched1 / len(contents1) if len(contents1) > 0 else 0
-        )
-        error_coverage2 = (
-            num_characters_matched2 / len(contents2) if len(contents2) > 0 else 0
-        )
-        if isclose(
-            error_coverage1,
-            error_coverage2,
-            rel_tol=self.margin_fraction,
-        ):
-            return 0
-        return strictly_less(error_coverage1, error_coverage2)
-
-    def preferences(
+        return len(characters_matched) / len(contents) if len(contents) > 0 else 0
+
+    def score(
+        self,
+        input: Any,
+        output: GenerationOutput,
+    ) -> float:
+        return self._error_coverage(self.text_contents.contents(output))
+
+    async def ascore(
+        self,
+        input: Any,
+        output: GenerationOutput,
+    ) -> float:
+        # Start the grammar checker before any concurrent checks, so that it is started only once.
+        self._language_tool
+        contents = await async_contents(self.text_contents, output)
+        return await run_blocking(self._error_coverage, contents)
+
+    def scores(
         self,
         input: Any,
         outputs: Sequence[GenerationOutput],
-    ) -> PreferenceMatrix:
-        contents = [self.text_contents.contents(output) for output in outputs]
-        matches = (
-            self._language_tool.check(content)
-            for content in tqdm(
-                contents,
-                desc="Check grammar",
-                unit="output",
-            )
-        )
-        characters_matched = (
-            {
-                i
-                for match in matches
-                for i in range(match.offset, match.offset + match.error_length)
-            }
-            for matches in matches
-        )
-        num_characters_matched = (
-            len(characters_matched) for characters_matched in characters_matched
-        )
-        error_coverages = [
-            num_characters_matched / len(content) if len(content) > 0 else 0
-            for num_characters_matched, content in zip(num_characters_matched, contents)
-        ]
+    ) -> NDArray[float_]:
+        contents = (self.text_contents.contents(output) for output in outputs)
         return array(
             [
-                (
-                    strictly_less(error_coverage1, error_coverage2)
-                    if not isclose(
-                        error_coverage1,
-                        error_coverage2,
-                        rel_tol=self.margin_fraction,
-                    )
-                    else 0
+                self._error_coverage(content)
+                for content in tqdm(
+                    contents,
+                    total=len(outputs),
+                    desc="Check grammar",
+                    unit="output",
                 )
-                for error_coverage1 in error_coverages
-                for error_coverage2 in error_coverages
             ],
             dtype=float_,
-        ).reshape((len(outputs), len(outputs)))
+        )
 
 
 @inject
@@ -176,73 +144,54 @@ CLAR1: Final = lazy_inject(LanguageToolGrammarErrorProportionClarityAxiom)
 
 @inject
 @dataclass(frozen=True, kw_only=True)
-class FleschReadingEaseClarityAxiom(Axiom[Any, GenerationOutput]):
+class FleschReadingEaseClarityAxiom(ScoreAxiom[Any, GenerationOutput]):
     """
     Prefer text with higher readability as measured by the Flesch reading ease score.
     """
 
+    prefer_greater: ClassVar[bool] = False
+
     text_contents: TextContents[GenerationOutput]
 
     language_name: NoInject[str] = "en_core_web_sm"
     margin_fraction: NoInject[float] = 0.0
 
+    @property
+    def input_dependent(self) -> bool:
+        return False
+
     @cached_property
     def _language(self) -> Language:
         return spacy_load(name=self.language_name)
 
-    def preference(
+    def score(
         self,
         input: Any,
-        output1: GenerationOutput,
-        output2: GenerationOutput,
-    ) -> Preference:
-        document1 = self._language(self.text_contents.contents(output1))
-        document2 = self._language(self.text_contents.contents(output2))
-
-        flesch_reading_ease1 = flesch_reading_ease(document1)
-        flesch_reading_ease2 = flesch_reading_ease(document2)
-
-        if isclose(
-            flesch_reading_ease1,
-            flesch_reading_ease2,
-            rel_tol=self.margin_fraction,
-        ):
-            return 0
-        return strictly_less(flesch_reading_ease1, flesch_reading_ease2)
-
-    def preferences(
+        output: GenerationOutput,
+    ) -> float:
+        document = self._language(self.text_contents.contents(output))
+        return flesch_reading_ease(document) if len(document) > 0 else nan
+
+    def scores(
         self,
         input: Any,
         outputs: Sequence[GenerationOutput],
-    ) -> PreferenceMatrix:
-        documents = (
-            self._language(self.text_contents.contents(output)) for output in outputs
+    ) -> NDArray[float_]:
+        documents = self._language.pipe(
+            self.text_contents.contents(output) for output in outputs
         )
-        flesch_reading_eases = [
-            flesch_reading_ease(document) if len(document) > 0 else nan
-            for document in tqdm(
-                documents,
-                total=len(outputs),
-                desc="Flesch reading eases",
-                unit="output",
-            )
-        ]
         return array(
             [
-                (
-                    strictly_less(flesch_reading_ease1, flesch_reading_ease2)
-                    if not isclose(
-                        flesch_reading_ease1,
-                        flesch_reading_ease2,
-                        rel_tol=self.margin_fraction,
-                    )
-                    else 0
+                flesch_reading_ease(document) if len(document) > 0 else nan
+                for document in tqdm(
+                    documents,
+                    total=len(outputs),
+                    desc="Flesch reading eases",
+                    unit="output",
                 )
-                for flesch_reading_ease1 in flesch_reading_eases
-                for flesch_reading_ease2 in flesch_reading_eases
             ],
             dtype=float_,
-        ).reshape((len(outputs), len(outputs)))
+        )
 
 
 CLAR2: Final = lazy_inject(FleschReadingEaseClarityAxiom)
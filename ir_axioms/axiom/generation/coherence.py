@@ -9,19 +9,18 @@ For a definition of this utility dimension, see: https://doi.org/10.1145/3626772
 
 from dataclasses import dataclass
 from functools import cached_property
-from math import isclose
-from typing import Final, Sequence, Any
+from typing import ClassVar, Collection, Final, Sequence, Any
 
 from injector import inject, NoInject
 from numpy import array, float_
+from numpy.typing import NDArray
 from spacy import load as spacy_load
 from spacy.language import Language
+from spacy.tokens import Doc
 from tqdm.auto import tqdm
 from textacy.extract.triples import subject_verb_object_triples
 
-from ir_axioms.axiom.base import Axiom
-from ir_axioms.axiom.utils import strictly_less
-from ir_axioms.model.base import Preference, PreferenceMatrix
+from ir_axioms.axiom.score import ScoreAxiom
 from ir_axioms.model.generation import GenerationOutput
 from ir_axioms.tools import (
     TextContents,
@@ -33,109 +32,69 @@ from ir_axioms.utils.lazy import lazy_inject
 
 @inject
 @dataclass(frozen=True, kw_only=True)
-class WordLengthDeviationCoherenceAxiom(Axiom[Any, GenerationOutput]):
+class WordLengthDeviationCoherenceAxiom(ScoreAxiom[Any, GenerationOutput]):
     """
     Prefer text with lower standard deviation of average word lengths across sentences.
     """
 
+    prefer_greater: ClassVar[bool] = False
+
     text_contents: TextContents[GenerationOutput]
     sentence_tokenizer: SentenceTokenizer
     term_tokenizer: TermTokenizer
 
     margin_fraction: NoInject[float] = 0.0
 
-    def preference(
+    @property
+    def input_dependent(self) -> bool:
+        return False
+
+    @staticmethod
+    def _word_length_deviation(sentences_terms: Sequence[Collection[str]]) -> float:
+        average_word_lengths = array(
+            [array([len(word) for word in terms]).mean() for terms in sentences_terms]
+        )
+        return average_word_lengths.std()
+
+    def score(
         self,
         input: Any,
-        output1: GenerationOutput,
-        output2: GenerationOutput,
-    ) -> Preference:
-        average_word_lengths1 = array(
+        output: GenerationOutput,
+    ) -> float:
+        return self._word_length_deviation(
             [
-                array(
-                    [
-                        len(word)
-                        for word in self.term_tokenizer.terms_unordered(sentence)
-                    ]
-                ).mean()
+                self.term_tokenizer.terms_unordered(sentence)
                 for sentence in self.sentence_tokenizer.sentences(
-                    self.text_contents.contents(output1)
+                    self.text_contents.contents(output)
                 )
             ]
         )
-        average_word_lengths2 = array(
-            [
-                array(
-                    [
-                        len(word)
-                        for word in self.term_tokenizer.terms_unordered(sentence)
-                    ]
-                ).mean()
-                for sentence in self.sentence_tokenizer.sentences(
-                    self.text_contents.contents(output2)
-                )
-            ]
-        )
-
-        average_word_lengths_stdev1 = average_word_lengths1.std()
-        average_word_lengths_stdev2 = average_word_lengths2.std()
-
-        if isclose(
-            average_word_lengths_stdev1,
-            average_word_lengths_stdev2,
-            rel_tol=self.margin_fraction,
-        ):
-            return 0
-        return strictly_less(average_word_lengths_stdev1, average_word_lengths_stdev2)
 
-    def preferences(
+    def scores(
         self,
         input: Any,
         outputs: Sequence[GenerationOutput],
-    ) -> PreferenceMatrix:
-        average_word_lengths = (
-            array(
-                [
-                    array(
-                        [
-                            len(word)
-                            for word in self.term_tokenizer.terms_unordered(sentence)
-                        ]
-                    ).mean()
-                    for sentence in self.sentence_tokenizer.sentences(
-                        self.text_contents.contents(output)
-                    )
-                ]
-            )
-            for output in tqdm(
-                outputs,
-                desc="Calculate average word lengths",
-                unit="output",
+    ) -> NDArray[float_]:
+        outputs_sentences = self.sentence_tokenizer.sentences_batch(
+            [self.text_contents.contents(output) for output in outputs]
+        )
+        # Tokenize the sentences of all outputs at once.
+        sentences_terms = iter(
+            self.term_tokenizer.terms_unordered_batch(
+                [sentence for sentences in outputs_sentences for sentence in sentences]
             )
         )
-
-        average_word_lengths_stdevs = [
-            average_word_lengths.std() for average_word_lengths in average_word_lengths
-        ]
-
         return array(
             [
-                (
-                    strictly_less(
-                        average_word_lengths_stdev1, average_word_lengths_stdev2
-                    )
-                    if not isclose(
-                        average_word_lengths_stdev1,
-                        average_word_lengths_stdev2,
-                        rel_tol=self.margin_fraction,
-                    )
-                    else 0
+                self._word_length_deviation([next(sentences_terms) for _ in sentences])
+                for sentences in tqdm(
+                    outputs_sentences,
+                    desc="Calculate average word lengths",
+                    unit="output",
                 )
-                for average_word_lengths_stdev1 in average_word_lengths_stdevs
-                for average_word_lengths_stdev2 in average_word_lengths_stdevs
             ],
             dtype=float_,
-        ).reshape((len(outputs), len(outputs)))
+        )
 
 
 COH1: Final = lazy_inject(WordLengthDeviationCoherenceAxiom)
@@ -143,117 +102,71 @@ COH1: Final = lazy_inject(WordLengthDeviationCoherenceAxiom)
 
 @inject
 @dataclass(frozen=True, kw_only=True)
-class SubjectVerbClosenessCoherenceAxiom(Axiom[Any, GenerationOutput]):
+class SubjectVerbClosenessCoherenceAxiom(ScoreAxiom[Any, GenerationOutput]):
     """
     Prefer text with subjects and verbs that are closer together.
     """
 
+    prefer_greater: ClassVar[bool] = False
+
     text_contents: TextContents[GenerationOutput]
 
     language_name: NoInject[str] = "en_core_web_sm"
     margin_fraction: NoInject[float] = 0.1
 
+    @property
+    def input_dependent(self) -> bool:
+        return False
+
     @cached_property
     def _language(self) -> Language:
         return spacy_load(
             name=self.language_name,
         )
 
-    def preference(
-        self,
-        input: Any,
-        output1: GenerationOutput,
-        output2: GenerationOutput,
-    ) -> Preference:
-        doc1 = self._language(self.text_contents.contents(output1))
-        doc2 = self._language(self.text_contents.contents(output2))
-
-        svo_triples1 = subject_verb_object_triples(doc1)
-        svo_triples2 = subject_verb_object_triples(doc2)
-
-        max_sv_distances1 = array(
+    @staticmethod
+    def _average_max_subject_verb_distance(document: Doc) -> float:
+        max_sv_distances = array(
             [
                 max(
                     abs(verb.i - subject.i)
                     for subject in subject_toks
                     for verb in verb_toks
                 )
-                for subject_toks, verb_toks, _ in svo_triples1
-            ]
-        )
-        max_sv_distances2 = array(
-            [
-                max(
-                    abs(verb.i - subject.i)
-                    for subject in subject_toks
-                    for verb in verb_toks
-                )
-                for subject_toks, verb_toks, _ in svo_triples2
+                for subject_toks, verb_toks, _ in subject_verb_object_triples(document)
             ]
         )
+        return max_sv_distances.mean()
 
-        avg_max_sv_distance1 = max_sv_distances1.mean()
-        avg_max_sv_distance2 = max_sv_distances2.mean()
-
-        if isclose(
-            avg_max_sv_distance1,
-            avg_max_sv_distance2,
-            rel_tol=self.margin_fraction,
-        ):
-            return 0
-        return strictly_less(avg_max_sv_distance1, avg_max_sv_distance2)
+    def score(
+        self,
+        input: Any,
+        output: GenerationOutput,
+    ) -> float:
+        return self._average_max_subject_verb_distance(
+            self._language(self.text_contents.contents(output))
+        )
 
-    def preferences(
+    def scores(
         self,
         input: Any,
         outputs: Sequence[GenerationOutput],
-    ) -> PreferenceMatrix:
+    ) -> NDArray[float_]:
         docs = self._language.pipe(
             self.text_contents.contents(output) for output in outputs
         )
-
-        svo_triples = (subject_verb_object_triples(doc) for doc in docs)
-
-        max_sv_distances = (
-            array(
-                [
-                    max(
-                        abs(verb.i - subject.i)
-                        for subject in subject_toks
-                        for verb in verb_toks
-                    )
-                    for subject_toks, verb_toks, _ in svo_triples
-                ]
-            )
-            for svo_triples in svo_triples
-        )
-
-        avg_max_sv_distances = [
-            max_sv_distances.mean()
-            for max_sv_distances in tqdm(
-                max_sv_distances,
-                total=len(outputs),
-                desc="Calculate S-V distances",
-                unit="output",
-            )
-        ]
-
         return array(
             [
-                (
-                    strictly_less(avg_max_sv_distance1, avg_max_sv_distance2)
-                    if not isclose(
-                        avg_max_sv_distance1,
-                        avg_max_sv_distance2,
-                        rel_tol=self.margin_fraction,
-                    )
-                    else 0
+                self._average_max_subject_verb_distance(doc)
+                for doc in tqdm(
+                    docs,
+                    total=len(outputs),
+                    desc="Calculate S-V distances",
+                    unit="output",
                 )
-                for avg_max_sv_distance1 in avg_max_sv_distances
-                for avg_max_sv_distance2 in avg_max_sv_distances
             ],
             dtype=float_,
-        ).reshape((len(outputs), len(outputs)))
+        )
 
 
 COH2: Final = lazy_inject(SubjectVerbClosenessCoherenceAxiom)
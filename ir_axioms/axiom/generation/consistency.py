@@ -11,7 +11,7 @@ from dataclasses import dataclass
 from functools import cached_property
 from itertools import chain
 from math import isclose, nan
-from typing import Final, Union, Sequence, Any, Iterable
+from typing import ClassVar, Final, Union, Sequence, Any, Iterable
 
 from injector import inject, NoInject
 from negspacy.negation import Negex  # noqa: F401  # Ignore the unused import warning, since the import is needed to add it as a spaCy pipeline.
@@ -25,7 +25,8 @@ from spacy.language import Language
 from tqdm.auto import tqdm
 
 from ir_axioms.axiom.base import Axiom
-from ir_axioms.axiom.utils import strictly_greater, strictly_less
+from ir_axioms.axiom.score import ScoreAxiom
+from ir_axioms.axiom.utils import strictly_greater
 from ir_axioms.model.base import Preference, PreferenceMatrix
 from ir_axioms.model.generation import GenerationInput, GenerationOutput
 from ir_axioms.tools import (
@@ -109,9 +110,8 @@ class AspectSimilaritySentenceCountConsistencyAxiom(
         if len(context_aspects) == 0:
             return zeros((len(outputs), len(outputs)))
 
-        sentences = (
-            self.sentence_tokenizer.sentences(self.text_contents.contents(output))
-            for output in outputs
+        sentences = self.sentence_tokenizer.sentences_batch(
+            [self.text_contents.contents(output) for output in outputs]
         )
 
         similarities = (
@@ -154,7 +154,7 @@ CONS1: Final = lazy_inject(AspectSimilaritySentenceCountConsistencyAxiom)
 
 @inject
 @dataclass(frozen=True, kw_only=True)
-class RougeConsistencyAxiom(Axiom[GenerationInput, GenerationOutput]):
+class RougeConsistencyAxiom(ScoreAxiom[GenerationInput, GenerationOutput]):
     """
     Prefer text with higher ROUGE score compared to the input contexts.
     """
@@ -173,83 +173,45 @@ class RougeConsistencyAxiom(Axiom[GenerationInput, GenerationOutput]):
             split_summaries=True,
         )
 
-    def preference(
+    def _rouge_l_sum(self, context: str, contents: str) -> float:
+        rouge: dict[str, Score] = self._rouge_scorer.score(
+            target=context,
+            prediction=contents,
+        )
+        return rouge["rougeLsum"].fmeasure
+
+    def score(
         self,
         input: GenerationInput,
-        output1: GenerationOutput,
-        output2: GenerationOutput,
-    ) -> Preference:
+        output: GenerationOutput,
+    ) -> float:
         if input.context is None:
             return 0
-
         context = "\n\n".join(input.context)
+        return self._rouge_l_sum(context, self.text_contents.contents(output))
 
-        contents1 = self.text_contents.contents(output1)
-        contents2 = self.text_contents.contents(output2)
-
-        rouge1: dict[str, Score] = self._rouge_scorer.score(
-            target=context,
-            prediction=contents1,
-        )
-        rouge2: dict[str, Score] = self._rouge_scorer.score(
-            target=context,
-            prediction=contents2,
-        )
-        rouge_l_sum1 = rouge1["rougeLsum"].fmeasure
-        rouge_l_sum2 = rouge2["rougeLsum"].fmeasure
-
-        if isclose(
-            rouge_l_sum1,
-            rouge_l_sum2,
-            rel_tol=self.margin_fraction,
-        ):
-            return 0
-        return strictly_greater(rouge_l_sum1, rouge_l_sum2)
-
-    def preferences(
+    def scores(
         self,
         input: GenerationInput,
         outputs: Sequence[GenerationOutput],
-    ) -> PreferenceMatrix:
+    ) -> NDArray[float_]:
         if input.context is None:
-            return zeros((len(outputs), len(outputs)))
+            return zeros(len(outputs))
 
         context = "\n\n".join(input.context)
-
         contents = (self.text_contents.contents(output) for output in outputs)
-
-        rouges: Iterable[dict[str, Score]] = (
-            self._rouge_scorer.score(
-                target=context,
-                prediction=content,
-            )
-            for content in tqdm(
-                contents,
-                desc="Compute ROUGE",
-                total=len(outputs),
-                unit="output",
-            )
-        )
-        rouge_l_sums = [rouge["rougeLsum"].fmeasure for rouge in rouges]
-
-        print(rouge_l_sums)
-
         return array(
             [
-                (
-                    strictly_greater(rouge_l_sum1, rouge_l_sum2)
-                    if not isclose(
-                        rouge_l_sum1,
-                        rouge_l_sum2,
-                        rel_tol=self.margin_fraction,
-                    )
-                    else 0
+                self._rouge_l_sum(context, content)
+                for content in tqdm(
+                    contents,
+                    desc="Compute ROUGE",
+                    total=len(outputs),
+                    unit="output",
                 )
-                for rouge_l_sum1 in rouge_l_sums
-                for rouge_l_sum2 in rouge_l_sums
             ],
             dtype=float_,
-        ).reshape((len(outputs), len(outputs)))
+        )
 
 
 CONS2: Final = lazy_inject(RougeConsistencyAxiom)
@@ -257,16 +219,22 @@ CONS2: Final = lazy_inject(RougeConsistencyAxiom)
 
 @inject
 @dataclass(frozen=True, kw_only=True)
-class EntityContradictionConsistencyAxiom(Axiom[Any, GenerationOutput]):
+class EntityContradictionConsistencyAxiom(ScoreAxiom[Any, GenerationOutput]):
     """
     Prefer text with entities less frequently mentioned in contradictory phrases.
     """
 
+    prefer_greater: ClassVar[bool] = False
+
     text_contents: TextContents[GenerationOutput]
 
     language_name: NoInject[str] = "en_core_web_sm"
     margin_fraction: NoInject[float] = 0.2
 
+    @property
+    def input_dependent(self) -> bool:
+        return False
+
     # TODO: Migrate to tool injected by DI.
     @cached_property
     def _language(self) -> Language:
@@ -313,54 +281,29 @@ class EntityContradictionConsistencyAxiom(Axiom[Any, GenerationOutput]):
         num_entities = sum(1 for _ in document.ents)
         return num_contradictions / num_entities if num_entities != 0 else nan
 
-    def preference(
+    def score(
         self,
         input: Any,
-        output1: GenerationOutput,
-        output2: GenerationOutput,
-    ) -> Preference:
-        contents1 = self.text_contents.contents(output1)
-        contents2 = self.text_contents.contents(output2)
-        contradictions1 = self._contradictions_ratio(contents1)
-        contradictions2 = self._contradictions_ratio(contents2)
-        if isclose(
-            contradictions1,
-            contradictions2,
-            rel_tol=self.margin_fraction,
-        ):
-            return 0
-        return strictly_less(contradictions1, contradictions2)
+        output: GenerationOutput,
+    ) -> float:
+        return self._contradictions_ratio(self.text_contents.contents(output))
 
-    def preferences(
+    def scores(
         self,
         input: Any,
         outputs: Sequence[GenerationOutput],
-    ) -> PreferenceMatrix:
-        contents = (
-            self.text_contents.contents(output)
-            for output in tqdm(
-                outputs,
-                desc="Count contradictions",
-                unit="output",
-            )
-        )
-        contradictions = [self._contradictions_ratio(content) for content in contents]
+    ) -> NDArray[float_]:
         return array(
             [
-                (
-                    strictly_less(contradictions1, contradictions2)
-                    if not isclose(
-                        contradictions1,
-                        contradictions2,
-                        rel_tol=self.margin_fraction,
-                    )
-                    else 0
+                self.score(input, output)
+                for output in tqdm(
+                    outputs,
+                    desc="Count contradictions",
+                    unit="output",
                 )
-                for contradictions1 in contradictions
-                for contradictions2 in contradictions
             ],
             dtype=float_,
-        ).reshape((len(outputs), len(outputs)))
+        )
 
 
 CONS3: Final = lazy_inject(EntityContradictionConsistencyAxiom)
@@ -16,17 +16,15 @@ within the scope of the user's information need?
 # - [ ] Topical relevance/alignment (-> use retrieval axioms?)
 
 from dataclasses import dataclass
-from math import isclose
 from re import compile as re_compile
-from typing import Final, Sequence, Any
+from typing import ClassVar, Final, Sequence, Any
 
 from injector import inject, NoInject
 from numpy import array, float_
+from numpy.typing import NDArray
 from tqdm.auto import tqdm
 
-from ir_axioms.axiom.base import Axiom
-from ir_axioms.axiom.utils import strictly_less
-from ir_axioms.model.base import Preference, PreferenceMatrix
+from ir_axioms.axiom.score import ScoreAxiom
 from ir_axioms.model.generation import GenerationOutput
 from ir_axioms.tools import (
     TextContents,
@@ -44,89 +42,57 @@ _PATTERN_CITATION: Final = re_compile(r"\[[0-9]+\]")
 
 @inject
 @dataclass(frozen=True, kw_only=True)
-class CitationSentenceCorrectnessAxiom(Axiom[Any, GenerationOutput]):
+class CitationSentenceCorrectnessAxiom(ScoreAxiom[Any, GenerationOutput]):
     """
     Prefer text with more sentences containing citations.
     """
 
+    prefer_greater: ClassVar[bool] = False
+
     text_contents: TextContents[GenerationOutput]
     sentence_tokenizer: SentenceTokenizer
 
     margin_fraction: NoInject[float] = 0.1
 
-    def preference(
+    @property
+    def input_dependent(self) -> bool:
+        return False
+
+    @staticmethod
+    def _citation_proportion(sentences: Sequence[str]) -> float:
+        contains_citation = array(
+            [_PATTERN_CITATION.search(sentence) is not None for sentence in sentences]
+        )
+        return contains_citation.mean()
+
+    def score(
         self,
         input: Any,
-        output1: GenerationOutput,
-        output2: GenerationOutput,
-    ) -> Preference:
-        contains_citation1 = array(
-            [
-                _PATTERN_CITATION.search(sentence) is not None
-                for sentence in self.sentence_tokenizer.sentences(
-                    self.text_contents.contents(output1)
-                )
-            ]
-        )
-        contains_citation2 = array(
-            [
-                _PATTERN_CITATION.search(sentence) is not None
-                for sentence in self.sentence_tokenizer.sentences(
-                    self.text_contents.contents(output2)
-                )
-            ]
+        output: GenerationOutput,
+    ) -> float:
+        return self._citation_proportion(
+            self.sentence_tokenizer.sentences(self.text_contents.contents(output))
         )
 
-        citation_coverage1 = contains_citation1.mean()
-        citation_coverage2 = contains_citation2.mean()
-
-        if isclose(
-            citation_coverage1,
-            citation_coverage2,
-            rel_tol=self.margin_fraction,
-        ):
-            return 0
-        return strictly_less(citation_coverage1, citation_coverage2)
-
-    def preferences(
+    def scores(
         self,
         input: Any,
         outputs: Sequence[GenerationOutput],
-    ) -> PreferenceMatrix:
-        contains_citation = (
-            array(
-                [
-                    _PATTERN_CITATION.search(sentence) is not None
-                    for sentence in self.sentence_tokenizer.sentences(
-                        self.text_contents.contents(output)
-                    )
-                ]
-            )
-            for output in tqdm(
-                outputs,
-                desc="Find citations",
-                unit="output",
-            )
+    ) -> NDArray[float_]:
+        outputs_sentences = self.sentence_tokenizer.sentences_batch(
+            [self.text_contents.contents(output) for output in outputs]
         )
-        citation_coverages = [
-            contains_citation.mean() for contains_citation in contains_citation
-        ]
         return array(
             [
-                (
-                    strictly_less(citation_coverage1, citation_coverage2)
-                    if not isclose(
-                        citation_coverage1,
-                        citation_coverage2,
-                        rel_tol=self.margin_fraction,
-                    )
-                    else 0
+                self._citation_proportion(sentences)
+                for sentences in tqdm(
+                    outputs_sentences,
+                    desc="Find citations",
+                    unit="output",
                 )
-                for citation_coverage1 in citation_coverages
-                for citation_coverage2 in citation_coverages
             ],
             dtype=float_,
-        ).reshape((len(outputs), len(outputs)))
+        )
 
 
 CORR1: Final = lazy_inject(CitationSentenceCorrectnessAxiom)
@@ -8,17 +8,14 @@ For a definition of this utility dimension, see: https://doi.org/10.1145/3626772
 """
 
 from dataclasses import dataclass
-from math import isclose
-from typing import Final, Union, Sequence, Any, Iterable
+from typing import AbstractSet, ClassVar, Final, Union, Sequence, Any, Iterable
 
 from injector import inject, NoInject
 from numpy import array, float_, zeros
 from numpy.typing import NDArray
 from tqdm.auto import tqdm
 
-from ir_axioms.axiom.base import Axiom
-from ir_axioms.axiom.utils import strictly_greater, strictly_less
-from ir_axioms.model.base import Preference, PreferenceMatrix
+from ir_axioms.axiom.score import ScoreAxiom
 from ir_axioms.model.generation import GenerationInput, GenerationOutput
 from ir_axioms.tools import (
     TextContents,
@@ -31,7 +28,7 @@ from ir_axioms.utils.lazy import lazy_inject
 
 @inject
 @dataclass(frozen=True, kw_only=True)
-class AspectCountCoverageAxiom(Axiom[Any, GenerationOutput]):
+class AspectCountCoverageAxiom(ScoreAxiom[Any, GenerationOutput]):
     """
     Prefer text with more distinct extracted aspects.
     """
@@ -41,62 +38,35 @@ class AspectCountCoverageAxiom(Axiom[Any, GenerationOutput]):
 
     margin_fraction: NoInject[float] = 0.0
 
-    def preference(
+    @property
+    def input_dependent(self) -> bool:
+        return False
+
+    def score(
         self,
         input: Any,
-        output1: GenerationOutput,
-        output2: GenerationOutput,
-    ) -> Preference:
-        aspects1 = self.aspect_extraction.aspects(
-            self.text_contents.contents(output1),
-        )
-        aspects2 = self.aspect_extraction.aspects(
-            self.text_contents.contents(output2),
-        )
+        output: GenerationOutput,
+    ) -> float:
+        return len(self.aspect_extraction.aspects(self.text_contents.contents(output)))
 
-        count1 = len(aspects1)
-        count2 = len(aspects2)
-        if isclose(
-            count1,
-            count2,
-            rel_tol=self.margin_fraction,
-        ):
-            return 0
-        return strictly_greater(count1, count2)
-
-    def preferences(
+    def scores(
         self,
         input: Any,
         outputs: Sequence[GenerationOutput],
-    ) -> PreferenceMatrix:
+    ) -> NDArray[float_]:
         contents = (self.text_contents.contents(output) for output in outputs)
         aspects = self.aspect_extraction.iter_aspects(contents)
-
-        counts = [
-            len(aspects)
-            for aspects in tqdm(
-                aspects,
-                desc="Extract aspects",
-                total=len(outputs),
-            )
-        ]
-
         return array(
             [
-                (
-                    strictly_greater(count1, count2)
-                    if not isclose(
-                        count1,
-                        count2,
-                        rel_tol=self.margin_fraction,
-                    )
-                    else 0
+                len(aspects)
+                for aspects in tqdm(
+                    aspects,
+                    desc="Extract aspects",
+                    total=len(outputs),
                 )
-                for count1 in counts
-                for count2 in counts
             ],
             dtype=float_,
-        ).reshape((len(outputs), len(outputs)))
+        )
 
 
 COV1: Final = lazy_inject(AspectCountCoverageAxiom)
@@ -104,76 +74,55 @@ COV1: Final = lazy_inject(AspectCountCoverageAxiom)
 
 @inject
 @dataclass(frozen=True, kw_only=True)
-class AspectRedundancyCoverageAxiom(Axiom[Any, GenerationOutput]):
+class AspectRedundancyCoverageAxiom(ScoreAxiom[Any, GenerationOutput]):
     """
     Prefer text that has less redundant extracted aspects according to sentence similarity between the aspects.
     """
 
+    prefer_greater: ClassVar[bool] = False
+
     text_contents: TextContents[GenerationOutput]
     aspect_extraction: AspectExtraction
     sentence_similarity: SentenceSimilarity
 
     margin_fraction: NoInject[float] = 0.2
 
-    def preference(
+    @property
+    def input_dependent(self) -> bool:
+        return False
+
+    def _aggregate_similarity(self, aspects: Iterable[str]) -> float:
+        similarities = self.sentence_similarity.self_similarities(list(aspects))
+        # TODO: Make aggregation configurable.
+        return similarities.mean()
+
+    def score(
         self,
         input: Any,
-        output1: GenerationOutput,
-        output2: GenerationOutput,
-    ) -> Preference:
-        aspects1 = self.aspect_extraction.aspects(
-            self.text_contents.contents(output1),
-        )
-        aspects2 = self.aspect_extraction.aspects(
-            self.text_contents.contents(output2),
+        output: GenerationOutput,
+    ) -> float:
+        return self._aggregate_similarity(
+            self.aspect_extraction.aspects(self.text_contents.contents(output))
         )
 
-        similarities1 = self.sentence_similarity.self_similarities(list(aspects1))
-        similarities2 = self.sentence_similarity.self_similarities(list(aspects2))
-
-        # TODO: Make aggregation configurable.
-        aggregate_similarity1 = similarities1.mean()
-        aggregate_similarity2 = similarities2.mean()
-        if isclose(
-            aggregate_similarity1,
-            aggregate_similarity2,
-            rel_tol=self.margin_fraction,
-        ):
-            return 0
-        return strictly_less(aggregate_similarity1, aggregate_similarity2)
-
-    def preferences(
+    def scores(
         self,
         input: Any,
         outputs: Sequence[GenerationOutput],
-    ) -> PreferenceMatrix:
+    ) -> NDArray[float_]:
         contents = (self.text_contents.contents(output) for output in outputs)
         aspects = self.aspect_extraction.iter_aspects(contents)
-        similarities = (
-            self.sentence_similarity.self_similarities(list(aspects))
-            for aspects in tqdm(
-                aspects,
-                desc="Extract aspects",
-                total=len(outputs),
-            )
-        )
-        aggregate_similarities = [similarities.mean() for similarities in similarities]
         return array(
             [
-                (
-                    strictly_less(aggregate_similarity1, aggregate_similarity2)
-                    if not isclose(
-                        aggregate_similarity1,
-                        aggregate_similarity2,
-                        rel_tol=self.margin_fraction,
-                    )
-                    else 0
+                self._aggregate_similarity(aspects)
+                for aspects in tqdm(
+                    aspects,
+                    desc="Extract aspects",
+                    total=len(outputs),
                 )
-                for aggregate_similarity1 in aggregate_similarities
-                for aggregate_similarity2 in aggregate_similarities
             ],
             dtype=float_,
-        ).reshape((len(outputs), len(outputs)))
+        )
 
 
 COV2: Final = lazy_inject(AspectRedundancyCoverageAxiom)
@@ -182,7 +131,7 @@ COV2: Final = lazy_inject(AspectRedundancyCoverageAxiom)
 @inject
 @dataclass(frozen=True, kw_only=True)
 class AspectSimilaritySentenceCountCoverageAxiom(
-    Axiom[GenerationInput, GenerationOutput]
+    ScoreAxiom[GenerationInput, GenerationOutput]
 ):
     """
     Prefer text with extracted aspects from the input text mentioned in more sentences of the output, weighing by the sentence's similarity to the aspects.
@@ -195,95 +144,58 @@ class AspectSimilaritySentenceCountCoverageAxiom(
 
     margin_fraction: NoInject[float] = 0.5
 
-    def preference(
+    def _sentence_count(
+        self,
+        input_aspects: AbstractSet[str],
+        sentences: Sequence[str],
+    ) -> float:
+        if len(input_aspects) == 0:
+            return 0
+        similarities = self.sentence_similarity.paired_similarities(
+            list(sentences), list(input_aspects)
+        )
+        sentence_weights: NDArray[float_] = similarities.mean(axis=1)
+        return sentence_weights.sum()
+
+    def score(
         self,
         input: GenerationInput,
-        output1: GenerationOutput,
-        output2: GenerationOutput,
-    ) -> Preference:
+        output: GenerationOutput,
+    ) -> float:
         input_aspects = self.aspect_extraction.aspects(
             self.text_contents.contents(input)
         )
         if len(input_aspects) == 0:
             return 0
-
-        sentences1 = self.sentence_tokenizer.sentences(
-            self.text_contents.contents(output1)
-        )
-        sentences2 = self.sentence_tokenizer.sentences(
-            self.text_contents.contents(output2)
+        sentences = self.sentence_tokenizer.sentences(
+            self.text_contents.contents(output)
         )
+        return self._sentence_count(input_aspects, sentences)
 
-        similarities1 = self.sentence_similarity.paired_similarities(
-            list(sentences1), list(input_aspects)
-        )
-        similarities2 = self.sentence_similarity.paired_similarities(
-            list(sentences2), list(input_aspects)
-        )
-
-        sentence_weights1: NDArray[float_] = similarities1.mean(axis=1)
-        sentence_weights2: NDArray[float_] = similarities2.mean(axis=1)
-
-        sentence_counts1 = sentence_weights1.sum()
-        sentence_counts2 = sentence_weights2.sum()
-
-        if isclose(
-            sentence_counts1,
-            sentence_counts2,
-            rel_tol=self.margin_fraction,
-        ):
-            return 0
-        return strictly_greater(sentence_counts1, sentence_counts2)
-
-    def preferences(
+    def scores(
         self,
         input: GenerationInput,
         outputs: Sequence[GenerationOutput],
-    ) -> PreferenceMatrix:
+    ) -> NDArray[float_]:
         input_aspects = self.aspect_extraction.aspects(
             self.text_contents.contents(input)
         )
         if len(input_aspects) == 0:
-            return zeros((len(outputs), len(outputs)))
-
-        sentences = (
-            self.sentence_tokenizer.sentences(self.text_contents.contents(output))
-            for output in outputs
-        )
-
-        similarities = (
-            self.sentence_similarity.paired_similarities(
-                list(sentences), list(input_aspects)
-            )
-            for sentences in tqdm(
-                sentences,
-                desc="Aspect-sentence similarities",
-                total=len(outputs),
-            )
+            return zeros(len(outputs), dtype=float_)
+        outputs_sentences = self.sentence_tokenizer.sentences_batch(
+            [self.text_contents.contents(output) for output in outputs]
         )
-
-        sentence_weights: Iterable[NDArray[float_]] = (
-            weights.mean(axis=1) for weights in similarities
-        )
-
-        sentence_counts = [weights.sum() for weights in sentence_weights]
-
         return array(
             [
-                (
-                    strictly_greater(sentence_count1, sentence_count2)
-                    if not isclose(
-                        sentence_count1,
-                        sentence_count2,
-                        rel_tol=self.margin_fraction,
-                    )
-                    else 0
+                self._sentence_count(input_aspects, sentences)
+                for sentences in tqdm(
+                    outputs_sentences,
+                    desc="Aspect-sentence similarities",
+                    total=len(outputs),
                 )
-                for sentence_count1 in sentence_counts
-                for sentence_count2 in sentence_counts
             ],
             dtype=float_,
-        ).reshape((len(outputs), len(outputs)))
+        )
 
 
 COV3: Final = lazy_inject(AspectSimilaritySentenceCountCoverageAxiom)
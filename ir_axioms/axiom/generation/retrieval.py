@@ -42,6 +42,14 @@ from ir_axioms.utils.lazy import lazy_inject
 class _RetrievalAxiomWrapper(Axiom[GenerationInput, GenerationOutput]):
     axiom: Axiom[Query, Document]
 
+    @property
+    def antisymmetric(self) -> bool:
+        return self.axiom.antisymmetric
+
+    @property
+    def input_dependent(self) -> bool:
+        return self.axiom.input_dependent
+
     def preference(
         self,
         input: GenerationInput,
@@ -1,8 +1,24 @@
+from contextvars import copy_context
 from dataclasses import dataclass
-from typing import Generic, Optional, Sequence
+from functools import cached_property
+from math import ceil, isqrt
+from typing import Any, Dict, Generic, Iterator, Literal, Optional, Sequence, Tuple
+from weakref import finalize
 
-from joblib import Parallel, delayed
-from numpy import array
+from joblib import Parallel, delayed, effective_n_jobs
+from numpy import (
+    arange,
+    array_split,
+    asarray,
+    bool_,
+    concatenate,
+    float_,
+    int_,
+    ix_,
+    ones,
+    zeros,
+)
+from numpy.typing import NDArray
 
 from ir_axioms.axiom.base import Axiom
 from ir_axioms.model import (
@@ -13,10 +29,156 @@ from ir_axioms.model import (
 )
 
 
+def _tile_preferences(
+    axiom: Axiom[Input, Output],
+    input: Input,
+    outputs: Sequence[Output],
+    mask: NDArray[bool_],
+) -> PreferenceMatrix:
+    return axiom.masked_preferences(input, outputs, mask)
+
+
+def _close_parallel(parallel: Parallel) -> None:
+    parallel.__exit__(None, None, None)
+
+
+@dataclass(frozen=True)
+class _Tile:
+    rows: NDArray[int_]
+    columns: NDArray[int_]
+    diagonal: bool
+    mask: NDArray[bool_]
+    square: bool = False
+    """
+    Whether all blocks of the tile's preference matrix are used, not only the block of the rows and columns.
+    """
+
+    @property
+    def indices(self) -> NDArray[int_]:
+        if self.diagonal:
+            return self.rows
+        return concatenate([self.rows, self.columns])
+
+
 @dataclass(frozen=True, kw_only=True)
 class ParallelAxiom(Axiom[Input, Output], Generic[Input, Output]):
+    """
+    Axiom that computes the wrapped axiom's preferences in parallel.
+
+    The preference matrix is split into square tiles of outputs, and each tile is computed in a single task with the wrapped axiom's batched ``masked_preferences()``, such that the dispatch overhead is amortized over many pairs.
+    For antisymmetric axioms, only the tiles on and above the diagonal are computed.
+    Axioms that batch-compute the full preference matrix of a tile's outputs anyway (i.e., that only override ``preferences()``) instead compute one task per pair of blocks of outputs, and all four blocks of the task's matrix are used.
+    The worker pool is kept open and re-used across calls (e.g., for many queries) until the axiom is closed.
+    """
+
     axiom: Axiom[Input, Output]
     n_jobs: Optional[int] = None
+    """
+    Number of parallel workers (e.g., ``-1`` for all CPUs), or ``None`` to use joblib's default.
+    """
+    prefer: Literal["threads", "processes"] = "processes"
+    """
+    Whether to compute the tiles in a process pool or in a thread pool (e.g., for axioms waiting on I/O, the JVM, or native code).
+    Only threads share the active analysis session.
+    """
+    tile_size: Optional[int] = None
+    """
+    Number of outputs per side of each tile, or ``None`` to adapt the tile size to the number of outputs and workers.
+    """
+    tiles_per_worker: int = 4
+    """
+    Number of tiles to schedule per worker if the tile size is adapted, such that idle workers can pick up the remaining tiles.
+    """
+    min_tile_size: int = 8
+    """
+    Minimum number of outputs per side of each tile if the tile size is adapted, such that cheap axioms are not split into too many tasks.
+    """
+
+    @property
+    def antisymmetric(self) -> bool:
+        return self.axiom.antisymmetric
+
+    @property
+    def input_dependent(self) -> bool:
+        return self.axiom.input_dependent
+
+    @cached_property
+    def _pool(self) -> Tuple[Parallel, finalize]:
+        parallel = Parallel(n_jobs=self.n_jobs, prefer=self.prefer)
+        parallel.__enter__()
+        return parallel, finalize(self, _close_parallel, parallel)
+
+    def _tile_size(self, num_outputs: int) -> int:
+        if self.tile_size is not None:
+            return max(1, self.tile_size)
+        num_tiles = effective_n_jobs(self.n_jobs) * self.tiles_per_worker
+        # Antisymmetric axioms (and full matrix tiles) only need about half of the tiles.
+        num_blocks = (
+            isqrt(2 * num_tiles)
+            if self.antisymmetric or self._full_matrix_tiles
+            else isqrt(num_tiles)
+        )
+        return max(self.min_tile_size, ceil(num_outputs / max(1, num_blocks)))
+
+    @property
+    def _full_matrix_tiles(self) -> bool:
+        # The default masked preferences compute the full matrix of overridden batched preferences.
+        return (
+            type(self.axiom).preferences is not Axiom.preferences
+            and type(self.axiom).masked_preferences is Axiom.masked_preferences
+        )
+
+    def _square_tiles(
+        self,
+        mask: NDArray[bool_],
+        blocks: Sequence[NDArray[int_]],
+    ) -> Iterator[_Tile]:
+        covered = [False] * len(blocks)
+        for index1, rows in enumerate(blocks):
+            for index2 in range(index1 + 1, len(blocks)):
+                columns = blocks[index2]
+                indices = concatenate([rows, columns])
+                tile_mask = mask[ix_(indices, indices)]
+                if tile_mask.any():
+                    covered[index1] = covered[index2] = True
+                    yield _Tile(
+                        rows=rows,
+                        columns=columns,
+                        diagonal=False,
+                        mask=tile_mask,
+                        square=True,
+                    )
+        # Blocks without any masked pairs to other blocks.
+        for index, rows in enumerate(blocks):
+            tile_mask = mask[ix_(rows, rows)]
+            if not covered[index] and tile_mask.any():
+                yield _Tile(rows=rows, columns=rows, diagonal=True, mask=tile_mask)
+
+    def _tiles(self, mask: NDArray[bool_]) -> Iterator[_Tile]:
+        num_outputs = len(mask)
+        num_blocks = ceil(num_outputs / self._tile_size(num_outputs))
+        blocks = array_split(arange(num_outputs), num_blocks)
+        if self._full_matrix_tiles:
+            yield from self._square_tiles(mask, blocks)
+            return
+        for index1, rows in enumerate(blocks):
+            for index2, columns in enumerate(blocks):
+                if self.antisymmetric and index2 < index1:
+                    # Mirrored from the tile above the diagonal.
+                    continue
+                if index1 == index2:
+                    tile_mask = mask[ix_(rows, rows)]
+                else:
+                    size = len(rows) + len(columns)
+                    tile_mask = zeros((size, size), dtype=bool_)
+                    tile_mask[: len(rows), len(rows) :] = mask[ix_(rows, columns)]
+                if tile_mask.any():
+                    yield _Tile(
+                        rows=rows,
+                        columns=columns,
+                        diagonal=index1 == index2,
+                        mask=tile_mask,
+                    )
 
     def preference(
         self,
@@ -31,23 +193,74 @@ class ParallelAxiom(Axiom[Input, Output], Generic[Input, Output]):
         input: Input,
         outputs: Sequence[Output],
     ) -> PreferenceMatrix:
+        return self.masked_preferences(
+            input=input,
+            outputs=outputs,
+            mask=ones((len(outputs), len(outputs)), dtype=bool_),
+        )
 
-        @delayed
-        def _preference(
-            output1: Output,
-            output2: Output,
-        ) -> float:
-            return self.preference(
-                input=input,
-                output1=output1,
-                output2=output2,
-            )
+    def masked_preferences(
+        self,
+        input: Input,
+        outputs: Sequence[Output],
+        mask: NDArray[bool_],
+    ) -> PreferenceMatrix:
+        mask = asarray(mask, dtype=bool_)
+        if effective_n_jobs(self.n_jobs) == 1 or not mask.any():
+            return self.axiom.masked_preferences(input, outputs, mask)
+
+        # Each unordered pair of an antisymmetric axiom is computed in the tile above the diagonal.
+        tiles = list(self._tiles(mask | mask.T if self.antisymmetric else mask))
 
-        with Parallel(n_jobs=self.n_jobs) as parallel:
-            preferences: Sequence[float] = parallel(
-                _preference(output1, output2)
-                for output1 in outputs
-                for output2 in outputs
+        def _task(tile: _Tile) -> Any:
+            tile_outputs = [outputs[index] for index in tile.indices]
+            if self.prefer == "threads":
+                # Threads do not inherit context variables (e.g., the active analysis session),
+                # so compute each tile in a copy of the current context.
+                return delayed(copy_context().run)(
+                    _tile_preferences, self.axiom, input, tile_outputs, tile.mask
+                )
+            return delayed(_tile_preferences)(
+                self.axiom, input, tile_outputs, tile.mask
             )
 
-        return array(preferences).reshape(len(outputs), len(outputs))
+        parallel, _ = self._pool
+        tiles_preferences: Sequence[PreferenceMatrix] = parallel(
+            _task(tile) for tile in tiles
+        )
+
+        preferences = zeros(mask.shape, dtype=float_)
+        for tile, tile_preferences in zip(tiles, tiles_preferences):
+            if tile.diagonal:
+                preferences[ix_(tile.rows, tile.rows)] = tile_preferences
+                continue
+            if tile.square:
+                preferences[ix_(tile.indices, tile.indices)] = tile_preferences
+                continue
+            block = tile_preferences[: len(tile.rows), len(tile.rows) :]
+            preferences[ix_(tile.rows, tile.columns)] = block
+            if self.antisymmetric:
+                preferences[ix_(tile.columns, tile.rows)] = -block.T
+        preferences[~mask] = 0
+        return preferences
+
+    def close(self) -> None:
+        """
+        Shut down the worker pool. It is re-opened on the next access.
+        """
+        pool: Optional[Tuple[Parallel, finalize]] = self.__dict__.pop("_pool", None)
+        if pool is not None:
+            _, finalizer = pool
+            finalizer()
+
+    def __enter__(self) -> "ParallelAxiom[Input, Output]":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Worker pools cannot be shared with other processes.
+        state = dict(self.__dict__)
+        state.pop("_pool", None)
+        return state
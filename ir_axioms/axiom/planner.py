@@ -0,0 +1,183 @@
+from collections import Counter
+from dataclasses import dataclass, replace
+from typing import Dict, Hashable, Optional, Sequence
+
+from numpy import bool_, where
+from numpy.typing import NDArray
+
+from ir_axioms.axiom.arithmetic import (
+    CascadeAxiom,
+    ConjunctionAxiom,
+    MultiplicativeInverseAxiom,
+    NormalizedAxiom,
+    ProductAxiom,
+    SumAxiom,
+    UniformAxiom,
+    VoteAxiom,
+)
+from ir_axioms.axiom.base import Axiom
+from ir_axioms.model import Input, Output, Preference, PreferenceMatrix
+from ir_axioms.tools.analysis.session import analysis_key, memoize_analysis
+
+_CompositeAxiom = (
+    SumAxiom,
+    ProductAxiom,
+    ConjunctionAxiom,
+    VoteAxiom,
+    CascadeAxiom,
+)
+_WrapperAxiom = (
+    NormalizedAxiom,
+    MultiplicativeInverseAxiom,
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class SharedAxiom(Axiom[Input, Output]):
+    """
+    Axiom whose preferences are computed at most once per input and outputs within an analysis session, and then shared by all occurrences of the axiom.
+    Use ``plan_axioms()`` to insert shared axioms for common subexpressions of many axioms.
+    """
+
+    axiom: Axiom[Input, Output]
+    key: str
+    """
+    Key of the axiom's configuration, i.e., equal for all occurrences of the same axiom.
+    """
+
+    @property
+    def antisymmetric(self) -> bool:
+        return self.axiom.antisymmetric
+
+    @property
+    def input_dependent(self) -> bool:
+        return self.axiom.input_dependent
+
+    def _input_key(self, input: Input) -> Optional[Hashable]:
+        # Input-independent axioms share their preferences across all inputs.
+        if not self.input_dependent:
+            return ()
+        return analysis_key(input)
+
+    def preference(
+        self,
+        input: Input,
+        output1: Output,
+        output2: Output,
+    ) -> Preference:
+        input_key = self._input_key(input)
+        output1_key = analysis_key(output1)
+        output2_key = analysis_key(output2)
+        if input_key is None or output1_key is None or output2_key is None:
+            return self.axiom.preference(input, output1, output2)
+        return memoize_analysis(
+            "shared_axiom_preference",
+            (self.key, input_key, output1_key, output2_key),
+            lambda: self.axiom.preference(input, output1, output2),
+        )
+
+    def _preferences_key(
+        self,
+        input: Input,
+        outputs: Sequence[Output],
+    ) -> Optional[Hashable]:
+        input_key = self._input_key(input)
+        if input_key is None:
+            return None
+        outputs_keys = tuple(analysis_key(output) for output in outputs)
+        if any(output_key is None for output_key in outputs_keys):
+            return None
+        return (self.key, input_key, outputs_keys)
+
+    def preferences(
+        self,
+        input: Input,
+        outputs: Sequence[Output],
+    ) -> PreferenceMatrix:
+        key = self._preferences_key(input, outputs)
+        if key is None:
+            return self.axiom.preferences(input, outputs)
+        preferences = memoize_analysis(
+            "shared_axiom_preferences",
+            key,
+            lambda: self.axiom.preferences(input, outputs),
+        )
+        # Copy, as some combinators modify their child's preferences in-place.
+        return preferences.copy()
+
+    def masked_preferences(
+        self,
+        input: Input,
+        outputs: Sequence[Output],
+        mask: NDArray[bool_],
+    ) -> PreferenceMatrix:
+        if self._preferences_key(input, outputs) is None:
+            return self.axiom.masked_preferences(input, outputs, mask)
+        # Compute the full matrix once, as other occurrences may need other entries.
+        return where(mask, self.preferences(input, outputs), 0)
+
+
+def _children(axiom: Axiom) -> Sequence[Axiom]:
+    if isinstance(axiom, _CompositeAxiom):
+        return list(axiom.axioms)
+    elif isinstance(axiom, _WrapperAxiom):
+        return [axiom.axiom]
+    else:
+        return []
+
+
+def _count_subexpressions(axiom: Axiom, counts: Counter) -> None:
+    counts[repr(axiom)] += 1
+    for child in _children(axiom):
+        _count_subexpressions(child, counts)
+
+
+def _plan(
+    axiom: Axiom,
+    counts: Counter,
+    shared_axioms: Dict[str, SharedAxiom],
+) -> Axiom:
+    if isinstance(axiom, SharedAxiom):
+        return axiom
+
+    key = repr(axiom)
+    if key in shared_axioms:
+        return shared_axioms[key]
+
+    if isinstance(axiom, _CompositeAxiom):
+        axiom = replace(
+            axiom,
+            axioms=[_plan(child, counts, shared_axioms) for child in axiom.axioms],
+        )
+    elif isinstance(axiom, _WrapperAxiom):
+        axiom = replace(
+            axiom,
+            axiom=_plan(axiom.axiom, counts, shared_axioms),
+        )
+
+    # Constant axioms are cheaper to compute than to share.
+    if counts[key] < 2 or isinstance(axiom, UniformAxiom):
+        return axiom
+    shared_axiom = SharedAxiom(axiom=axiom, key=key)
+    shared_axioms[key] = shared_axiom
+    return shared_axiom
+
+
+def plan_axioms(
+    axioms: Sequence[Axiom[Input, Output]],
+) -> Sequence[Axiom[Input, Output]]:
+    """
+    Plan the evaluation of many (composed) axioms, such that common subexpressions are only evaluated once.
+
+    The planner walks the expression trees of arithmetic axioms (e.g., sums, votes, conjunctions, cascades, and normalization).
+    Every other axiom, including axioms with preconditions, is a leaf that is identified by its configuration (i.e., its representation).
+    All leaves and subexpressions that occur more than once are wrapped in a ``SharedAxiom``, such that their preferences are computed at most once per input and outputs while an analysis session is active.
+
+    :param axioms: The axioms to evaluate.
+    :return: Equivalent axioms, in the same order, that share common subexpressions.
+    """
+    counts: Counter = Counter()
+    for axiom in axioms:
+        _count_subexpressions(axiom, counts)
+    shared_axioms: Dict[str, SharedAxiom] = {}
+    return [_plan(axiom, counts, shared_axioms) for axiom in axioms]
@@ -2,8 +2,7 @@ from abc import ABC
 from dataclasses import dataclass
 from typing import Sequence
 
-from numpy import zeros_like, array
-from numpy.ma import masked_array
+from numpy import where, zeros_like
 
 from ir_axioms.axiom.base import Axiom
 from ir_axioms.model import (
@@ -13,12 +12,27 @@ from ir_axioms.model import (
     PreferenceMatrix,
 )
 from ir_axioms.precondition.base import Precondition
+from ir_axioms.utils.concurrency import run_blocking
 
 
 @dataclass(frozen=True, kw_only=True)
 class PreconditionMixin(Axiom[Input, Output], ABC):
     precondition: Precondition[Input, Output]
 
+    @property
+    def antisymmetric(self) -> bool:
+        return (
+            self.precondition.symmetric
+            and super().antisymmetric  # type: ignore[safe-super]
+        )
+
+    @property
+    def input_dependent(self) -> bool:
+        return (
+            self.precondition.input_dependent
+            or super().input_dependent  # type: ignore[safe-super]
+        )
+
     def preference(
         self,
         input: Input,
@@ -53,8 +67,38 @@ class PreconditionMixin(Axiom[Input, Output], ABC):
             input=input,
             outputs=outputs,
         )
-        return array(masked_array(
-            data=preferences,
-            mask=mask,
-            fill_value=0,
-        ))
+        return where(mask, preferences, 0)
+
+    async def apreference(
+        self,
+        input: Input,
+        output1: Output,
+        output2: Output,
+    ) -> Preference:
+        # Expensive preconditions must not block the event loop.
+        if not await run_blocking(
+            self.precondition.precondition,
+            input,
+            output1,
+            output2,
+        ):
+            return 0
+        return await super().apreference(  # type: ignore[safe-super]
+            input=input,
+            output1=output1,
+            output2=output2,
+        )
+
+    async def apreferences(
+        self,
+        input: Input,
+        outputs: Sequence[Output],
+    ) -> PreferenceMatrix:
+        mask = await run_blocking(self.precondition.preconditions, input, outputs)
+        if not mask.any():
+            return zeros_like(mask).astype(float)
+        preferences = await super().apreferences(  # type: ignore[safe-super]
+            input=input,
+            outputs=outputs,
+        )
+        return where(mask, preferences, 0)
@@ -3,21 +3,26 @@ from functools import lru_cache
 from math import nan  # pyright: ignore[reportShadowedImports]
 from pathlib import Path
 from statistics import mean
-from typing import Any, Final, Iterable, Dict, Optional, Sequence, Union
+from typing import Any, Final, Iterable, Dict, Optional, Union
 
 from injector import inject, NoInject
-from numpy import array, float_
 from targer_api import ArgumentSentences, ArgumentLabel, ArgumentTag, analyze_text
 from targer_api.constants import DEFAULT_TARGER_MODELS, DEFAULT_TARGER_API_URL
-from tqdm.auto import tqdm
 
 from ir_axioms.axiom.base import Axiom
 from ir_axioms.axiom.precondition import PreconditionMixin
+from ir_axioms.axiom.score import ScoreAxiom
 from ir_axioms.precondition.base import Precondition
 from ir_axioms.precondition.length import LEN
 from ir_axioms.axiom.utils import strictly_greater, strictly_less
-from ir_axioms.model import PreferenceMatrix, Query, Document, Preference
-from ir_axioms.tools import TextContents, TermTokenizer, SentenceTokenizer
+from ir_axioms.model import Query, Document
+from ir_axioms.tools import (
+    TextContents,
+    TermTokenizer,
+    SentenceTokenizer,
+    async_contents,
+)
+from ir_axioms.utils.concurrency import run_blocking
 from ir_axioms.utils.lazy import lazy_inject
 
 
@@ -156,11 +161,22 @@ class _TargerMixin:
     ) -> Dict[str, ArgumentSentences]:
         return self._analyze_text(text_contents.contents(document))
 
+    async def aanalyze_text(
+        self,
+        text_contents: Union[
+            TextContents[Document], TextContents[Union[Query, Document]]
+        ],
+        document: Document,
+    ) -> Dict[str, ArgumentSentences]:
+        contents = await async_contents(text_contents, document)
+        # The TARGER API client is synchronous, so wait for the response in a worker thread.
+        return await run_blocking(self._analyze_text, contents)
+
 
 @inject
 @dataclass(frozen=True, kw_only=True)
 class ArgumentativeUnitsCountAxiom(
-    PreconditionMixin[Any, Document], _TargerMixin, Axiom[Any, Document]
+    PreconditionMixin[Any, Document], _TargerMixin, ScoreAxiom[Any, Document]
 ):
     """
     Favor documents with more argumentative units.
@@ -169,23 +185,29 @@ class ArgumentativeUnitsCountAxiom(
     text_contents: TextContents[Document]
     precondition: NoInject[Precondition[Any, Document]] = field(default_factory=LEN)
 
-    def preference(
+    @property
+    def input_dependent(self) -> bool:
+        return self.precondition.input_dependent
+
+    def score(
         self,
         input: Any,
-        output1: Document,
-        output2: Document,
-    ):
-        arguments1 = self.analyze_text(self.text_contents, output1)
-        arguments2 = self.analyze_text(self.text_contents, output2)
-
-        count1 = sum(
-            _count_argumentative_units(sentences) for _, sentences in arguments1.items()
-        )
-        count2 = sum(
-            _count_argumentative_units(sentences) for _, sentences in arguments2.items()
+        output: Document,
+    ) -> float:
+        arguments = self.analyze_text(self.text_contents, output)
+        return sum(
+            _count_argumentative_units(sentences) for _, sentences in arguments.items()
         )
 
-        return strictly_greater(count1, count2)
+    async def ascore(
+        self,
+        input: Any,
+        output: Document,
+    ) -> float:
+        arguments = await self.aanalyze_text(self.text_contents, output)
+        return sum(
+            _count_argumentative_units(sentences) for _, sentences in arguments.items()
+        )
 
 
 ArgUC: Final = lazy_inject(ArgumentativeUnitsCountAxiom)
@@ -340,7 +362,7 @@ QTPArg: Final = lazy_inject(QueryTermPositionInArgumentativeUnitsAxiom)
 @inject
 @dataclass(frozen=True, kw_only=True)
 class AverageSentenceLengthAxiom(
-    PreconditionMixin[Any, Document], Axiom[Any, Document]
+    PreconditionMixin[Any, Document], ScoreAxiom[Any, Document]
 ):
     """
     Favor documents with an average sentence length between
@@ -361,64 +383,22 @@ class AverageSentenceLengthAxiom(
     max_sentence_length: int = 20
     precondition: NoInject[Precondition[Any, Document]] = field(default_factory=LEN)
 
-    def preference(
+    @property
+    def input_dependent(self) -> bool:
+        return self.precondition.input_dependent
+
+    def score(
         self,
         input: Any,
-        output1: Document,
-        output2: Document,
-    ) -> Preference:
-        sentence_length1 = _average_sentence_length(
-            text_contents=self.text_contents,
-            term_tokenizer=self.term_tokenizer,
-            sentence_tokenizer=self.sentence_tokenizer,
-            document=output1,
-        )
-        sentence_length2 = _average_sentence_length(
+        output: Document,
+    ) -> float:
+        sentence_length = _average_sentence_length(
             text_contents=self.text_contents,
             term_tokenizer=self.term_tokenizer,
             sentence_tokenizer=self.sentence_tokenizer,
-            document=output2,
-        )
-
-        min_length = self.min_sentence_length
-        max_length = self.max_sentence_length
-
-        length_in_range1 = min_length <= sentence_length1 <= max_length
-        length_in_range2 = min_length <= sentence_length2 <= max_length
-
-        return strictly_greater(length_in_range1, length_in_range2)
-
-    def preferences(
-        self,
-        input: Any,
-        outputs: Sequence[Document],
-    ) -> PreferenceMatrix:
-        lengths = (
-            _average_sentence_length(
-                text_contents=self.text_contents,
-                term_tokenizer=self.term_tokenizer,
-                sentence_tokenizer=self.sentence_tokenizer,
-                document=document,
-            )
-            for document in outputs
+            document=output,
         )
-        lengths_in_range = [
-            self.min_sentence_length <= length <= self.max_sentence_length
-            for length in tqdm(
-                lengths,
-                total=len(outputs),
-                desc="Sentence lengths",
-                unit="document",
-            )
-        ]
-        return array(
-            [
-                strictly_greater(length_in_range1, length_in_range2)
-                for length_in_range1 in lengths_in_range
-                for length_in_range2 in lengths_in_range
-            ],
-            dtype=float_,
-        ).reshape((len(outputs), len(outputs)))
+        return self.min_sentence_length <= sentence_length <= self.max_sentence_length
 
 
 aSLDoc: Final = lazy_inject(AverageSentenceLengthAxiom)
@@ -21,6 +21,10 @@ class Lnc1Axiom(Axiom[Query, Document]):
     text_statistics: TextStatistics[Document]
     margin_fraction: NoInject[float] = 0.1
 
+    @property
+    def antisymmetric(self) -> bool:
+        return True
+
     def preference(
         self,
         input: Query,
@@ -61,6 +65,10 @@ class TfLncAxiom(Axiom[Query, Document]):
     term_tokenizer: TermTokenizer
     text_statistics: TextStatistics[Document]
 
+    @property
+    def antisymmetric(self) -> bool:
+        return True
+
     def _preference(
         self,
         query_unique_terms: AbstractSet[str],
@@ -126,17 +134,9 @@ class TfLncAxiom(Axiom[Query, Document]):
         query_unique_terms = self.term_tokenizer.unique_terms(
             self.text_contents.contents(input),
         )
-        document_terms = [
-            self.term_tokenizer.terms_unordered(
-                self.text_contents.contents(output),
-            )
-            for output in tqdm(
-                outputs,
-                total=len(outputs),
-                desc="Tokenize",
-                unit="document",
-            )
-        ]
+        document_terms = self.term_tokenizer.terms_unordered_batch(
+            [self.text_contents.contents(output) for output in outputs]
+        )
         document_term_frequencies = [
             {
                 query_term: self.text_statistics.term_frequency(output, query_term)
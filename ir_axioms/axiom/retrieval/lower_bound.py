@@ -18,6 +18,10 @@ class Lb1Axiom(Axiom[Query, Document]):
     text_statistics: TextStatistics[Document]
     margin_fraction: NoInject[float] = 0.1
 
+    @property
+    def antisymmetric(self) -> bool:
+        return True
+
     def preference(
         self,
         input: Query,
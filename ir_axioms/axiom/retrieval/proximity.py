@@ -8,7 +8,6 @@ from typing import Counter, Final, AbstractSet, Sequence, Union
 
 from injector import inject
 from numpy import array, float_
-from tqdm.auto import tqdm
 
 from ir_axioms.axiom.base import Axiom
 from ir_axioms.axiom.utils import strictly_less, strictly_greater
@@ -39,7 +38,9 @@ def _same_query_term_subset(
 def _average_between_query_terms(
     query_terms: AbstractSet[str], document_terms: Sequence[str]
 ) -> float:
-    query_term_pairs = set(combinations(query_terms, 2))
+    # The distance depends on the order of each pair, so the pairs must not depend
+    # on the (hash-based) iteration order of the set, e.g., in worker processes.
+    query_term_pairs = list(combinations(sorted(query_terms), 2))
     if len(query_term_pairs) == 0:
         # Single-term query.
         return 0
@@ -152,6 +153,10 @@ class Prox1Axiom(Axiom[Query, Document]):
     text_contents: TextContents[Union[Query, Document]]
     term_tokenizer: TermTokenizer
 
+    @property
+    def antisymmetric(self) -> bool:
+        return True
+
     def preference(
         self,
         input: Query,
@@ -199,6 +204,10 @@ class Prox2Axiom(Axiom[Query, Document]):
     text_contents: TextContents[Union[Query, Document]]
     term_tokenizer: TermTokenizer
 
+    @property
+    def antisymmetric(self) -> bool:
+        return True
+
     def preference(
         self,
         input: Query,
@@ -240,14 +249,9 @@ class Prox2Axiom(Axiom[Query, Document]):
         query_unique_terms = self.term_tokenizer.unique_terms(
             self.text_contents.contents(input),
         )
-        document_terms = [
-            self.term_tokenizer.terms(self.text_contents.contents(output))
-            for output in tqdm(
-                outputs,
-                desc="Tokenize documents",
-                unit="document",
-            )
-        ]
+        document_terms = self.term_tokenizer.terms_batch(
+            [self.text_contents.contents(output) for output in outputs]
+        )
         return array(
             [
                 (
@@ -304,6 +308,10 @@ class Prox3Axiom(Axiom[Query, Document]):
     text_contents: TextContents[Union[Query, Document]]
     term_tokenizer: TermTokenizer
 
+    @property
+    def antisymmetric(self) -> bool:
+        return True
+
     def preference(
         self,
         input: Query,
@@ -353,6 +361,10 @@ class Prox4Axiom(Axiom[Query, Document]):
     text_contents: TextContents[Union[Query, Document]]
     term_tokenizer: TermTokenizer
 
+    @property
+    def antisymmetric(self) -> bool:
+        return True
+
     def preference(
         self,
         input: Query,
@@ -402,6 +414,10 @@ class Prox5Axiom(Axiom[Query, Document]):
     text_contents: TextContents[Union[Query, Document]]
     term_tokenizer: TermTokenizer
 
+    @property
+    def antisymmetric(self) -> bool:
+        return True
+
     def preference(
         self,
         input: Query,
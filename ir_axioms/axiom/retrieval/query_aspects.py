@@ -1,12 +1,14 @@
 from dataclasses import dataclass, field
-from typing import Final, Sequence, Set, AbstractSet, List, Union
+from typing import ClassVar, Final, Sequence, Set, AbstractSet, List, Union
 
 from injector import inject, NoInject
 from numpy import array, float_, zeros
+from numpy.typing import NDArray
 from tqdm.auto import tqdm
 
 from ir_axioms.axiom.base import Axiom
 from ir_axioms.axiom.precondition import PreconditionMixin
+from ir_axioms.axiom.score import ScoreAxiom
 from ir_axioms.precondition.base import Precondition
 from ir_axioms.precondition.length import LEN
 from ir_axioms.axiom.utils import strictly_greater, approximately_equal
@@ -51,6 +53,10 @@ class RegAxiom(PreconditionMixin[Query, Document], Axiom[Query, Document]):
     term_similarity: TermSimilarity
     precondition: NoInject[Precondition[Query, Document]] = field(default_factory=LEN)
 
+    @property
+    def antisymmetric(self) -> bool:
+        return self.precondition.symmetric
+
     def preference(
         self,
         input: Query,
@@ -156,6 +162,10 @@ class AntiRegAxiom(PreconditionMixin[Query, Document], Axiom[Query, Document]):
     term_similarity: TermSimilarity
     precondition: NoInject[Precondition[Query, Document]] = field(default_factory=LEN)
 
+    @property
+    def antisymmetric(self) -> bool:
+        return self.precondition.symmetric
+
     def preference(
         self,
         input: Query,
@@ -263,6 +273,10 @@ class AspectRegAxiom(Axiom[Query, Document]):
     term_similarity: TermSimilarity
     term_discriminator_margin_fraction: NoInject[float] = 0.1
 
+    @property
+    def antisymmetric(self) -> bool:
+        return True
+
     def preference(
         self,
         input: Query,
@@ -338,61 +352,52 @@ ASPECT_REG: Final = lazy_inject(AspectRegAxiom)
 
 @inject
 @dataclass(frozen=True, kw_only=True)
-class AndAxiom(Axiom[Query, Document]):
+class AndAxiom(ScoreAxiom[Query, Document]):
     text_contents: TextContents[Union[Query, Document]]
     term_tokenizer: TermTokenizer
 
-    def preference(
+    @staticmethod
+    def _all_query_terms(
+        query_unique_terms: AbstractSet[str],
+        document_unique_terms: AbstractSet[str],
+    ) -> bool:
+        return query_unique_terms <= document_unique_terms
+
+    def score(
         self,
         input: Query,
-        output1: Document,
-        output2: Document,
-    ) -> Preference:
+        output: Document,
+    ) -> float:
         query_unique_terms = self.term_tokenizer.unique_terms(
             self.text_contents.contents(input),
         )
-        document1_unique_terms = self.term_tokenizer.unique_terms(
-            self.text_contents.contents(output1),
-        )
-        document2_unique_terms = self.term_tokenizer.unique_terms(
-            self.text_contents.contents(output2),
+        document_unique_terms = self.term_tokenizer.unique_terms(
+            self.text_contents.contents(output),
         )
+        return self._all_query_terms(query_unique_terms, document_unique_terms)
 
-        all_query_terms1 = query_unique_terms <= document1_unique_terms
-        all_query_terms2 = query_unique_terms <= document2_unique_terms
-        return strictly_greater(all_query_terms1, all_query_terms2)
-
-    def preferences(
+    def scores(
         self,
         input: Query,
         outputs: Sequence[Document],
-    ) -> PreferenceMatrix:
+    ) -> NDArray[float_]:
         query_unique_terms = self.term_tokenizer.unique_terms(
             self.text_contents.contents(input),
         )
-        document_unique_terms = (
-            self.term_tokenizer.unique_terms(
-                self.text_contents.contents(output),
-            )
-            for output in outputs
+        documents_unique_terms = self.term_tokenizer.unique_terms_batch(
+            [self.text_contents.contents(output) for output in outputs]
         )
-        all_query_terms = [
-            query_unique_terms <= terms
-            for terms in tqdm(
-                document_unique_terms,
-                total=len(outputs),
-                desc="Query term overlap",
-                unit="document",
-            )
-        ]
         return array(
             [
-                strictly_greater(all_query_terms1, all_query_terms2)
-                for all_query_terms1 in all_query_terms
-                for all_query_terms2 in all_query_terms
+                self._all_query_terms(query_unique_terms, document_unique_terms)
+                for document_unique_terms in tqdm(
+                    documents_unique_terms,
+                    desc="Query term overlap",
+                    unit="document",
+                )
             ],
             dtype=float_,
-        ).reshape((len(outputs), len(outputs)))
+        )
 
 
 AND: Final = lazy_inject(AndAxiom)
@@ -409,7 +414,7 @@ LEN_AND: Final = lazy_inject(LenAndAxiom)
 
 @inject
 @dataclass(frozen=True, kw_only=True)
-class ModifiedAndAxiom(Axiom[Query, Document]):
+class ModifiedAndAxiom(ScoreAxiom[Query, Document]):
     """
     Modified AND:
     One document contains a larger subset of query terms.
@@ -418,57 +423,48 @@ class ModifiedAndAxiom(Axiom[Query, Document]):
     text_contents: TextContents[Union[Query, Document]]
     term_tokenizer: TermTokenizer
 
-    def preference(
+    @staticmethod
+    def _num_query_terms(
+        query_unique_terms: AbstractSet[str],
+        document_unique_terms: AbstractSet[str],
+    ) -> int:
+        return len(query_unique_terms & document_unique_terms)
+
+    def score(
         self,
         input: Query,
-        output1: Document,
-        output2: Document,
-    ) -> Preference:
+        output: Document,
+    ) -> float:
         query_unique_terms = self.term_tokenizer.unique_terms(
             self.text_contents.contents(input),
         )
-        document1_unique_terms = self.term_tokenizer.unique_terms(
-            self.text_contents.contents(output1),
-        )
-        document2_unique_terms = self.term_tokenizer.unique_terms(
-            self.text_contents.contents(output2),
+        document_unique_terms = self.term_tokenizer.unique_terms(
+            self.text_contents.contents(output),
         )
+        return self._num_query_terms(query_unique_terms, document_unique_terms)
 
-        query_terms1 = query_unique_terms & document1_unique_terms
-        query_terms2 = query_unique_terms & document2_unique_terms
-        return strictly_greater(len(query_terms1), len(query_terms2))
-
-    def preferences(
+    def scores(
         self,
         input: Query,
         outputs: Sequence[Document],
-    ) -> PreferenceMatrix:
+    ) -> NDArray[float_]:
         query_unique_terms = self.term_tokenizer.unique_terms(
             self.text_contents.contents(input),
         )
-        document_unique_terms = (
-            self.term_tokenizer.unique_terms(
-                self.text_contents.contents(output),
-            )
-            for output in outputs
+        documents_unique_terms = self.term_tokenizer.unique_terms_batch(
+            [self.text_contents.contents(output) for output in outputs]
         )
-        num_query_terms = [
-            len(query_unique_terms & terms)
-            for terms in tqdm(
-                document_unique_terms,
-                total=len(outputs),
-                desc="Query term overlap",
-                unit="document",
-            )
-        ]
         return array(
             [
-                strictly_greater(num_query_terms1, num_query_terms2)
-                for num_query_terms1 in num_query_terms
-                for num_query_terms2 in num_query_terms
+                self._num_query_terms(query_unique_terms, document_unique_terms)
+                for document_unique_terms in tqdm(
+                    documents_unique_terms,
+                    desc="Query term overlap",
+                    unit="document",
+                )
             ],
             dtype=float_,
-        ).reshape((len(outputs), len(outputs)))
+        )
 
 
 M_AND: Final = lazy_inject(ModifiedAndAxiom)
@@ -485,71 +481,58 @@ LEN_M_AND: Final = lazy_inject(LenModifiedAndAxiom)
 
 @inject
 @dataclass(frozen=True, kw_only=True)
-class DivAxiom(Axiom[Query, Document]):
+class DivAxiom(ScoreAxiom[Query, Document]):
     text_contents: TextContents[Union[Query, Document]]
     term_tokenizer: TermTokenizer
 
-    def preference(
+    # Prefer the document with less vocabulary overlap.
+    prefer_greater: ClassVar[bool] = False
+
+    @staticmethod
+    def _overlap(
+        query_unique_terms: AbstractSet[str],
+        document_unique_terms: AbstractSet[str],
+    ) -> float:
+        return _vocabulary_overlap(
+            vocabulary1=query_unique_terms,
+            vocabulary2=document_unique_terms,
+        )
+
+    def score(
         self,
         input: Query,
-        output1: Document,
-        output2: Document,
-    ) -> Preference:
+        output: Document,
+    ) -> float:
         query_unique_terms = self.term_tokenizer.unique_terms(
             self.text_contents.contents(input),
         )
-        document1_unique_terms = self.term_tokenizer.unique_terms(
-            self.text_contents.contents(output1),
-        )
-        document2_unique_terms = self.term_tokenizer.unique_terms(
-            self.text_contents.contents(output2),
-        )
-
-        overlap1 = _vocabulary_overlap(
-            vocabulary1=query_unique_terms,
-            vocabulary2=document1_unique_terms,
-        )
-        overlap2 = _vocabulary_overlap(
-            vocabulary1=query_unique_terms,
-            vocabulary2=document2_unique_terms,
+        document_unique_terms = self.term_tokenizer.unique_terms(
+            self.text_contents.contents(output),
         )
+        return self._overlap(query_unique_terms, document_unique_terms)
 
-        return strictly_greater(overlap2, overlap1)
-
-    def preferences(
+    def scores(
         self,
         input: Query,
         outputs: Sequence[Document],
-    ) -> PreferenceMatrix:
+    ) -> NDArray[float_]:
         query_unique_terms = self.term_tokenizer.unique_terms(
             self.text_contents.contents(input),
         )
-        document_unique_terms = (
-            self.term_tokenizer.unique_terms(
-                self.text_contents.contents(output),
-            )
-            for output in outputs
+        documents_unique_terms = self.term_tokenizer.unique_terms_batch(
+            [self.text_contents.contents(output) for output in outputs]
         )
-        overlaps = [
-            _vocabulary_overlap(
-                vocabulary1=query_unique_terms,
-                vocabulary2=terms,
-            )
-            for terms in tqdm(
-                document_unique_terms,
-                total=len(outputs),
-                desc="Vocabulary overlap",
-                unit="document",
-            )
-        ]
         return array(
             [
-                strictly_greater(overlap2, overlap1)
-                for overlap1 in overlaps
-                for overlap2 in overlaps
+                self._overlap(query_unique_terms, document_unique_terms)
+                for document_unique_terms in tqdm(
+                    documents_unique_terms,
+                    desc="Vocabulary overlap",
+                    unit="document",
+                )
             ],
             dtype=float_,
-        ).reshape((len(outputs), len(outputs)))
+        )
 
 
 DIV: Final = lazy_inject(DivAxiom)
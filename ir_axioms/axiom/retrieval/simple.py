@@ -9,6 +9,10 @@ from ir_axioms.utils.lazy import lazy_inject
 
 @dataclass(frozen=True, kw_only=True)
 class OriginalAxiom(Axiom[Any, Document]):
+    @property
+    def antisymmetric(self) -> bool:
+        return True
+
     def preference(
         self,
         input: Any,
@@ -28,6 +32,10 @@ ORIG = lazy_inject(OriginalAxiom)
 
 @dataclass(frozen=True, kw_only=True)
 class OracleAxiom(Axiom[Any, Document]):
+    @property
+    def antisymmetric(self) -> bool:
+        return True
+
     def preference(
         self,
         input: Any,
@@ -1,14 +1,16 @@
 from dataclasses import dataclass, field
 from itertools import chain, combinations
 from math import isclose  # pyright: ignore[reportShadowedImports]
-from typing import AbstractSet, Final, Sequence, Union
+from typing import AbstractSet, Collection, Final, Sequence, Union
 
 from injector import inject, NoInject
 from numpy import array, float_
+from numpy.typing import NDArray
 from tqdm.auto import tqdm
 
 from ir_axioms.axiom.base import Axiom
 from ir_axioms.axiom.precondition import PreconditionMixin
+from ir_axioms.axiom.score import ScoreAxiom
 from ir_axioms.precondition.base import Precondition
 from ir_axioms.precondition.length import LEN
 from ir_axioms.axiom.utils import strictly_greater
@@ -19,75 +21,51 @@ from ir_axioms.utils.lazy import lazy_inject
 
 @inject
 @dataclass(frozen=True, kw_only=True)
-class Tfc1Axiom(PreconditionMixin[Query, Document], Axiom[Query, Document]):
+class Tfc1Axiom(PreconditionMixin[Query, Document], ScoreAxiom[Query, Document]):
     text_contents: TextContents[Union[Query, Document]]
     term_tokenizer: TermTokenizer
     text_statistics: TextStatistics[Document]
     precondition: NoInject[Precondition[Query, Document]] = field(default_factory=LEN)
     margin_fraction: NoInject[float] = 0.1
 
-    def _preference(
+    def _term_frequency_sum(
         self,
-        term_frequency_sum1: float,
-        term_frequency_sum2: float,
-    ) -> Preference:
-        if isclose(
-            term_frequency_sum1,
-            term_frequency_sum2,
-            rel_tol=self.margin_fraction,
-        ):
-            return 0
-
-        return strictly_greater(term_frequency_sum1, term_frequency_sum2)
+        query_terms: Collection[str],
+        output: Document,
+    ) -> float:
+        return sum(
+            self.text_statistics.term_frequency(output, term) for term in query_terms
+        )
 
-    def preference(
+    def score(
         self,
         input: Query,
-        output1: Document,
-        output2: Document,
-    ) -> Preference:
+        output: Document,
+    ) -> float:
         query_terms = self.term_tokenizer.terms_unordered(
             self.text_contents.contents(input),
         )
+        return self._term_frequency_sum(query_terms, output)
 
-        term_frequency_sum1 = sum(
-            self.text_statistics.term_frequency(output1, term) for term in query_terms
-        )
-        term_frequency_sum2 = sum(
-            self.text_statistics.term_frequency(output2, term) for term in query_terms
-        )
-
-        return self._preference(term_frequency_sum1, term_frequency_sum2)
-
-    def preferences(
+    def scores(
         self,
         input: Query,
         outputs: Sequence[Document],
-    ) -> PreferenceMatrix:
+    ) -> NDArray[float_]:
         query_terms = self.term_tokenizer.terms_unordered(
             self.text_contents.contents(input),
         )
-
-        term_frequency_sums = [
-            sum(
-                self.text_statistics.term_frequency(output, term)
-                for term in query_terms
-            )
-            for output in tqdm(
-                outputs,
-                desc="Sum term frequencies",
-                unit="document",
-            )
-        ]
-
         return array(
             [
-                self._preference(term_frequency_sum1, term_frequency_sum2)
-                for term_frequency_sum1 in term_frequency_sums
-                for term_frequency_sum2 in term_frequency_sums
+                self._term_frequency_sum(query_terms, output)
+                for output in tqdm(
+                    outputs,
+                    desc="Sum term frequencies",
+                    unit="document",
+                )
             ],
             dtype=float_,
-        ).reshape((len(outputs), len(outputs)))
+        )
 
 
 TFC1: Final = lazy_inject(Tfc1Axiom)
@@ -103,6 +81,10 @@ class Tfc3Axiom(PreconditionMixin[Query, Document], Axiom[Query, Document]):
     precondition: NoInject[Precondition[Query, Document]] = field(default_factory=LEN)
     margin_fraction: NoInject[float] = 0.1
 
+    @property
+    def antisymmetric(self) -> bool:
+        return self.precondition.symmetric
+
     def preference(
         self,
         input: Query,
@@ -281,6 +263,10 @@ class ModifiedTdcAxiom(Axiom[Query, Document]):
     index_statistics: IndexStatistics
     text_statistics: TextStatistics[Union[Query, Document]]
 
+    @property
+    def antisymmetric(self) -> bool:
+        return True
+
     def preference(
         self,
         input: Query,
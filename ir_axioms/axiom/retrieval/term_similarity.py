@@ -1,78 +1,70 @@
 from dataclasses import dataclass
 from math import isclose, nan  # pyright: ignore[reportShadowedImports]
-from typing import Final, Union, Sequence
+from typing import AbstractSet, Final, Union, Sequence
 
 from injector import inject, NoInject
 from numpy import array, float_
+from numpy.typing import NDArray
 from tqdm.auto import tqdm
 
 from ir_axioms.axiom.base import Axiom
-from ir_axioms.axiom.utils import strictly_greater
-from ir_axioms.model import Query, Document, Preference, PreferenceMatrix
+from ir_axioms.axiom.score import ScoreAxiom
+from ir_axioms.model import Query, Document, Preference
 from ir_axioms.tools import TextContents, TermTokenizer, TermSimilarity, TextStatistics
 from ir_axioms.utils.lazy import lazy_inject
 
 
 @inject
 @dataclass(frozen=True, kw_only=True)
-class Stmc1Axiom(Axiom[Query, Document]):
+class Stmc1Axiom(ScoreAxiom[Query, Document]):
     text_contents: TextContents[Union[Query, Document]]
     term_tokenizer: TermTokenizer
     term_similarity: TermSimilarity
 
-    def preference(
+    def _average_similarity(
+        self,
+        query_unique_terms: AbstractSet[str],
+        document_unique_terms: AbstractSet[str],
+    ) -> float:
+        return self.term_similarity.average_similarity(
+            document_unique_terms, query_unique_terms
+        )
+
+    def score(
         self,
         input: Query,
-        output1: Document,
-        output2: Document,
-    ) -> Preference:
+        output: Document,
+    ) -> float:
         query_unique_terms = self.term_tokenizer.unique_terms(
             self.text_contents.contents(input),
         )
-        document1_unique_terms = self.term_tokenizer.unique_terms(
-            self.text_contents.contents(output1),
+        document_unique_terms = self.term_tokenizer.unique_terms(
+            self.text_contents.contents(output),
         )
-        document2_unique_terms = self.term_tokenizer.unique_terms(
-            self.text_contents.contents(output2),
-        )
-        average_similarity1 = self.term_similarity.average_similarity(
-            document1_unique_terms, query_unique_terms
-        )
-        average_similarity2 = self.term_similarity.average_similarity(
-            document2_unique_terms, query_unique_terms
-        )
-        return strictly_greater(average_similarity1, average_similarity2)
+        return self._average_similarity(query_unique_terms, document_unique_terms)
 
-    def preferences(
+    def scores(
         self,
         input: Query,
         outputs: Sequence[Document],
-    ) -> PreferenceMatrix:
+    ) -> NDArray[float_]:
         query_unique_terms = self.term_tokenizer.unique_terms(
             self.text_contents.contents(input),
         )
-        document_unique_terms = (
-            self.term_tokenizer.unique_terms(self.text_contents.contents(output))
-            for output in outputs
+        documents_unique_terms = self.term_tokenizer.unique_terms_batch(
+            [self.text_contents.contents(output) for output in outputs]
         )
-        average_similarities = [
-            self.term_similarity.average_similarity(document_terms, query_unique_terms)
-            for document_terms in tqdm(
-                document_unique_terms,
-                total=len(outputs),
-                desc="Compute avg. similarities",
-                unit="document",
-            )
-        ]
-
         return array(
             [
-                strictly_greater(average_similarities1, average_similarities2)
-                for average_similarities1 in average_similarities
-                for average_similarities2 in average_similarities
+                self._average_similarity(query_unique_terms, document_unique_terms)
+                for document_unique_terms in tqdm(
+                    documents_unique_terms,
+                    desc="Compute avg. similarities",
+                    unit="document",
+                )
             ],
             dtype=float_,
-        ).reshape((len(outputs), len(outputs)))
+        )
 
 
 STMC1: Final = lazy_inject(Stmc1Axiom)
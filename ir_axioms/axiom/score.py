@@ -0,0 +1,208 @@
+from abc import ABC, abstractmethod
+from asyncio import gather
+from math import isclose
+from pathlib import Path
+from typing import ClassVar, Literal, Sequence
+
+from numpy import array, float_
+from numpy.typing import NDArray
+from tqdm.auto import tqdm
+
+from ir_axioms.axiom.base import Axiom
+from ir_axioms.axiom.utils import (
+    isclose_matrix,
+    strictly_greater,
+    strictly_greater_matrix,
+    strictly_less,
+    strictly_less_matrix,
+)
+from ir_axioms.model import Input, Output, Preference, PreferenceMatrix
+from ir_axioms.utils.concurrency import run_blocking
+
+
+class ScoreAxiom(Axiom[Input, Output], ABC):
+    """
+    An axiom that compares two outputs by a single score computed for each output individually (e.g., a term frequency sum, a length, or a readability score).
+
+    Subclasses must implement the ``score()`` method and can optionally override ``scores()`` to batch-compute the scores of many outputs more efficiently (e.g., to compute input-dependent features only once).
+    The preference matrix is then derived from the scores with vectorized comparisons, i.e., without computing any pairwise preference in Python.
+    """
+
+    prefer_greater: ClassVar[bool] = True
+    """
+    Prefer the output with the greater score if ``True``, or the output with the lesser score otherwise.
+    """
+
+    margin_fraction: float = 0.0
+    """
+    Relative margin within which two scores are considered equal (i.e., no preference).
+    """
+
+    @property
+    def antisymmetric(self) -> bool:
+        return True
+
+    @abstractmethod
+    def score(
+        self,
+        input: Input,
+        output: Output,
+    ) -> float:
+        """
+        Compute the score of a single output for the given input.
+
+        :param input: Input for the output.
+        :param output: The output to score.
+        :return: The output's score.
+        """
+        pass
+
+    def scores(
+        self,
+        input: Input,
+        outputs: Sequence[Output],
+    ) -> NDArray[float_]:
+        """
+        Batch-compute the scores for a sequence of potential outputs.
+
+        :param input: Common input for all outputs.
+        :param outputs: The outputs for the common input.
+        :return: An array, where the i-th entry corresponds to the score of the i-th output.
+        """
+        return array(
+            [
+                self.score(input, output)
+                for output in tqdm(
+                    outputs,
+                    desc="Scores",
+                    unit="output",
+                )
+            ],
+            dtype=float_,
+        )
+
+    async def ascore(
+        self,
+        input: Input,
+        output: Output,
+    ) -> float:
+        """
+        Asynchronously compute the score of a single output for the given input (see ``score()``).
+
+        By default, ``score()`` is run in a worker thread. Axioms with natively asynchronous tools can override this method.
+
+        :param input: Input for the output.
+        :param output: The output to score.
+        :return: The output's score.
+        """
+        return await run_blocking(self.score, input, output)
+
+    async def ascores(
+        self,
+        input: Input,
+        outputs: Sequence[Output],
+    ) -> NDArray[float_]:
+        """
+        Asynchronously batch-compute the scores for a sequence of potential outputs (see ``scores()``).
+
+        By default, all scores are computed concurrently with ``ascore()``, unless only ``scores()`` is overridden (e.g., for batched model inference), which is then run in a worker thread.
+
+        :param input: Common input for all outputs.
+        :param outputs: The outputs for the common input.
+        :return: An array, where the i-th entry corresponds to the score of the i-th output.
+        """
+        if (
+            type(self).ascore is ScoreAxiom.ascore
+            and type(self).scores is not ScoreAxiom.scores
+        ):
+            return await run_blocking(self.scores, input, outputs)
+        return array(
+            await gather(*(self.ascore(input, output) for output in outputs)),
+            dtype=float_,
+        )
+
+    def preference_from_scores(self, score1: float, score2: float) -> Preference:
+        """
+        Compare two outputs by their (e.g., cached) scores.
+
+        :param score1: Score of the first output.
+        :param score2: Score of the second output.
+        :return: Preference between the first and the second output.
+        """
+        if isclose(score1, score2, rel_tol=self.margin_fraction):
+            return 0
+        if self.prefer_greater:
+            return strictly_greater(score1, score2)
+        else:
+            return strictly_less(score1, score2)
+
+    def preferences_from_scores(self, scores: NDArray[float_]) -> PreferenceMatrix:
+        """
+        Compare many outputs by their (e.g., cached) scores.
+
+        :param scores: An array, where the i-th entry corresponds to the score of the i-th output.
+        :return: A preference matrix, where the ij-th entry corresponds to the preference between the i-th and j-th output.
+        """
+        if self.prefer_greater:
+            preferences = strictly_greater_matrix(scores)
+        else:
+            preferences = strictly_less_matrix(scores)
+        if self.margin_fraction > 0:
+            preferences[isclose_matrix(scores, rel_tol=self.margin_fraction)] = 0
+        return preferences
+
+    def preference(
+        self,
+        input: Input,
+        output1: Output,
+        output2: Output,
+    ) -> Preference:
+        return self.preference_from_scores(
+            self.score(input, output1),
+            self.score(input, output2),
+        )
+
+    def preferences(
+        self,
+        input: Input,
+        outputs: Sequence[Output],
+    ) -> PreferenceMatrix:
+        return self.preferences_from_scores(self.scores(input, outputs))
+
+    async def apreference(
+        self,
+        input: Input,
+        output1: Output,
+        output2: Output,
+    ) -> Preference:
+        score1, score2 = await gather(
+            self.ascore(input, output1),
+            self.ascore(input, output2),
+        )
+        return self.preference_from_scores(score1, score2)
+
+    async def apreferences(
+        self,
+        input: Input,
+        outputs: Sequence[Output],
+    ) -> PreferenceMatrix:
+        return self.preferences_from_scores(await self.ascores(input, outputs))
+
+    def cached(
+        self,
+        cache_path: Path,
+        backend: Literal["dbm", "sqlite"] = "dbm",
+    ) -> Axiom[Input, Output]:
+        """
+        Cache this axiom's scores in the given cache path, such that the cache only grows linearly with the number of outputs and the margin fraction can be changed without invalidating the cache.
+        Axioms that modify the preferences derived from the scores (e.g., with preconditions) cache their preferences instead.
+        """
+        if (
+            type(self).preference is not ScoreAxiom.preference
+            or type(self).preferences is not ScoreAxiom.preferences
+        ):
+            return super().cached(cache_path, backend)
+
+        from ir_axioms.axiom.cache import ScoreCachedAxiom
+
+        return ScoreCachedAxiom(axiom=self, cache_path=cache_path, backend=backend)
@@ -12,6 +12,14 @@ from ir_axioms.utils.lazy import lazy_inject
 
 @dataclass(frozen=True, kw_only=True)
 class NopAxiom(Axiom[Any, Any]):
+    @property
+    def antisymmetric(self) -> bool:
+        return True
+
+    @property
+    def input_dependent(self) -> bool:
+        return False
+
     def preference(
         self,
         input: Any,
@@ -73,6 +81,14 @@ _SupportsComparisonT = TypeVar("_SupportsComparisonT", bound=_SupportsComparison
 
 @dataclass(frozen=True, kw_only=True)
 class GreaterThanAxiom(Axiom[Any, _SupportsComparisonT]):
+    @property
+    def antisymmetric(self) -> bool:
+        return True
+
+    @property
+    def input_dependent(self) -> bool:
+        return False
+
     def preference(
         self,
         input: Any,
@@ -91,6 +107,14 @@ GT: Final = lazy_inject(GreaterThanAxiom)
 
 @dataclass(frozen=True, kw_only=True)
 class LessThanAxiom(Axiom[Any, _SupportsComparisonT]):
+    @property
+    def antisymmetric(self) -> bool:
+        return True
+
+    @property
+    def input_dependent(self) -> bool:
+        return False
+
     def preference(
         self,
         input: Any,
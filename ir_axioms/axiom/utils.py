@@ -1,5 +1,10 @@
 from typing import Union, TypeVar, Protocol, Sized
 
+from numpy import absolute, asarray, errstate, float_, isfinite, maximum, newaxis
+from numpy.typing import ArrayLike
+
+from ir_axioms.model import MaskMatrix, PreferenceMatrix
+
 
 _T_contra = TypeVar("_T_contra", contravariant=True)
 
@@ -59,3 +64,48 @@ def approximately_equal(
     boundary_max = max(boundaries)
 
     return all(boundary_min <= item <= boundary_max for item in items)
+
+
+def strictly_greater_matrix(values: ArrayLike) -> PreferenceMatrix:
+    """
+    Vectorized ``strictly_greater()`` for all pairs of the given values.
+
+    :param values: One numeric value per output.
+    :return: A preference matrix, where the ij-th entry is 1 if the i-th value is greater than the j-th value, -1 if it is less, and 0 otherwise (including NaN values).
+    """
+    values = asarray(values, dtype=float_)
+    column = values[:, newaxis]
+    row = values[newaxis, :]
+    return (column > row).astype(float_) - (column < row)
+
+
+def strictly_less_matrix(values: ArrayLike) -> PreferenceMatrix:
+    """
+    Vectorized ``strictly_less()`` for all pairs of the given values.
+
+    :param values: One numeric value per output.
+    :return: A preference matrix, where the ij-th entry is 1 if the i-th value is less than the j-th value, -1 if it is greater, and 0 otherwise (including NaN values).
+    """
+    values = asarray(values, dtype=float_)
+    column = values[:, newaxis]
+    row = values[newaxis, :]
+    return (column < row).astype(float_) - (column > row)
+
+
+def isclose_matrix(values: ArrayLike, rel_tol: float = 1e-09) -> MaskMatrix:
+    """
+    Vectorized ``math.isclose()`` (without absolute tolerance) for all pairs of the given values.
+
+    :param values: One numeric value per output.
+    :param rel_tol: Relative tolerance, as in ``math.isclose()``.
+    :return: A mask matrix, where the ij-th entry is ``True`` if the i-th and j-th value are close to each other.
+    """
+    values = asarray(values, dtype=float_)
+    column = values[:, newaxis]
+    row = values[newaxis, :]
+    # Infinite values are only close to themselves, like in `math.isclose()`.
+    with errstate(invalid="ignore"):
+        close = absolute(column - row) <= rel_tol * maximum(
+            absolute(column), absolute(row)
+        )
+    return (column == row) | (close & isfinite(column) & isfinite(row))
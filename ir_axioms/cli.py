@@ -1,4 +1,6 @@
-from typing import Annotated
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Annotated, Literal, Optional, Sequence
 
 from cyclopts import App, Parameter
 from dotenv import load_dotenv, find_dotenv
@@ -18,3 +20,223 @@ def launcher(*tokens: Annotated[str, Parameter(show=False, allow_leading_hyphen=
 @app.command()
 def dummy() -> None:
     return
+
+
+@app.command(name="batch")
+def batch(
+    run_path: Path,
+    output_path: Path,
+    *,
+    axioms: Sequence[str],
+    mode: Literal["preferences", "kwiksort"] = "preferences",
+    queries_per_shard: int = 100,
+    n_jobs: Optional[int] = None,
+    dataset: Optional[str] = None,
+    checkpoint_dir: Optional[Path] = None,
+    keep_checkpoints: bool = False,
+    seed: int = 0,
+    tag: str = "ir_axioms",
+) -> None:
+    """
+    Compute axiomatic preferences or KwikSort re-rankings for a TREC run file, in checkpointed shards over local worker processes.
+
+    :param run_path: Path of the TREC run file (optionally gzipped).
+    :param output_path: Path of the merged output file.
+    :param axioms: Names of the axioms in ``ir_axioms.axiom`` (e.g., ``TFC1``). For re-ranking, the axioms are cascaded in the given order.
+    :param mode: Whether to write the preferences of all document pairs (tab-separated) or a KwikSort re-ranked TREC run.
+    :param queries_per_shard: Number of queries per shard, i.e., per checkpoint.
+    :param n_jobs: Number of worker processes (e.g., ``-1`` for all CPUs). Processes the shards in the current process if not given.
+    :param dataset: ID of the ir_datasets dataset to look up the query and document texts from.
+    :param checkpoint_dir: Directory to checkpoint the shards to. Re-run with the same directory to resume. Defaults to the output path with the suffix ``.shards``.
+    :param keep_checkpoints: Keep the checkpointed shards after merging.
+    :param seed: Seed of the random pivot selection for KwikSort.
+    :param tag: Run tag of the re-ranked TREC run.
+    """
+    from ir_axioms.integrations.trec import ShardedTrecRunner
+
+    runner = ShardedTrecRunner(
+        axioms=axioms,
+        mode=mode,
+        queries_per_shard=queries_per_shard,
+        n_jobs=n_jobs,
+        dataset=dataset,
+        seed=seed,
+        tag=tag,
+        verbose=True,
+    )
+    runner.run(
+        run_path=run_path,
+        output_path=output_path,
+        checkpoint_dir=checkpoint_dir,
+        keep_checkpoints=keep_checkpoints,
+    )
+    print(f"Wrote output to: {output_path}")
+
+
+cache_app = App(
+    name="cache",
+    help="Inspect and maintain the preference caches of cached axioms.",
+)
+app.command(cache_app)
+
+
+@cache_app.command(name="info")
+def cache_info(
+    path: Path,
+    backend: Optional[Literal["dbm", "sqlite"]] = None,
+) -> None:
+    """
+    Report the number of entries and their size per cached axiom.
+
+    :param path: Path of the preference cache.
+    :param backend: Backend of the preference cache. Detected if not given.
+    """
+    from ir_axioms.axiom.cache_maintenance import (
+        open_preference_cache,
+        summarize_preference_cache,
+    )
+
+    with open_preference_cache(path, backend) as cache:
+        summaries = summarize_preference_cache(cache)
+    for summary in summaries:
+        namespace = summary.namespace if summary.namespace is not None else "invalid"
+        first_created = datetime.fromtimestamp(summary.first_created)
+        last_created = datetime.fromtimestamp(summary.last_created)
+        print(
+            f"{namespace}\t{summary.entries} entries\t{summary.inputs} inputs\t"
+            f"{summary.size} bytes\t{first_created:%Y-%m-%d %H:%M}–"
+            f"{last_created:%Y-%m-%d %H:%M}\t{summary.description or ''}"
+        )
+
+
+@cache_app.command(name="export")
+def cache_export(
+    path: Path,
+    output_path: Path,
+    backend: Optional[Literal["dbm", "sqlite"]] = None,
+) -> None:
+    """
+    Export the entries of a preference cache to a Parquet (or Arrow) file.
+
+    :param path: Path of the preference cache.
+    :param output_path: Path of the Parquet file, or of an Arrow file if it ends with ``.arrow`` or ``.feather``.
+    :param backend: Backend of the preference cache. Detected if not given.
+    """
+    from ir_axioms.axiom.cache_maintenance import (
+        export_preference_cache,
+        open_preference_cache,
+    )
+
+    with open_preference_cache(path, backend) as cache:
+        exported = export_preference_cache(cache, output_path)
+    print(f"Exported {exported} entries to: {output_path}")
+
+
+@cache_app.command(name="import")
+def cache_import(
+    path: Path,
+    input_paths: Sequence[Path],
+    backend: Optional[Literal["dbm", "sqlite"]] = None,
+) -> None:
+    """
+    Import exported Parquet (or Arrow) files into a preference cache. Newer entries win.
+
+    :param path: Path of the preference cache.
+    :param input_paths: Paths of the exported files.
+    :param backend: Backend of the preference cache. Detected if not given, and DBM for new caches.
+    """
+    from ir_axioms.axiom.cache_maintenance import (
+        import_preference_cache,
+        open_preference_cache,
+    )
+
+    with open_preference_cache(path, backend) as cache:
+        imported = sum(
+            import_preference_cache(cache, input_path) for input_path in input_paths
+        )
+    print(f"Imported {imported} entries into: {path}")
+
+
+@cache_app.command(name="merge")
+def cache_merge(
+    path: Path,
+    other_paths: Sequence[Path],
+    backend: Optional[Literal["dbm", "sqlite"]] = None,
+) -> None:
+    """
+    Merge other preference caches into a preference cache. Newer entries win.
+
+    :param path: Path of the preference cache to merge into.
+    :param other_paths: Paths of the preference caches to merge. Their backends are detected.
+    :param backend: Backend of the preference cache. Detected if not given, and DBM for new caches.
+    """
+    from ir_axioms.axiom.cache_maintenance import (
+        merge_preference_caches,
+        open_preference_cache,
+    )
+
+    with open_preference_cache(path, backend) as cache:
+        merged = 0
+        for other_path in other_paths:
+            with open_preference_cache(other_path) as other_cache:
+                merged += merge_preference_caches(cache, [other_cache])
+    print(f"Merged {merged} entries into: {path}")
+
+
+@cache_app.command(name="prune")
+def cache_prune(
+    path: Path,
+    *,
+    namespaces: Optional[Sequence[str]] = None,
+    input_ids: Optional[Sequence[str]] = None,
+    older_than_days: Optional[float] = None,
+    invalid: bool = False,
+    backend: Optional[Literal["dbm", "sqlite"]] = None,
+) -> None:
+    """
+    Delete the entries of a preference cache that match all given criteria.
+
+    :param path: Path of the preference cache.
+    :param namespaces: Only delete entries of the axioms with these namespaces (see ``cache info``).
+    :param input_ids: Only delete entries of the inputs with these IDs, e.g., query IDs.
+    :param older_than_days: Only delete entries that were written more days ago.
+    :param invalid: Delete invalid entries, regardless of the other criteria.
+    :param backend: Backend of the preference cache. Detected if not given.
+    """
+    from ir_axioms.axiom.cache_maintenance import (
+        open_preference_cache,
+        prune_preference_cache,
+    )
+
+    with open_preference_cache(path, backend) as cache:
+        pruned = prune_preference_cache(
+            cache,
+            namespaces=namespaces,
+            input_ids=input_ids,
+            older_than=(
+                timedelta(days=older_than_days) if older_than_days is not None else None
+            ),
+            invalid=invalid,
+        )
+    print(f"Pruned {pruned} entries from: {path}")
+
+
+@cache_app.command(name="compact")
+def cache_compact(
+    path: Path,
+    backend: Optional[Literal["dbm", "sqlite"]] = None,
+) -> None:
+    """
+    Reclaim the space of deleted or replaced entries of a preference cache.
+
+    :param path: Path of the preference cache.
+    :param backend: Backend of the preference cache. Detected if not given.
+    """
+    from ir_axioms.axiom.cache_maintenance import (
+        compact_preference_cache,
+        open_preference_cache,
+    )
+
+    with open_preference_cache(path, backend) as cache:
+        compact_preference_cache(cache)
+    print(f"Compacted: {path}")
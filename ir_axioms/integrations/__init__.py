@@ -11,3 +11,9 @@ from ir_axioms.integrations.pyterrier import (  # noqa: F401
     AggregatedAxiomaticPreferences,
     inject_pyterrier,
 )
+from ir_axioms.integrations.trec import (  # noqa: F401
+    ShardedTrecRunner,
+    inject_ir_datasets,
+    read_trec_run,
+    resolve_axiom,
+)
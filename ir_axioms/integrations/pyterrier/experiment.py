@@ -7,7 +7,7 @@ if is_pyterrier_installed() or TYPE_CHECKING:
     from functools import reduce, cached_property
     from math import nan
     from operator import or_
-    from typing import Sequence, Optional, Literal, Iterable
+    from typing import Callable, Sequence, Optional, Literal, Iterable
 
     from pandas import DataFrame, concat
     from pyterrier import Transformer
@@ -36,7 +36,15 @@ if is_pyterrier_installed() or TYPE_CHECKING:
         filter_by_topics: bool = False
         text_field: Optional[str] = "text"
         parallel_jobs: int = 1
-        parallel_backend: Literal["joblib", "ray"] = "joblib"
+        parallel_backend: Literal["joblib", "ray", "processes"] = "joblib"
+        """
+        Use PyTerrier's generic parallelization (``"joblib"`` or ``"ray"``), or distribute the queries over a pool of worker processes that each load their tools only once (``"processes"``).
+        The ``"processes"`` backend spawns its workers, so the calling script needs a ``if __name__ == "__main__":`` guard, and the axioms must be picklable.
+        """
+        worker_initializer: Optional[Callable[[], None]] = None
+        """
+        Function to call once in each worker process at start-up if the ``"processes"`` backend is used, e.g., to configure the dependency injection bindings with ``inject_pyterrier()``.
+        """
         verbose: bool = False
 
         @cached_property
@@ -103,9 +111,13 @@ if is_pyterrier_installed() or TYPE_CHECKING:
                 ],
                 text_field=self.text_field,
                 verbose=self.verbose,
+                n_jobs=(
+                    self.parallel_jobs if self.parallel_backend == "processes" else None
+                ),
+                worker_initializer=self.worker_initializer,
             )
             # Parallelize computation.
-            if self.parallel_jobs != 1:
+            if self.parallel_jobs != 1 and self.parallel_backend != "processes":
                 pipeline = pipeline.parallel(
                     self.parallel_jobs,
                     self.parallel_backend,
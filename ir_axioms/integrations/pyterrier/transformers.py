@@ -23,6 +23,7 @@ if is_pyterrier_installed() or TYPE_CHECKING:
     from tqdm.auto import tqdm
 
     from ir_axioms.axiom.base import Axiom
+    from ir_axioms.axiom.planner import plan_axioms
     from ir_axioms.axiom.retrieval.simple import ORIG
     from ir_axioms.integrations.pyterrier.utils import (
         query_columns,
@@ -32,13 +33,26 @@ if is_pyterrier_installed() or TYPE_CHECKING:
         load_query,
     )
     from ir_axioms.model import Query, Document
-    from ir_axioms.tools import PivotSelection, RandomPivotSelection
+    from ir_axioms.tools import (
+        PivotSelection,
+        RandomPivotSelection,
+        analysis_session,
+    )
+    from ir_axioms.utils.pool import map_warm_workers
 
     @dataclass(frozen=True, kw_only=True)
     class KwikSortReranker(Transformer):
         axiom: Axiom[Query, Document]
         pivot_selection: PivotSelection = RandomPivotSelection()
         text_field: Optional[str] = "text"
+        n_jobs: Optional[int] = None
+        """
+        Number of worker processes to distribute the queries over (e.g., ``-1`` for all CPUs), or ``None`` to process the queries in the current process.
+        """
+        worker_initializer: Optional[Callable[[], None]] = None
+        """
+        Function to call once in each worker process at start-up, e.g., to configure the dependency injection bindings with ``inject_pyterrier()``.
+        """
         verbose: bool = False
 
         @cached_property
@@ -89,18 +103,21 @@ if is_pyterrier_installed() or TYPE_CHECKING:
             if len(query_rankings) == 0:
                 return inp
             return concat(
-                [
-                    self._transform_group(
-                        group_keys=dict(zip(query_cols, grouping)),
-                        res=ranking,
-                    )
-                    for grouping, ranking in tqdm(
-                        query_rankings,
-                        desc="KwikSort re-rank",
-                        unit="query",
-                        disable=not self.verbose,
-                    )
-                ]
+                tqdm(
+                    map_warm_workers(
+                        self._transform_group,
+                        (
+                            (dict(zip(query_cols, grouping)), ranking)
+                            for grouping, ranking in query_rankings
+                        ),
+                        n_jobs=self.n_jobs,
+                        initializer=self.worker_initializer,
+                    ),
+                    desc="KwikSort re-rank",
+                    total=len(query_rankings),
+                    unit="query",
+                    disable=not self.verbose,
+                )
             )
 
     @dataclass(frozen=True)
@@ -111,6 +128,18 @@ if is_pyterrier_installed() or TYPE_CHECKING:
         )
         text_field: Optional[str] = "text"
         verbose: bool = False
+        n_jobs: Optional[int] = None
+        """
+        Number of worker processes to distribute the queries over (e.g., ``-1`` for all CPUs), or ``None`` to process the queries in the current process.
+        """
+        worker_initializer: Optional[Callable[[], None]] = None
+        """
+        Function to call once in each worker process at start-up, e.g., to configure the dependency injection bindings with ``inject_pyterrier()``.
+        """
+
+        @cached_property
+        def _planned_axioms(self) -> Sequence[Axiom[Query, Document]]:
+            return plan_axioms(self.axioms)
 
         def _transform_group(
             self, group_keys: Mapping[Hashable, Any], res: DataFrame
@@ -119,19 +148,21 @@ if is_pyterrier_installed() or TYPE_CHECKING:
             query = load_query(group_keys)
             documents = load_documents(res, text_column=self.text_field)
 
-            # Compute the axiomatic preference matrices.
+            # Compute the axiomatic preference matrices,
+            # sharing text analyses and common subexpressions between all axioms.
             # Shape: |documents| x |documents| x |axioms|
-            preferences: ndarray = stack(
-                tuple(
-                    # Shape: |documents| x |documents|
-                    axiom.preferences(
-                        input=query,
-                        outputs=documents,
-                    )
-                    for axiom in self.axioms
-                ),
-                axis=-1,
-            )
+            with analysis_session():
+                preferences: ndarray = stack(
+                    tuple(
+                        # Shape: |documents| x |documents|
+                        axiom.preferences(
+                            input=query,
+                            outputs=documents,
+                        )
+                        for axiom in self._planned_axioms
+                    ),
+                    axis=-1,
+                )
 
             # Aggregate the preferences.
             # Shape: |documents| x |axioms| x |aggregations|
@@ -170,18 +201,21 @@ if is_pyterrier_installed() or TYPE_CHECKING:
                 inp["features"] = None
                 return inp
             return concat(
-                [
-                    self._transform_group(
-                        group_keys=dict(zip(query_cols, grouping)),
-                        res=ranking,
-                    )
-                    for grouping, ranking in tqdm(
-                        query_rankings,
-                        desc="Aggregate axiom preferences",
-                        unit="query",
-                        disable=not self.verbose,
-                    )
-                ]
+                tqdm(
+                    map_warm_workers(
+                        self._transform_group,
+                        (
+                            (dict(zip(query_cols, grouping)), ranking)
+                            for grouping, ranking in query_rankings
+                        ),
+                        n_jobs=self.n_jobs,
+                        initializer=self.worker_initializer,
+                    ),
+                    desc="Aggregate axiom preferences",
+                    total=len(query_rankings),
+                    unit="query",
+                    disable=not self.verbose,
+                )
             )
 
     @dataclass(frozen=True)
@@ -190,6 +224,14 @@ if is_pyterrier_installed() or TYPE_CHECKING:
         axiom_names: Optional[Sequence[str]] = None
         text_field: Optional[str] = "text"
         verbose: bool = False
+        n_jobs: Optional[int] = None
+        """
+        Number of worker processes to distribute the queries over (e.g., ``-1`` for all CPUs), or ``None`` to process the queries in the current process.
+        """
+        worker_initializer: Optional[Callable[[], None]] = None
+        """
+        Function to call once in each worker process at start-up, e.g., to configure the dependency injection bindings with ``inject_pyterrier()``.
+        """
 
         @cached_property
         def _axiom_names(self) -> Sequence[str]:
@@ -201,6 +243,10 @@ if is_pyterrier_installed() or TYPE_CHECKING:
             else:
                 return [str(axiom) for axiom in self.axioms]
 
+        @cached_property
+        def _planned_axioms(self) -> Sequence[Axiom]:
+            return plan_axioms(self.axioms)
+
         def _transform_group(
             self, group_keys: Mapping[Hashable, Any], res: DataFrame
         ) -> DataFrame:
@@ -216,19 +262,21 @@ if is_pyterrier_installed() or TYPE_CHECKING:
                 sort=False,
             )
 
-            # Compute the axiomatic preference matrices.
+            # Compute the axiomatic preference matrices,
+            # sharing text analyses and common subexpressions between all axioms.
             # Shape: |axioms| x |documents| x |documents|
-            preferences: ndarray = stack(
-                tuple(
-                    # Shape: |documents| x |documents|
-                    axiom.preferences(
-                        input=query,
-                        outputs=documents,
-                    )
-                    for axiom in self.axioms
-                ),
-                axis=0,
-            )
+            with analysis_session():
+                preferences: ndarray = stack(
+                    tuple(
+                        # Shape: |documents| x |documents|
+                        axiom.preferences(
+                            input=query,
+                            outputs=documents,
+                        )
+                        for axiom in self._planned_axioms
+                    ),
+                    axis=0,
+                )
 
             # Flatten the result to have one row per document pair.
             # Shape: |axioms| x (|documents| * |documents|)
@@ -270,18 +318,21 @@ if is_pyterrier_installed() or TYPE_CHECKING:
                     inp[f"{axiom_name}_preference"] = None
                 return inp
             return concat(
-                [
-                    self._transform_group(
-                        group_keys=dict(zip(query_cols, grouping)),
-                        res=ranking,
-                    )
-                    for grouping, ranking in tqdm(
-                        query_rankings,
-                        desc="Compute axiom preferences",
-                        unit="query",
-                        disable=not self.verbose,
-                    )
-                ]
+                tqdm(
+                    map_warm_workers(
+                        self._transform_group,
+                        (
+                            (dict(zip(query_cols, grouping)), ranking)
+                            for grouping, ranking in query_rankings
+                        ),
+                        n_jobs=self.n_jobs,
+                        initializer=self.worker_initializer,
+                    ),
+                    desc="Compute axiom preferences",
+                    total=len(query_rankings),
+                    unit="query",
+                    disable=not self.verbose,
+                )
             )
 
 else:
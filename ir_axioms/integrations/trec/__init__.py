@@ -0,0 +1,10 @@
+# Re-export from sub-modules.
+
+from ir_axioms.integrations.trec.runner import (  # noqa: F401
+    ShardedTrecRunner,
+    resolve_axiom,
+)
+from ir_axioms.integrations.trec.utils import (  # noqa: F401
+    inject_ir_datasets,
+    read_trec_run,
+)
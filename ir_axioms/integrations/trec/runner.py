@@ -0,0 +1,300 @@
+from contextlib import nullcontext
+from dataclasses import dataclass
+from functools import cached_property, reduce
+from hashlib import blake2b
+from json import dumps, loads
+from operator import or_
+from pathlib import Path
+from shutil import copyfileobj
+from typing import (
+    Any,
+    Callable,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+from joblib import effective_n_jobs
+from numpy import stack
+from tqdm.auto import tqdm
+
+from ir_axioms.axiom.base import Axiom
+from ir_axioms.axiom.planner import plan_axioms
+from ir_axioms.axiom.retrieval.simple import ORIG
+from ir_axioms.integrations.trec.utils import inject_ir_datasets, read_trec_run
+from ir_axioms.model import Query, Document
+from ir_axioms.tools import RandomPivotSelection, analysis_session
+from ir_axioms.utils.fingerprint import fingerprint
+from ir_axioms.utils.injection import restore_bindings
+from ir_axioms.utils.pool import map_warm_workers
+
+_Rankings = Sequence[Tuple[str, Sequence[Document]]]
+
+_MANIFEST_NAME = "manifest.json"
+
+
+def resolve_axiom(axiom: Union[Axiom[Query, Document], str]) -> Axiom[Query, Document]:
+    """
+    Resolve an axiom by its name in ``ir_axioms.axiom`` (e.g., ``"TFC1"`` or ``"ArgUC"``).
+
+    :param axiom: The axiom or its name.
+    :return: The axiom, injected with the current dependency injection bindings if resolved by name.
+    """
+    if isinstance(axiom, Axiom):
+        return axiom
+
+    from ir_axioms import axiom as axiom_module
+
+    resolved = getattr(axiom_module, axiom, None)
+    if callable(resolved) and not isinstance(resolved, Axiom):
+        resolved = resolved()
+    if not isinstance(resolved, Axiom):
+        raise ValueError(f"Unknown axiom: {axiom}")
+    return resolved
+
+
+def _file_digest(path: Path) -> str:
+    digest = blake2b(digest_size=16)
+    with path.open("rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True, kw_only=True)
+class _ShardTask:
+    axioms: Sequence[Union[Axiom[Query, Document], str]]
+    mode: Literal["preferences", "kwiksort"]
+    dataset: Optional[str]
+    worker_initializer: Optional[Callable[[], None]]
+    seed: int
+    tag: str
+
+    @cached_property
+    def _axioms(self) -> Sequence[Axiom[Query, Document]]:
+        # Configure the bindings before resolving axioms by name in this process.
+        if self.worker_initializer is not None:
+            self.worker_initializer()
+        if self.dataset is not None:
+            inject_ir_datasets(self.dataset)
+        return [resolve_axiom(axiom) for axiom in self.axioms]
+
+    @cached_property
+    def _planned_axioms(self) -> Sequence[Axiom[Query, Document]]:
+        return plan_axioms(self._axioms)
+
+    @cached_property
+    def _kwiksort_axiom(self) -> Axiom[Query, Document]:
+        # Cascade the axioms in the given order and fall back to the original ranking.
+        return reduce(or_, self._axioms) | ORIG()
+
+    def _write_preferences(
+        self, file: TextIO, query: Query, documents: Sequence[Document]
+    ) -> None:
+        with analysis_session():
+            # Shape: |documents| x |documents| x |axioms|
+            preferences = stack(
+                [axiom.preferences(query, documents) for axiom in self._planned_axioms],
+                axis=-1,
+            )
+        for index1, document1 in enumerate(documents):
+            for index2, document2 in enumerate(documents):
+                values = "\t".join(
+                    str(value) for value in preferences[index1, index2].tolist()
+                )
+                file.write(f"{query.id}\t{document1.id}\t{document2.id}\t{values}\n")
+
+    def _write_kwiksort(
+        self, file: TextIO, query: Query, documents: Sequence[Document]
+    ) -> None:
+        # Seed the pivot selection per query, such that the re-ranking does not depend on the sharding.
+        ranking = self._kwiksort_axiom.rerank_kwiksort(
+            input=query,
+            ranking=documents,
+            pivot_selection=RandomPivotSelection(seed=f"{self.seed}:{query.id}"),
+        )
+        for rank, document in enumerate(ranking, start=1):
+            score = len(ranking) - rank + 1
+            file.write(f"{query.id} Q0 {document.id} {rank} {score} {self.tag}\n")
+
+    def __call__(self, shard_path: Path, rankings: _Rankings) -> Path:
+        # Write to a temporary file first, such that only complete shards are checkpointed.
+        temporary_path = shard_path.with_suffix(".tmp")
+        with temporary_path.open("wt") as file:
+            for qid, documents in rankings:
+                query = Query(id=qid)
+                if self.mode == "preferences":
+                    self._write_preferences(file, query, documents)
+                else:
+                    self._write_kwiksort(file, query, documents)
+        temporary_path.replace(shard_path)
+        return shard_path
+
+
+@dataclass(frozen=True, kw_only=True)
+class ShardedTrecRunner:
+    """
+    Compute axiomatic preferences or KwikSort re-rankings for a TREC run file, in shards over local worker processes.
+
+    The run's queries are split into contiguous shards, each of which is processed by one task and checkpointed to its own file.
+    An interrupted batch is resumed by re-running it with the same configuration and checkpoint directory, skipping all completed shards.
+    The shards are finally merged in the order of the queries in the run file, such that the output does not depend on the number of workers.
+    """
+
+    axioms: Sequence[Union[Axiom[Query, Document], str]]
+    """
+    Axioms (or their names in ``ir_axioms.axiom``, resolved in each worker) to compute the preferences of, or to cascade for re-ranking.
+    """
+    mode: Literal["preferences", "kwiksort"] = "preferences"
+    """
+    Whether to write the preferences of all document pairs (tab-separated, one column per axiom) or to write a KwikSort re-ranked TREC run.
+    """
+    queries_per_shard: int = 100
+    """
+    Number of queries per shard, i.e., per checkpoint.
+    """
+    n_jobs: Optional[int] = None
+    """
+    Number of worker processes to distribute the shards over (e.g., ``-1`` for all CPUs), or ``None`` to process the shards in the current process.
+    """
+    dataset: Optional[str] = None
+    """
+    ID of the ir_datasets dataset to look up the query and document texts from (see ``inject_ir_datasets()``).
+    """
+    worker_initializer: Optional[Callable[[], None]] = None
+    """
+    Function to call once in each worker process before resolving the axioms, e.g., to configure the dependency injection bindings with ``inject_pyterrier()``.
+    If the shards are processed in the current process, the bindings configured by the initializer or for the dataset are restored afterwards.
+    """
+    seed: int = 0
+    """
+    Seed of the random pivot selection for KwikSort.
+    """
+    tag: str = "ir_axioms"
+    """
+    Run tag of the re-ranked TREC run.
+    """
+    verbose: bool = False
+
+    @cached_property
+    def _axiom_names(self) -> Sequence[str]:
+        return [
+            axiom if isinstance(axiom, str) else str(axiom) for axiom in self.axioms
+        ]
+
+    def _manifest(self, run_path: Path, num_shards: int) -> Mapping[str, Any]:
+        return {
+            "run": _file_digest(run_path),
+            "mode": self.mode,
+            "axioms": [
+                axiom if isinstance(axiom, str) else fingerprint(axiom)
+                for axiom in self.axioms
+            ],
+            "shards": num_shards,
+            "queries_per_shard": self.queries_per_shard,
+            "dataset": self.dataset,
+            "seed": self.seed,
+            "tag": self.tag,
+        }
+
+    def _check_manifest(
+        self, checkpoint_dir: Path, manifest: Mapping[str, Any]
+    ) -> None:
+        manifest_path = checkpoint_dir / _MANIFEST_NAME
+        if manifest_path.exists():
+            if loads(manifest_path.read_text()) != manifest:
+                raise ValueError(
+                    f"Checkpoints in {checkpoint_dir} were created for another run file or configuration. "
+                    f"Remove them or choose another checkpoint directory."
+                )
+        else:
+            checkpoint_dir.mkdir(parents=True, exist_ok=True)
+            manifest_path.write_text(dumps(manifest, indent=2))
+
+    def _merge(self, shard_paths: Sequence[Path], output_path: Path) -> None:
+        temporary_path = output_path.with_name(f"{output_path.name}.tmp")
+        with temporary_path.open("wt") as file:
+            if self.mode == "preferences":
+                columns = ["qid", "docno_a", "docno_b", *self._axiom_names]
+                file.write("\t".join(columns) + "\n")
+            for shard_path in shard_paths:
+                with shard_path.open("rt") as shard_file:
+                    copyfileobj(shard_file, file)
+        temporary_path.replace(output_path)
+
+    def run(
+        self,
+        run_path: Path,
+        output_path: Path,
+        checkpoint_dir: Optional[Path] = None,
+        keep_checkpoints: bool = False,
+    ) -> Path:
+        """
+        Process a TREC run file and merge the shards' outputs.
+
+        :param run_path: Path of the TREC run file (optionally gzipped).
+        :param output_path: Path of the merged output file.
+        :param checkpoint_dir: Directory to checkpoint the shards to. Defaults to the output path with the suffix ``.shards``.
+        :param keep_checkpoints: Whether to keep the checkpointed shards after merging.
+        :return: The path of the merged output file.
+        """
+        if self.queries_per_shard < 1:
+            raise ValueError("Number of queries per shard must be at least 1.")
+        if checkpoint_dir is None:
+            checkpoint_dir = output_path.with_name(f"{output_path.name}.shards")
+
+        rankings = read_trec_run(run_path)
+        shards = [
+            rankings[start : start + self.queries_per_shard]
+            for start in range(0, len(rankings), self.queries_per_shard)
+        ]
+        shard_paths = [
+            checkpoint_dir / f"shard-{index:05d}-of-{len(shards):05d}.txt"
+            for index in range(len(shards))
+        ]
+
+        self._check_manifest(checkpoint_dir, self._manifest(run_path, len(shards)))
+        pending = [
+            (shard_path, shard)
+            for shard_path, shard in zip(shard_paths, shards)
+            if not shard_path.exists()
+        ]
+
+        task = _ShardTask(
+            axioms=self.axioms,
+            mode=self.mode,
+            dataset=self.dataset,
+            worker_initializer=self.worker_initializer,
+            seed=self.seed,
+            tag=self.tag,
+        )
+        in_process = self.n_jobs is None or effective_n_jobs(self.n_jobs) == 1
+        configures_bindings = (
+            self.dataset is not None or self.worker_initializer is not None
+        )
+        # Do not leak the task's bindings into the rest of the calling program.
+        with (
+            restore_bindings() if in_process and configures_bindings else nullcontext()
+        ):
+            for _ in tqdm(
+                map_warm_workers(task, pending, n_jobs=self.n_jobs),
+                desc="Process shards",
+                total=len(pending),
+                unit="shard",
+                disable=not self.verbose,
+            ):
+                pass
+
+        self._merge(shard_paths, output_path)
+
+        if not keep_checkpoints:
+            for shard_path in shard_paths:
+                shard_path.unlink()
+            (checkpoint_dir / _MANIFEST_NAME).unlink()
+            if not any(checkpoint_dir.iterdir()):
+                checkpoint_dir.rmdir()
+        return output_path
@@ -0,0 +1,74 @@
+from gzip import open as gzip_open
+from pathlib import Path
+from typing import Dict, IO, List, Sequence, Tuple, Union
+
+from injector import singleton, Injector, InstanceProvider
+from ir_datasets import Dataset
+
+from ir_axioms.dependency_injection import injector as _default_injector
+from ir_axioms.model import Query, Document
+from ir_axioms.tools import (
+    TextContents,
+    IrdsQueryTextContents,
+    IrdsDocumentTextContents,
+)
+from ir_axioms.utils.injection import reset_binding_scopes
+
+
+def inject_ir_datasets(
+    dataset: Union[Dataset, str],
+    injector: Injector = _default_injector,
+) -> None:
+    """
+    Look up the texts of queries and documents without text from an ir_datasets dataset.
+
+    :param dataset: The dataset or its ID.
+    :param injector: The injector to configure.
+    """
+    injector.binder.bind(
+        interface=TextContents[Query],
+        to=InstanceProvider(IrdsQueryTextContents(dataset=dataset)),
+        scope=singleton,
+    )
+    injector.binder.bind(
+        interface=TextContents[Document],
+        to=InstanceProvider(IrdsDocumentTextContents(dataset=dataset)),
+        scope=singleton,
+    )
+    reset_binding_scopes(injector)
+
+
+def _open_text(path: Path) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip_open(path, "rt")
+    return path.open("rt")
+
+
+def read_trec_run(path: Path) -> Sequence[Tuple[str, Sequence[Document]]]:
+    """
+    Read the rankings of a TREC run file (optionally gzipped).
+
+    :param path: Path of the run file, with lines ``qid Q0 docno rank score tag``.
+    :return: The query IDs and their ranked documents, in the order in which the queries first appear in the run file.
+    """
+    rankings: Dict[str, List[Tuple[int, Document]]] = {}
+    with _open_text(path) as file:
+        for line_number, line in enumerate(file, start=1):
+            if len(line.strip()) == 0:
+                continue
+            parts = line.split()
+            if len(parts) != 6:
+                raise ValueError(
+                    f"Invalid line {line_number} in TREC run file {path}: {line!r}"
+                )
+            qid, _, docno, rank, score, _ = parts
+            rankings.setdefault(qid, []).append(
+                (
+                    int(rank),
+                    Document(id=docno, rank=int(rank), score=float(score)),
+                )
+            )
+    return [
+        (qid, [document for _, document in sorted(ranking, key=lambda item: item[0])])
+        for qid, ranking in rankings.items()
+    ]
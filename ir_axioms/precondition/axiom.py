@@ -21,6 +21,15 @@ class AxiomPrecondition(Precondition[Input, Output], Generic[Input, Output]):
     expected_sign: Literal[1, 0, -1] = 0
     strip_preconditions: bool = True
 
+    @property
+    def symmetric(self) -> bool:
+        # Only "no preference" is symmetric for antisymmetric axioms.
+        return self.expected_sign == 0 and self.axiom.antisymmetric
+
+    @property
+    def input_dependent(self) -> bool:
+        return self.axiom.input_dependent
+
     def precondition(
         self,
         input: Input,
@@ -3,6 +3,7 @@ from typing import Generic, Sequence, Protocol
 from numpy import array
 from tqdm.auto import tqdm
 
+from ir_axioms.utils.matrix import symmetric_mask, upper_triangle_indices
 from ir_axioms.model.base import (
     Input,
     Mask,
@@ -16,6 +17,22 @@ class Precondition(Generic[Input, Output], Protocol):
     A precondition can be used to restrict an axiom's preference computation to only those outputs that meet a certain condition (e.g., similar length).
     """
 
+    @property
+    def symmetric(self) -> bool:
+        """
+        Whether this precondition is guaranteed to be symmetric, i.e., it holds for ``output1`` and ``output2`` if and only if it holds for ``output2`` and ``output1``.
+
+        If so, a mask matrix can be computed from only the pairs on and above the diagonal.
+        """
+        return False
+
+    @property
+    def input_dependent(self) -> bool:
+        """
+        Whether this precondition may depend on the input, e.g., on the query.
+        """
+        return True
+
     def precondition(
         self,
         input: Input,
@@ -44,6 +61,27 @@ class Precondition(Generic[Input, Output], Protocol):
         :param outputs: The outputs for the common input.
         :return: A mask matrix, where the ij-th entry corresponds to whether the precondition holds for the i-th and j-th output.
         """
+        if self.symmetric:
+            rows, columns = upper_triangle_indices(
+                len(outputs),
+                include_diagonal=True,
+            )
+            return symmetric_mask(
+                len(outputs),
+                [
+                    self.precondition(
+                        input=input,
+                        output1=outputs[i1],
+                        output2=outputs[i2],
+                    )
+                    for i1, i2 in tqdm(
+                        zip(rows, columns),
+                        desc="Preconditions",
+                        total=len(rows),
+                    )
+                ],
+            )
+
         return array(
             list(
                 tqdm(
@@ -1,16 +1,15 @@
 from dataclasses import dataclass
-from itertools import product
 from math import isclose
 from typing import Final, Sequence, TypeVar
 
 from injector import inject, NoInject
-from numpy import array, bool_
 from tqdm.auto import tqdm
 
 from ir_axioms.model import Document, Mask, MaskMatrix
 from ir_axioms.precondition.base import Precondition
 from ir_axioms.tools import TextContents, TermTokenizer
 from ir_axioms.utils.lazy import lazy_inject
+from ir_axioms.utils.matrix import symmetric_mask, upper_triangle_indices
 
 Input = TypeVar("Input")
 
@@ -22,6 +21,14 @@ class LenPrecondition(Precondition[Input, Document]):
     term_tokenizer: TermTokenizer
     margin_fraction: NoInject[float] = 0.1
 
+    @property
+    def symmetric(self) -> bool:
+        return True
+
+    @property
+    def input_dependent(self) -> bool:
+        return False
+
     def precondition(
         self,
         input: Input,
@@ -48,31 +55,28 @@ class LenPrecondition(Precondition[Input, Document]):
         outputs: Sequence[Document],
     ) -> MaskMatrix:
         lengths = [
-            len(
-                self.term_tokenizer.terms_unordered(self.text_contents.contents(output))
-            )
-            for output in tqdm(
-                outputs,
-                desc="Lengths",
-                unit="document",
+            len(terms)
+            for terms in self.term_tokenizer.terms_unordered_batch(
+                [self.text_contents.contents(output) for output in outputs]
             )
         ]
-        return array(
+        rows, columns = upper_triangle_indices(len(lengths), include_diagonal=True)
+        return symmetric_mask(
+            len(lengths),
             [
                 isclose(
-                    length1,
-                    length2,
+                    lengths[i1],
+                    lengths[i2],
                     rel_tol=self.margin_fraction,
                 )
-                for length1, length2 in tqdm(
-                    product(lengths, repeat=2),
-                    total=len(lengths) * len(lengths),
+                for i1, i2 in tqdm(
+                    zip(rows, columns),
+                    total=len(rows),
                     desc="Compare lengths",
                     unit="pair",
                 )
             ],
-            dtype=bool_,
-        ).reshape((len(outputs), len(outputs)))
+        )
 
 
 LEN: Final = lazy_inject(LenPrecondition)
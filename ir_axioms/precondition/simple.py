@@ -14,6 +14,14 @@ Input = TypeVar("Input")
 @inject
 @dataclass(frozen=True, kw_only=True)
 class NopPrecondition(Precondition[Input, Document]):
+    @property
+    def symmetric(self) -> bool:
+        return True
+
+    @property
+    def input_dependent(self) -> bool:
+        return False
+
     def precondition(
         self,
         input: Input,
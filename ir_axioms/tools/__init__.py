@@ -2,6 +2,12 @@ from injector import Module, Binder
 
 # Re-export from sub-modules.
 
+from ir_axioms.tools.analysis import (  # noqa: F401
+    AnalysisSession,
+    analysis_session,
+    active_analysis_session,
+)
+
 from ir_axioms.tools.aspects import (  # noqa: F401
     AspectExtraction,
     KeyBertAspectExtraction,
@@ -13,11 +19,14 @@ from ir_axioms.tools.aspects import (  # noqa: F401
 
 from ir_axioms.tools.contents import (  # noqa: F401
     TextContents,
+    AsyncTextContents,
+    async_contents,
     DocumentQueryTextContents,
     IrdsDocumentTextContents,
     IrdsQueryTextContents,
     AnseriniDocumentTextContents,
     TerrierDocumentTextContents,
+    PreTokenizedDocumentTextContents,
     HasText,
     SimpleTextContents,
     ContentsModule,
@@ -38,6 +47,14 @@ from ir_axioms.tools.pivot import (  # noqa: F401
     PivotModule,
 )
 
+from ir_axioms.tools.pre_tokenized import (  # noqa: F401
+    PreTokenizedStore,
+    build_pre_tokenized_store,
+    irds_documents,
+    terrier_documents,
+    anserini_documents,
+)
+
 from ir_axioms.tools.similarity import (  # noqa: F401
     TermSimilarity,
     SentenceSimilarity,
@@ -53,6 +70,7 @@ from ir_axioms.tools.text_statistics import (  # noqa: F401
     AnseriniTextStatistics,
     TerrierDocumentTextStatistics,
     SimpleTextStatistics,
+    PreTokenizedDocumentTextStatistics,
     TextStatisticsModule,
 )
 
@@ -63,6 +81,11 @@ from ir_axioms.tools.tokenizer import (  # noqa: F401
     NltkSentenceTokenizer,
     AnseriniTermTokenizer,
     TerrierTermTokenizer,
+    SessionTermTokenizer,
+    SessionSentenceTokenizer,
+    CachingTermTokenizer,
+    TokenizerCacheStatistics,
+    PreTokenizedTermTokenizer,
     TokenizerModule,
 )
 
@@ -0,0 +1,9 @@
+# Re-export from sub-modules.
+from ir_axioms.tools.analysis.session import (  # noqa: F401
+    AnalysisSession,
+    active_analysis_session,
+    analysis_session,
+    memoize_analysis,
+    memoize_analysis_batch,
+    analysis_key,
+)
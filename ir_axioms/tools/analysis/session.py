@@ -0,0 +1,158 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+_K = TypeVar("_K", bound=Hashable)
+_T = TypeVar("_T")
+
+
+@dataclass(kw_only=True)
+class AnalysisSession:
+    """
+    Store of text analyses (e.g., terms, sentences, or term counts of the query and documents) that is shared by all axioms, preconditions, and tools during a single evaluation, e.g., of one query's ranking.
+
+    Use ``analysis_session()`` to activate a session. Analyses are only memoized while a session is active, so that outputs with the same ID but different contents in separate evaluations never collide.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    _analyses: Dict[Tuple[str, Hashable], Any] = field(
+        default_factory=dict,
+        repr=False,
+    )
+
+    def __len__(self) -> int:
+        return len(self._analyses)
+
+    def memoize(
+        self,
+        analysis: str,
+        key: Hashable,
+        compute: Callable[[], _T],
+    ) -> _T:
+        """
+        Get a memoized analysis, or compute and memoize it.
+
+        :param analysis: Name of the analysis (e.g., ``"terms"``).
+        :param key: Key of the analyzed query or document (e.g., its ID or text).
+        :param compute: Function to compute the analysis if it is not memoized yet.
+        :return: The (memoized) analysis.
+        """
+        store_key = (analysis, key)
+        if store_key in self._analyses:
+            self.hits += 1
+            return self._analyses[store_key]
+        self.misses += 1
+        value = compute()
+        self._analyses[store_key] = value
+        return value
+
+    def memoize_batch(
+        self,
+        analysis: str,
+        keys: Sequence[_K],
+        compute: Callable[[Sequence[_K]], Sequence[_T]],
+    ) -> Sequence[_T]:
+        """
+        Get many memoized analyses, and compute and memoize all missing analyses at once.
+
+        :param analysis: Name of the analysis (e.g., ``"terms"``).
+        :param keys: Keys of the analyzed queries or documents (e.g., their texts).
+        :param compute: Function to compute the analyses for all missing keys at once.
+        :return: The (memoized) analyses, in the order of the keys.
+        """
+        missing_keys: List[_K] = list(
+            dict.fromkeys(key for key in keys if (analysis, key) not in self._analyses)
+        )
+        self.hits += len(keys) - len(missing_keys)
+        self.misses += len(missing_keys)
+        if len(missing_keys) > 0:
+            for key, value in zip(missing_keys, compute(missing_keys)):
+                self._analyses[(analysis, key)] = value
+        return [self._analyses[(analysis, key)] for key in keys]
+
+    def clear(self) -> None:
+        self._analyses.clear()
+
+
+_active_session: ContextVar[Optional[AnalysisSession]] = ContextVar(
+    "analysis_session",
+    default=None,
+)
+
+
+def active_analysis_session() -> Optional[AnalysisSession]:
+    """
+    Get the currently active analysis session, if any.
+    """
+    return _active_session.get()
+
+
+@contextmanager
+def analysis_session() -> Iterator[AnalysisSession]:
+    """
+    Share text analyses between all axioms, preconditions, and tools within this context.
+    If a session is already active, that session is re-used.
+    """
+    session = _active_session.get()
+    if session is not None:
+        yield session
+        return
+
+    session = AnalysisSession()
+    token = _active_session.set(session)
+    try:
+        yield session
+    finally:
+        _active_session.reset(token)
+        session.clear()
+
+
+def memoize_analysis(
+    analysis: str,
+    key: Hashable,
+    compute: Callable[[], _T],
+) -> _T:
+    """
+    Memoize an analysis in the active analysis session, or just compute it if no session is active.
+    """
+    session = _active_session.get()
+    if session is None:
+        return compute()
+    return session.memoize(analysis, key, compute)
+
+
+def memoize_analysis_batch(
+    analysis: str,
+    keys: Sequence[_K],
+    compute: Callable[[Sequence[_K]], Sequence[_T]],
+) -> Sequence[_T]:
+    """
+    Memoize many analyses in the active analysis session, or just compute them if no session is active.
+    """
+    session = _active_session.get()
+    if session is None:
+        return compute(keys)
+    return session.memoize_batch(analysis, keys, compute)
+
+
+def analysis_key(input: Any) -> Optional[Hashable]:
+    """
+    Key to memoize analyses of a query or document by, i.e., its type and ID, or ``None`` if it has no ID.
+    """
+    id = getattr(input, "id", None)
+    if not id:
+        return None
+    return (type(input).__qualname__, id)
@@ -6,7 +6,9 @@ from ir_axioms.model import Document, Query, GenerationInput, GenerationOutput
 
 # Re-export from sub-modules.
 from ir_axioms.tools.contents.base import (  # noqa: F401
+    AsyncTextContents,
     TextContents,
+    async_contents,
 )
 
 from ir_axioms.tools.contents.combine import (  # noqa: F401
@@ -27,6 +29,10 @@ from ir_axioms.tools.contents.pyterrier import (  # noqa: F401
     TerrierDocumentTextContents,
 )
 
+from ir_axioms.tools.contents.pre_tokenized import (  # noqa: F401
+    PreTokenizedDocumentTextContents,
+)
+
 from ir_axioms.tools.contents.simple import (  # noqa: F401
     HasText,
     SimpleTextContents,
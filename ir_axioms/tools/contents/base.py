@@ -1,5 +1,7 @@
 from typing import TypeVar, Generic, Protocol, runtime_checkable
 
+from ir_axioms.utils.concurrency import run_blocking
+
 
 T = TypeVar("T", contravariant=True)
 
@@ -7,3 +9,25 @@ T = TypeVar("T", contravariant=True)
 @runtime_checkable
 class TextContents(Generic[T], Protocol):
     def contents(self, input: T) -> str: ...
+
+
+@runtime_checkable
+class AsyncTextContents(Generic[T], Protocol):
+    """
+    Text contents that can be fetched asynchronously, e.g., from a remote service or from disk.
+    """
+
+    async def acontents(self, input: T) -> str: ...
+
+
+async def async_contents(text_contents: TextContents[T], input: T) -> str:
+    """
+    Asynchronously get the text contents of an input, natively if the text contents support it, or in a worker thread otherwise.
+
+    :param text_contents: The text contents.
+    :param input: The input to get the text contents of.
+    :return: The input's text contents.
+    """
+    if isinstance(text_contents, AsyncTextContents):
+        return await text_contents.acontents(input)
+    return await run_blocking(text_contents.contents, input)
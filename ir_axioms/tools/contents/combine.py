@@ -4,7 +4,7 @@ from typing import Union
 from injector import inject
 
 from ir_axioms.model import Document, Query, GenerationInput, GenerationOutput
-from ir_axioms.tools.contents.base import TextContents
+from ir_axioms.tools.contents.base import TextContents, async_contents
 
 
 @inject
@@ -19,6 +19,12 @@ class DocumentQueryTextContents(TextContents[Union[Document, Query]]):
         elif isinstance(input, Query):
             return self.query_text_contents.contents(input)
 
+    async def acontents(self, input: Union[Document, Query]) -> str:
+        if isinstance(input, Document):
+            return await async_contents(self.document_text_contents, input)
+        elif isinstance(input, Query):
+            return await async_contents(self.query_text_contents, input)
+
 
 @inject
 @dataclass(frozen=True, kw_only=True)
@@ -33,3 +39,9 @@ class GenerationInputOutputTextContents(
             return self.generation_input_text_contents.contents(input)
         elif isinstance(input, GenerationOutput):
             return self.generation_output_text_contents.contents(input)
+
+    async def acontents(self, input: Union[GenerationInput, GenerationOutput]) -> str:
+        if isinstance(input, GenerationInput):
+            return await async_contents(self.generation_input_text_contents, input)
+        elif isinstance(input, GenerationOutput):
+            return await async_contents(self.generation_output_text_contents, input)
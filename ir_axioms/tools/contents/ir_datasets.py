@@ -8,6 +8,7 @@ from ir_datasets.indices import Docstore
 
 from ir_axioms.model.retrieval import Document, Query
 from ir_axioms.tools.contents.base import TextContents
+from ir_axioms.utils.concurrency import run_blocking
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -31,6 +32,12 @@ class IrdsDocumentTextContents(TextContents[Document]):
         irds_document: GenericDoc = self._documents_store.get(input.id)
         return irds_document.default_text()
 
+    async def acontents(self, input: Document) -> str:
+        if input.text is not None:
+            return input.text
+        # Look up the document store in a worker thread.
+        return await run_blocking(self.contents, input)
+
 
 @dataclass(frozen=True, kw_only=True)
 class IrdsQueryTextContents(TextContents[Query]):
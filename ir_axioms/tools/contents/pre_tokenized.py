@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Optional, Union
+
+from ir_axioms.model.retrieval import Document
+from ir_axioms.model.utils import TokenizedString
+from ir_axioms.tools.contents.base import TextContents
+from ir_axioms.tools.pre_tokenized.store import (
+    PreTokenizedStore,
+    as_pre_tokenized_store,
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class PreTokenizedDocumentTextContents(TextContents[Document]):
+    """
+    Text contents read from a pre-tokenized store.
+    The contents are tokenized strings, such that text statistics can use the stored term counts without tokenizing the text again.
+    """
+
+    store: Union[PreTokenizedStore, Path, str]
+    text_contents: Optional[TextContents[Document]] = None
+    """
+    Text contents to fall back to for documents that are not in the store.
+    """
+
+    @cached_property
+    def _store(self) -> PreTokenizedStore:
+        return as_pre_tokenized_store(self.store)
+
+    def contents(self, input: Document) -> str:
+        if input.text is not None:
+            return input.text
+        index = self._store.document_index(input.id)
+        if index is not None:
+            return TokenizedString(
+                self._store.text(index),
+                tokens=self._store.term_counts(index),
+            )
+        if self.text_contents is not None:
+            return self.text_contents.contents(input)
+        raise KeyError(f"Document '{input.id}' not found in pre-tokenized store.")
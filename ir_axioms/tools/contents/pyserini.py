@@ -10,6 +10,7 @@ if is_pyserini_installed() or TYPE_CHECKING:
 
     from ir_axioms.model.retrieval import Document
     from ir_axioms.tools.contents.base import TextContents
+    from ir_axioms.utils.concurrency import run_blocking
     from ir_axioms.utils.pyserini import LuceneSearcher, get_searcher
 
     @dataclass(frozen=True, kw_only=True)
@@ -28,5 +29,11 @@ if is_pyserini_installed() or TYPE_CHECKING:
                 raise KeyError(f"Document '{input.id}' not found in index.")
             return document.contents()
 
+        async def acontents(self, input: Document) -> str:
+            if input.text is not None:
+                return input.text
+            # Look up the index in a worker thread.
+            return await run_blocking(self.contents, input)
+
 else:
     AnseriniDocumentTextContents = NotImplemented  # type: ignore
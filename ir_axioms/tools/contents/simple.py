@@ -13,3 +13,7 @@ class SimpleTextContents(TextContents[HasText]):
         if input.text is not None:
             return input.text
         raise ValueError(f"Could not get text contents from: {input}")
+
+    async def acontents(self, input: HasText) -> str:
+        # No I/O needed.
+        return self.contents(input)
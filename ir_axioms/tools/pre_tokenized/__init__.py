@@ -0,0 +1,11 @@
+# Re-export from sub-modules.
+from ir_axioms.tools.pre_tokenized.store import (  # noqa: F401
+    PreTokenizedStore,
+)
+
+from ir_axioms.tools.pre_tokenized.build import (  # noqa: F401
+    build_pre_tokenized_store,
+    irds_documents,
+    terrier_documents,
+    anserini_documents,
+)
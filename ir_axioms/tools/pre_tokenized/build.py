@@ -0,0 +1,199 @@
+from array import array
+from itertools import islice
+from json import dumps
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from numpy import asarray, frombuffer, int32, int64, save, uint8
+from tqdm.auto import tqdm
+
+from ir_axioms.model import Document
+from ir_axioms.tools.contents.base import TextContents
+from ir_axioms.tools.pre_tokenized.store import (
+    DOCUMENT_IDS_FILE,
+    METADATA_FILE,
+    OFFSETS_FILE,
+    STORE_VERSION,
+    TEXT_HASH_SIZE,
+    TEXT_HASHES_FILE,
+    TEXT_OFFSETS_FILE,
+    TEXTS_FILE,
+    TOKENS_FILE,
+    VOCABULARY_FILE,
+    PreTokenizedStore,
+    text_hash,
+)
+from ir_axioms.tools.tokenizer.base import TermTokenizer
+
+
+def build_pre_tokenized_store(
+    path: Path,
+    documents: Iterable[Document],
+    term_tokenizer: TermTokenizer,
+    text_contents: Optional[TextContents[Document]] = None,
+    batch_size: int = 1000,
+    verbose: bool = False,
+) -> PreTokenizedStore:
+    """
+    Tokenize a collection once and write the tokens to a pre-tokenized store.
+
+    Documents are streamed in batches through the term tokenizer, such that the collection never needs to fit into memory.
+    The store contains the vocabulary, the concatenated int32 term IDs of all documents with per-document offsets, and the documents' texts.
+
+    :param path: Directory to write the store to.
+    :param documents: Documents to tokenize, e.g., from ``irds_documents``, ``terrier_documents``, or ``anserini_documents``.
+    :param term_tokenizer: Term tokenizer to tokenize the documents with. Should be the same as used at query time.
+    :param text_contents: Text contents to get the documents' texts from, if the documents do not have a text.
+    :param batch_size: Number of documents to tokenize at once.
+    :param verbose: Whether to show a progress bar.
+    :return: The written store.
+    """
+    path.mkdir(parents=True, exist_ok=True)
+
+    vocabulary: Dict[str, int] = {}
+    document_ids: List[str] = []
+    offsets = array("q", [0])
+    text_offsets = array("q", [0])
+    text_hashes: List[bytes] = []
+
+    documents_iterator = iter(
+        tqdm(
+            documents,
+            desc="Pre-tokenizing",
+            unit="document",
+            disable=not verbose,
+        )
+    )
+
+    with (
+        (path / TOKENS_FILE).open("wb") as tokens_file,
+        (path / TEXTS_FILE).open("wb") as texts_file,
+    ):
+        while True:
+            batch = list(islice(documents_iterator, batch_size))
+            if len(batch) == 0:
+                break
+
+            texts: List[str] = []
+            for document in batch:
+                if document.text is not None:
+                    texts.append(document.text)
+                elif text_contents is not None:
+                    texts.append(text_contents.contents(document))
+                else:
+                    raise ValueError(
+                        f"Could not get text contents of document: {document.id}"
+                    )
+
+            for document, text, terms in zip(
+                batch, texts, term_tokenizer.terms_batch(texts)
+            ):
+                term_ids = asarray(
+                    [vocabulary.setdefault(term, len(vocabulary)) for term in terms],
+                    dtype=int32,
+                )
+                tokens_file.write(term_ids.tobytes())
+                offsets.append(offsets[-1] + len(term_ids))
+
+                encoded_text = text.encode(encoding="utf-8")
+                texts_file.write(encoded_text)
+                text_offsets.append(text_offsets[-1] + len(encoded_text))
+                text_hashes.append(text_hash(text))
+
+                document_ids.append(document.id)
+
+    save(path / OFFSETS_FILE, asarray(offsets, dtype=int64))
+    save(path / TEXT_OFFSETS_FILE, asarray(text_offsets, dtype=int64))
+    save(
+        path / TEXT_HASHES_FILE,
+        frombuffer(b"".join(text_hashes), dtype=uint8).reshape(-1, TEXT_HASH_SIZE),
+    )
+    (path / VOCABULARY_FILE).write_text(
+        dumps(list(vocabulary.keys())), encoding="utf-8"
+    )
+    (path / DOCUMENT_IDS_FILE).write_text(dumps(document_ids), encoding="utf-8")
+    (path / METADATA_FILE).write_text(
+        dumps(
+            {
+                "version": STORE_VERSION,
+                "term_tokenizer": repr(term_tokenizer),
+                "num_documents": len(document_ids),
+                "num_tokens": offsets[-1],
+                "vocabulary_size": len(vocabulary),
+            }
+        ),
+        encoding="utf-8",
+    )
+    return PreTokenizedStore(path=path)
+
+
+def irds_documents(dataset: Any) -> Iterator[Document]:
+    """
+    Stream the documents of an ir_datasets dataset.
+
+    :param dataset: The ir_datasets dataset or its ID.
+    :return: Iterator over the dataset's documents, with texts.
+    """
+    from ir_datasets import Dataset, load as irds_load
+
+    if not isinstance(dataset, Dataset):
+        dataset = irds_load(dataset)
+    for irds_document in dataset.docs_iter():
+        yield Document(
+            id=irds_document.doc_id,
+            text=irds_document.default_text(),
+        )
+
+
+def terrier_documents(
+    index_location: Union[Any, Path, str],
+    text_field: str = "text",
+) -> Iterator[Document]:
+    """
+    Stream the documents of a Terrier index.
+    The index must store the documents' texts in its metaindex.
+
+    :param index_location: The Terrier index, index reference, or index location.
+    :param text_field: Metaindex key of the documents' texts.
+    :return: Iterator over the index's documents, with texts.
+    """
+    from pyterrier.terrier import IndexFactory
+
+    if isinstance(index_location, Path):
+        index = IndexFactory.of(str(index_location.absolute()))
+    elif isinstance(index_location, str):
+        index = IndexFactory.of(index_location)
+    elif hasattr(index_location, "getMetaIndex"):
+        index = index_location
+    else:
+        index = IndexFactory.of(index_location)
+
+    meta_index = index.getMetaIndex()
+    num_documents = int(index.getCollectionStatistics().getNumberOfDocuments())
+    for doc_id in range(num_documents):
+        yield Document(
+            id=str(meta_index.getItem("docno", doc_id)),
+            text=str(meta_index.getItem(text_field, doc_id)),
+        )
+
+
+def anserini_documents(index_dir: Union[Path, str]) -> Iterator[Document]:
+    """
+    Stream the documents of an Anserini index.
+    The index must store the documents' contents.
+
+    :param index_dir: Directory of the Anserini index.
+    :return: Iterator over the index's documents, with texts.
+    """
+    from ir_axioms.utils.pyserini import get_index_reader
+
+    index_reader = get_index_reader(index_dir)
+    num_documents = int(index_reader.stats()["documents"])
+    for internal_id in range(num_documents):
+        document_id = index_reader.convert_internal_docid_to_collection_docid(
+            internal_id
+        )
+        yield Document(
+            id=document_id,
+            text=index_reader.doc_contents(document_id),
+        )
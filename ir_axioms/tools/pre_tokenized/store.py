@@ -0,0 +1,174 @@
+from dataclasses import dataclass
+from functools import cached_property
+from hashlib import blake2b
+from json import loads
+from pathlib import Path
+from typing import Any, Mapping, Optional, Sequence, Union
+
+from numpy import int32, int64, load, memmap, uint8, unique, zeros
+from numpy.typing import NDArray
+
+METADATA_FILE = "metadata.json"
+VOCABULARY_FILE = "vocabulary.json"
+DOCUMENT_IDS_FILE = "document_ids.json"
+TOKENS_FILE = "tokens.bin"
+OFFSETS_FILE = "offsets.npy"
+TEXTS_FILE = "texts.bin"
+TEXT_OFFSETS_FILE = "text_offsets.npy"
+TEXT_HASHES_FILE = "text_hashes.npy"
+
+STORE_VERSION = 1
+TEXT_HASH_SIZE = 16
+
+
+def text_hash(text: str) -> bytes:
+    """
+    Content hash used to look up pre-tokenized texts.
+
+    :param text: Text to hash.
+    :return: blake2b digest of the UTF-8 encoded text.
+    """
+    return blake2b(
+        text.encode(encoding="utf-8"),
+        digest_size=TEXT_HASH_SIZE,
+    ).digest()
+
+
+@dataclass(frozen=True, kw_only=True)
+class PreTokenizedStore:
+    """
+    Read-only view of a pre-tokenized collection, as written by ``build_pre_tokenized_store``.
+
+    Token IDs and texts are memory-mapped, such that reading a document's tokens does not copy the underlying data and the store can be shared between processes through the operating system's page cache.
+    """
+
+    path: Path
+
+    @cached_property
+    def metadata(self) -> Mapping[str, Any]:
+        metadata: Mapping[str, Any] = loads(
+            (self.path / METADATA_FILE).read_text(encoding="utf-8")
+        )
+        if metadata.get("version") != STORE_VERSION:
+            raise ValueError(
+                f"Unsupported pre-tokenized store version "
+                f"{metadata.get('version')} at {self.path}."
+            )
+        return metadata
+
+    @cached_property
+    def vocabulary(self) -> Sequence[str]:
+        return loads((self.path / VOCABULARY_FILE).read_text(encoding="utf-8"))
+
+    @cached_property
+    def _term_ids(self) -> Mapping[str, int]:
+        return {term: term_id for term_id, term in enumerate(self.vocabulary)}
+
+    @cached_property
+    def document_ids(self) -> Sequence[str]:
+        return loads((self.path / DOCUMENT_IDS_FILE).read_text(encoding="utf-8"))
+
+    @cached_property
+    def _document_indices(self) -> Mapping[str, int]:
+        return {
+            document_id: index for index, document_id in enumerate(self.document_ids)
+        }
+
+    @cached_property
+    def _tokens(self) -> NDArray[int32]:
+        if self.metadata["num_tokens"] == 0:
+            # Empty files cannot be memory-mapped.
+            return zeros(0, dtype=int32)
+        return memmap(self.path / TOKENS_FILE, dtype=int32, mode="r")
+
+    @cached_property
+    def _offsets(self) -> NDArray[int64]:
+        return load(self.path / OFFSETS_FILE, mmap_mode="r")
+
+    @cached_property
+    def _texts(self) -> NDArray[uint8]:
+        if self._text_offsets[-1] == 0:
+            # Empty files cannot be memory-mapped.
+            return zeros(0, dtype=uint8)
+        return memmap(self.path / TEXTS_FILE, dtype=uint8, mode="r")
+
+    @cached_property
+    def _text_offsets(self) -> NDArray[int64]:
+        return load(self.path / TEXT_OFFSETS_FILE, mmap_mode="r")
+
+    @cached_property
+    def _text_indices(self) -> Mapping[bytes, int]:
+        text_hashes = load(self.path / TEXT_HASHES_FILE, mmap_mode="r")
+        return {digest.tobytes(): index for index, digest in enumerate(text_hashes)}
+
+    def __len__(self) -> int:
+        return len(self.document_ids)
+
+    def __contains__(self, document_id: object) -> bool:
+        return document_id in self._document_indices
+
+    def document_index(self, document_id: str) -> Optional[int]:
+        """
+        Look up the index of a document in the store.
+
+        :param document_id: ID of the document.
+        :return: The document's index, or ``None`` if the document is not stored.
+        """
+        return self._document_indices.get(document_id)
+
+    def text_index(self, text: str) -> Optional[int]:
+        """
+        Look up the index of a document in the store by its text.
+
+        :param text: Text contents of the document.
+        :return: The index of a document with that text, or ``None`` if no such document is stored.
+        """
+        return self._text_indices.get(text_hash(text))
+
+    def term_id(self, term: str) -> Optional[int]:
+        return self._term_ids.get(term)
+
+    def token_ids(self, index: int) -> NDArray[int32]:
+        """
+        Get the term IDs of a document's tokens, in order.
+
+        :param index: Index of the document.
+        :return: Read-only view into the memory-mapped token IDs.
+        """
+        return self._tokens[self._offsets[index] : self._offsets[index + 1]]
+
+    def terms(self, index: int) -> Sequence[str]:
+        vocabulary = self.vocabulary
+        return [vocabulary[term_id] for term_id in self.token_ids(index).tolist()]
+
+    def unique_terms(self, index: int) -> Sequence[str]:
+        vocabulary = self.vocabulary
+        return [
+            vocabulary[term_id] for term_id in unique(self.token_ids(index)).tolist()
+        ]
+
+    def term_counts(self, index: int) -> Mapping[str, int]:
+        vocabulary = self.vocabulary
+        term_ids, counts = unique(self.token_ids(index), return_counts=True)
+        return {
+            vocabulary[term_id]: count
+            for term_id, count in zip(term_ids.tolist(), counts.tolist())
+        }
+
+    def text(self, index: int) -> str:
+        start = self._text_offsets[index]
+        end = self._text_offsets[index + 1]
+        return self._texts[start:end].tobytes().decode(encoding="utf-8")
+
+
+def as_pre_tokenized_store(
+    store: Union[PreTokenizedStore, Path, str],
+) -> PreTokenizedStore:
+    if isinstance(store, PreTokenizedStore):
+        return store
+    elif isinstance(store, Path):
+        return PreTokenizedStore(path=store)
+    elif isinstance(store, str):
+        return PreTokenizedStore(path=Path(store))
+    else:
+        raise ValueError(f"Cannot load pre-tokenized store from {store}.")
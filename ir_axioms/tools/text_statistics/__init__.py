@@ -26,6 +26,10 @@ from ir_axioms.tools.text_statistics.simple import (  # noqa: F401
     SimpleTextStatistics,
 )
 
+from ir_axioms.tools.text_statistics.pre_tokenized import (  # noqa: F401
+    PreTokenizedDocumentTextStatistics,
+)
+
 
 class TextStatisticsModule(Module):
     def configure(self, binder: Binder) -> None:
@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Mapping, Optional, Union
+
+from ir_axioms.model import Document
+from ir_axioms.tools.pre_tokenized.store import (
+    PreTokenizedStore,
+    as_pre_tokenized_store,
+)
+from ir_axioms.tools.text_statistics.base import TextStatistics
+
+
+@dataclass(frozen=True, kw_only=True)
+class PreTokenizedDocumentTextStatistics(TextStatistics[Document]):
+    """
+    Text statistics counted from the term IDs in a pre-tokenized store, without reading or tokenizing the documents' texts.
+    """
+
+    store: Union[PreTokenizedStore, Path, str]
+    text_statistics: Optional[TextStatistics[Document]] = None
+    """
+    Text statistics to fall back to for documents that are not in the store.
+    """
+
+    @cached_property
+    def _store(self) -> PreTokenizedStore:
+        return as_pre_tokenized_store(self.store)
+
+    def term_counts(self, document: Document) -> Mapping[str, int]:
+        index = self._store.document_index(document.id)
+        if index is not None:
+            return self._store.term_counts(index)
+        if self.text_statistics is not None:
+            return self.text_statistics.term_counts(document)
+        raise KeyError(f"Document '{document.id}' not found in pre-tokenized store.")
@@ -5,6 +5,7 @@ from typing import Mapping, TypeVar
 from injector import inject
 
 from ir_axioms.model.utils import TokenizedString
+from ir_axioms.tools.analysis.session import analysis_key, memoize_analysis
 from ir_axioms.tools.text_statistics.base import TextStatistics
 from ir_axioms.tools.contents.base import TextContents
 from ir_axioms.tools.tokenizer.base import TermTokenizer
@@ -20,6 +21,16 @@ class SimpleTextStatistics(TextStatistics[T]):
     term_tokenizer: TermTokenizer
 
     def term_counts(self, document: T) -> Mapping[str, int]:
+        key = analysis_key(document)
+        if key is None:
+            return self._term_counts(document)
+        return memoize_analysis(
+            "term_counts",
+            key,
+            lambda: self._term_counts(document),
+        )
+
+    def _term_counts(self, document: T) -> Mapping[str, int]:
         text = self.text_contents.contents(input=document)
         if isinstance(text, TokenizedString):
             return text.tokens
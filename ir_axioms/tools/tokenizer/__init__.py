@@ -1,4 +1,4 @@
-from injector import Module, Binder, singleton
+from injector import Module, Binder, singleton, inject
 
 # Re-export from sub-modules.
 
@@ -26,16 +26,65 @@ from ir_axioms.tools.tokenizer.spacy import (  # noqa: F401
     SpacySentenceTokenizer,
 )
 
+from ir_axioms.tools.tokenizer.caching import (  # noqa: F401
+    CachingTermTokenizer,
+    TokenizerCacheStatistics,
+)
+
+from ir_axioms.tools.tokenizer.session import (  # noqa: F401
+    SessionTermTokenizer,
+    SessionSentenceTokenizer,
+)
+
+from ir_axioms.tools.tokenizer.pre_tokenized import (  # noqa: F401
+    PreTokenizedTermTokenizer,
+)
+
 
 class TokenizerModule(Module):
     def configure(self, binder: Binder) -> None:
+        @inject
+        def _make_caching_term_tokenizer(
+            term_tokenizer: SpacyTermTokenizer,
+        ) -> CachingTermTokenizer:
+            return CachingTermTokenizer(term_tokenizer=term_tokenizer)
+
+        @inject
+        def _make_session_term_tokenizer(
+            term_tokenizer: CachingTermTokenizer,
+        ) -> TermTokenizer:
+            return SessionTermTokenizer(term_tokenizer=term_tokenizer)
+
+        @inject
+        def _make_session_sentence_tokenizer(
+            sentence_tokenizer: SpacySentenceTokenizer,
+        ) -> SentenceTokenizer:
+            return SessionSentenceTokenizer(sentence_tokenizer=sentence_tokenizer)
+
         binder.bind(
-            interface=TermTokenizer,
+            interface=SpacyTermTokenizer,
             to=SpacyTermTokenizer,
             scope=singleton,
         )
         binder.bind(
-            interface=SentenceTokenizer,
+            interface=SpacySentenceTokenizer,
             to=SpacySentenceTokenizer,
             scope=singleton,
         )
+        # Re-bind to persist the cache, e.g.:
+        # CachingTermTokenizer(term_tokenizer=..., cache_path=Path("terms.sqlite"))
+        binder.bind(
+            interface=CachingTermTokenizer,
+            to=_make_caching_term_tokenizer,
+            scope=singleton,
+        )
+        binder.bind(
+            interface=TermTokenizer,
+            to=_make_session_term_tokenizer,
+            scope=singleton,
+        )
+        binder.bind(
+            interface=SentenceTokenizer,
+            to=_make_session_sentence_tokenizer,
+            scope=singleton,
+        )
@@ -11,7 +11,25 @@ class TermTokenizer(Protocol):
     def unique_terms(self, text: str) -> AbstractSet[str]:
         return set(self.terms(text))
 
+    def terms_batch(self, texts: Sequence[str]) -> Sequence[Sequence[str]]:
+        """
+        Tokenize many texts at once, e.g., to use a tokenizer's more efficient batch processing.
+        """
+        return [self.terms(text) for text in texts]
+
+    def terms_unordered_batch(self, texts: Sequence[str]) -> Sequence[Collection[str]]:
+        return [self.terms_unordered(text) for text in texts]
+
+    def unique_terms_batch(self, texts: Sequence[str]) -> Sequence[AbstractSet[str]]:
+        return [self.unique_terms(text) for text in texts]
+
 
 @runtime_checkable
 class SentenceTokenizer(Protocol):
     def sentences(self, text: str) -> Sequence[str]: ...
+
+    def sentences_batch(self, texts: Sequence[str]) -> Sequence[Sequence[str]]:
+        """
+        Split many texts into sentences at once, e.g., to use a tokenizer's more efficient batch processing.
+        """
+        return [self.sentences(text) for text in texts]
@@ -0,0 +1,203 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import cached_property
+from hashlib import blake2b
+from json import dumps, loads
+from pathlib import Path
+from sqlite3 import Connection, connect
+from threading import Lock
+from typing import AbstractSet, Any, Collection, Dict, Optional, Sequence
+
+from ir_axioms.tools.tokenizer.base import TermTokenizer
+
+
+@dataclass(kw_only=True)
+class TokenizerCacheStatistics:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        if total == 0:
+            return 0
+        return self.hits / total
+
+
+@dataclass(frozen=True, kw_only=True)
+class CachingTermTokenizer(TermTokenizer):
+    """
+    Term tokenizer that caches the wrapped tokenizer's terms in a bounded in-memory LRU cache and, optionally, in a persistent SQLite database, so that repeated runs skip tokenization entirely.
+
+    Texts are keyed by a content hash together with the wrapped tokenizer's representation, such that differently configured tokenizers can share the same database.
+    """
+
+    term_tokenizer: TermTokenizer
+    max_size: Optional[int] = 10_000
+    """
+    Maximum number of texts kept in memory, or ``None`` for an unbounded cache.
+    """
+    cache_path: Optional[Path] = None
+    """
+    Path of the SQLite database to persist the terms in, or ``None`` to only cache in memory.
+    """
+
+    statistics: TokenizerCacheStatistics = field(
+        default_factory=TokenizerCacheStatistics,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _memory_cache: "OrderedDict[str, Sequence[str]]" = field(
+        default_factory=OrderedDict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _lock: Lock = field(
+        default_factory=Lock,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    @cached_property
+    def _namespace(self) -> bytes:
+        return repr(self.term_tokenizer).encode(encoding="utf-8")
+
+    @cached_property
+    def _connection(self) -> Optional[Connection]:
+        if self.cache_path is None:
+            return None
+        self.cache_path.parent.mkdir(exist_ok=True, parents=True)
+        connection = connect(self.cache_path, check_same_thread=False)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS terms (key TEXT PRIMARY KEY, terms TEXT NOT NULL)"
+        )
+        connection.commit()
+        return connection
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Locks and database connections cannot be shared with other processes,
+        # so each process starts with its own empty memory cache and connection.
+        state = dict(self.__dict__)
+        for name in ("statistics", "_memory_cache", "_lock", "_connection"):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        object.__setattr__(self, "statistics", TokenizerCacheStatistics())
+        object.__setattr__(self, "_memory_cache", OrderedDict())
+        object.__setattr__(self, "_lock", Lock())
+
+    def _key(self, text: str) -> str:
+        digest = blake2b(self._namespace, digest_size=16)
+        digest.update(b"\0")
+        digest.update(text.encode(encoding="utf-8"))
+        return digest.hexdigest()
+
+    def _remember(self, key: str, terms: Sequence[str]) -> None:
+        self._memory_cache[key] = terms
+        self._memory_cache.move_to_end(key)
+        if self.max_size is not None:
+            while len(self._memory_cache) > self.max_size:
+                self._memory_cache.popitem(last=False)
+
+    def _lookup(self, key: str) -> Optional[Sequence[str]]:
+        if key in self._memory_cache:
+            self.statistics.memory_hits += 1
+            self._memory_cache.move_to_end(key)
+            return self._memory_cache[key]
+
+        if self._connection is not None:
+            row = self._connection.execute(
+                "SELECT terms FROM terms WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                self.statistics.disk_hits += 1
+                terms: Sequence[str] = loads(row[0])
+                self._remember(key, terms)
+                return terms
+
+        self.statistics.misses += 1
+        return None
+
+    def _store(self, keys: Sequence[str], terms: Sequence[Sequence[str]]) -> None:
+        for key, key_terms in zip(keys, terms):
+            self._remember(key, key_terms)
+        if self._connection is not None:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO terms (key, terms) VALUES (?, ?)",
+                ((key, dumps(key_terms)) for key, key_terms in zip(keys, terms)),
+            )
+            self._connection.commit()
+
+    def terms(self, text: str) -> Sequence[str]:
+        key = self._key(text)
+        with self._lock:
+            cached_terms = self._lookup(key)
+        if cached_terms is not None:
+            return cached_terms
+
+        terms = list(self.term_tokenizer.terms(text))
+
+        with self._lock:
+            self._store([key], [terms])
+        return terms
+
+    def terms_batch(self, texts: Sequence[str]) -> Sequence[Sequence[str]]:
+        keys = [self._key(text) for text in texts]
+        with self._lock:
+            cached_terms = [self._lookup(key) for key in keys]
+        missing_indices = [
+            index for index, terms in enumerate(cached_terms) if terms is None
+        ]
+        if len(missing_indices) == 0:
+            return cached_terms  # type: ignore[return-value]
+
+        missing_terms = [
+            list(terms)
+            for terms in self.term_tokenizer.terms_batch(
+                [texts[index] for index in missing_indices]
+            )
+        ]
+
+        with self._lock:
+            self._store([keys[index] for index in missing_indices], missing_terms)
+        for index, terms in zip(missing_indices, missing_terms):
+            cached_terms[index] = terms
+        return cached_terms  # type: ignore[return-value]
+
+    def terms_unordered(self, text: str) -> Collection[str]:
+        if type(self.term_tokenizer).terms_unordered is TermTokenizer.terms_unordered:
+            return self.terms(text)
+        return self.term_tokenizer.terms_unordered(text)
+
+    def unique_terms(self, text: str) -> AbstractSet[str]:
+        if type(self.term_tokenizer).unique_terms is TermTokenizer.unique_terms:
+            return set(self.terms(text))
+        return self.term_tokenizer.unique_terms(text)
+
+    def terms_unordered_batch(self, texts: Sequence[str]) -> Sequence[Collection[str]]:
+        if type(self.term_tokenizer).terms_unordered is TermTokenizer.terms_unordered:
+            return self.terms_batch(texts)
+        return self.term_tokenizer.terms_unordered_batch(texts)
+
+    def unique_terms_batch(self, texts: Sequence[str]) -> Sequence[AbstractSet[str]]:
+        if type(self.term_tokenizer).unique_terms is TermTokenizer.unique_terms:
+            return [set(terms) for terms in self.terms_batch(texts)]
+        return self.term_tokenizer.unique_terms_batch(texts)
+
+    def close(self) -> None:
+        """
+        Close the connection to the SQLite database, if any.
+        """
+        connection = self.__dict__.pop("_connection", None)
+        if connection is not None:
+            connection.close()
@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import AbstractSet, List, Optional, Sequence, Union
+
+from ir_axioms.tools.pre_tokenized.store import (
+    PreTokenizedStore,
+    as_pre_tokenized_store,
+)
+from ir_axioms.tools.tokenizer.base import TermTokenizer
+
+
+@dataclass(frozen=True, kw_only=True)
+class PreTokenizedTermTokenizer(TermTokenizer):
+    """
+    Term tokenizer that reads the terms of known texts from a pre-tokenized store (by their content hash), and only tokenizes unknown texts, e.g., queries, with the fallback tokenizer.
+    """
+
+    store: Union[PreTokenizedStore, Path, str]
+    term_tokenizer: Optional[TermTokenizer] = None
+    """
+    Term tokenizer to fall back to for texts that are not in the store. Should be the same tokenizer that the store was built with.
+    """
+
+    @cached_property
+    def _store(self) -> PreTokenizedStore:
+        return as_pre_tokenized_store(self.store)
+
+    def _fallback(self) -> TermTokenizer:
+        if self.term_tokenizer is None:
+            raise KeyError("Text not found in pre-tokenized store.")
+        return self.term_tokenizer
+
+    def terms(self, text: str) -> Sequence[str]:
+        index = self._store.text_index(text)
+        if index is not None:
+            return self._store.terms(index)
+        return self._fallback().terms(text)
+
+    def unique_terms(self, text: str) -> AbstractSet[str]:
+        index = self._store.text_index(text)
+        if index is not None:
+            return set(self._store.unique_terms(index))
+        return self._fallback().unique_terms(text)
+
+    def terms_batch(self, texts: Sequence[str]) -> Sequence[Sequence[str]]:
+        indices = [self._store.text_index(text) for text in texts]
+        terms: List[Optional[Sequence[str]]] = [
+            self._store.terms(index) if index is not None else None for index in indices
+        ]
+        missing_indices = [
+            position for position, index in enumerate(indices) if index is None
+        ]
+        if len(missing_indices) > 0:
+            missing_terms = self._fallback().terms_batch(
+                [texts[position] for position in missing_indices]
+            )
+            for position, position_terms in zip(missing_indices, missing_terms):
+                terms[position] = position_terms
+        return terms  # type: ignore[return-value]
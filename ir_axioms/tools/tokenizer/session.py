@@ -0,0 +1,137 @@
+from dataclasses import dataclass
+from functools import cached_property
+from typing import AbstractSet, Callable, Collection, Sequence, Tuple, TypeVar
+
+from ir_axioms.tools.analysis.session import memoize_analysis, memoize_analysis_batch
+from ir_axioms.tools.tokenizer.base import SentenceTokenizer, TermTokenizer
+
+_T = TypeVar("_T")
+
+_Key = Tuple[str, str]
+
+
+def _texts(
+    compute: Callable[[Sequence[str]], Sequence[_T]],
+) -> Callable[[Sequence[_Key]], Sequence[_T]]:
+    # Compute the analyses for the texts of (namespace, text) keys.
+    return lambda keys: compute([text for _, text in keys])
+
+
+@dataclass(frozen=True, kw_only=True)
+class SessionTermTokenizer(TermTokenizer):
+    """
+    Term tokenizer that memoizes the wrapped tokenizer's terms in the active analysis session (see ``analysis_session()``), so that each text is only tokenized once per evaluation.
+
+    Texts are keyed together with the wrapped tokenizer's representation, such that differently configured tokenizers in the same session do not share their terms.
+    """
+
+    term_tokenizer: TermTokenizer
+
+    @cached_property
+    def _namespace(self) -> str:
+        return repr(self.term_tokenizer)
+
+    def _key(self, text: str) -> _Key:
+        return self._namespace, text
+
+    @property
+    def _derive_terms_unordered(self) -> bool:
+        # Derive from the memoized terms instead of tokenizing again.
+        return (
+            type(self.term_tokenizer).terms_unordered is TermTokenizer.terms_unordered
+        )
+
+    @property
+    def _derive_unique_terms(self) -> bool:
+        # Derive from the memoized terms instead of tokenizing again.
+        return type(self.term_tokenizer).unique_terms is TermTokenizer.unique_terms
+
+    def terms(self, text: str) -> Sequence[str]:
+        return memoize_analysis(
+            "terms",
+            self._key(text),
+            lambda: self.term_tokenizer.terms(text),
+        )
+
+    def terms_unordered(self, text: str) -> Collection[str]:
+        if self._derive_terms_unordered:
+            return self.terms(text)
+        return memoize_analysis(
+            "terms_unordered",
+            self._key(text),
+            lambda: self.term_tokenizer.terms_unordered(text),
+        )
+
+    def unique_terms(self, text: str) -> AbstractSet[str]:
+        if self._derive_unique_terms:
+            return memoize_analysis(
+                "unique_terms",
+                self._key(text),
+                lambda: set(self.terms(text)),
+            )
+        return memoize_analysis(
+            "unique_terms",
+            self._key(text),
+            lambda: self.term_tokenizer.unique_terms(text),
+        )
+
+    def terms_batch(self, texts: Sequence[str]) -> Sequence[Sequence[str]]:
+        return memoize_analysis_batch(
+            "terms",
+            [self._key(text) for text in texts],
+            _texts(self.term_tokenizer.terms_batch),
+        )
+
+    def terms_unordered_batch(self, texts: Sequence[str]) -> Sequence[Collection[str]]:
+        if self._derive_terms_unordered:
+            return self.terms_batch(texts)
+        return memoize_analysis_batch(
+            "terms_unordered",
+            [self._key(text) for text in texts],
+            _texts(self.term_tokenizer.terms_unordered_batch),
+        )
+
+    def unique_terms_batch(self, texts: Sequence[str]) -> Sequence[AbstractSet[str]]:
+        if self._derive_unique_terms:
+            return memoize_analysis_batch(
+                "unique_terms",
+                [self._key(text) for text in texts],
+                _texts(lambda texts: [set(terms) for terms in self.terms_batch(texts)]),
+            )
+        return memoize_analysis_batch(
+            "unique_terms",
+            [self._key(text) for text in texts],
+            _texts(self.term_tokenizer.unique_terms_batch),
+        )
+
+
+@dataclass(frozen=True, kw_only=True)
+class SessionSentenceTokenizer(SentenceTokenizer):
+    """
+    Sentence tokenizer that memoizes the wrapped tokenizer's sentences in the active analysis session (see ``analysis_session()``), so that each text is only split once per evaluation.
+
+    Texts are keyed together with the wrapped tokenizer's representation, such that differently configured tokenizers in the same session do not share their sentences.
+    """
+
+    sentence_tokenizer: SentenceTokenizer
+
+    @cached_property
+    def _namespace(self) -> str:
+        return repr(self.sentence_tokenizer)
+
+    def _key(self, text: str) -> _Key:
+        return self._namespace, text
+
+    def sentences(self, text: str) -> Sequence[str]:
+        return memoize_analysis(
+            "sentences",
+            self._key(text),
+            lambda: self.sentence_tokenizer.sentences(text),
+        )
+
+    def sentences_batch(self, texts: Sequence[str]) -> Sequence[Sequence[str]]:
+        return memoize_analysis_batch(
+            "sentences",
+            [self._key(text) for text in texts],
+            _texts(self.sentence_tokenizer.sentences_batch),
+        )
@@ -1,10 +1,10 @@
 from dataclasses import dataclass
 from functools import cached_property
-from typing import Iterable, Sequence
+from typing import AbstractSet, Collection, Iterable, Optional, Sequence
 
 from spacy import load as spacy_load
 from spacy.language import Language
-from spacy.tokens import Token
+from spacy.tokens import Doc, Token
 
 from ir_axioms.tools.tokenizer.base import TermTokenizer, SentenceTokenizer
 
@@ -16,17 +16,29 @@ class SpacyTermTokenizer(TermTokenizer):
     lowercase: bool = True
     remove_punctuation: bool = True
     remove_stopwords: bool = True
+    batch_size: Optional[int] = None
+    """
+    Number of texts to process per batch in ``terms_batch()`` (spaCy's default if ``None``).
+    """
+    n_process: int = 1
+    """
+    Number of processes to use in ``terms_batch()``.
+    """
 
     @cached_property
     def _language(self) -> Language:
+        # Punctuation and stopwords are lexical attributes, so only the lemmatizer (and the components it depends on) is needed.
         return spacy_load(
             name=self.language_name,
-            # exclude=["parser", "ner"] + (["lemmatizer"] if not self.lemmatize else []),
+            exclude=["parser", "ner", "senter"]
+            + (
+                ["tok2vec", "tagger", "morphologizer", "attribute_ruler", "lemmatizer"]
+                if not self.lemmatize
+                else []
+            ),
         )
 
-    def terms(self, text: str) -> Sequence[str]:
-        document = self._language(text)
-
+    def _terms(self, document: Doc) -> Sequence[str]:
         tokens: Iterable[Token] = (token for token in document)
         if self.remove_punctuation:
             tokens = (token for token in tokens if not token.is_punct)
@@ -43,19 +55,56 @@ class SpacyTermTokenizer(TermTokenizer):
 
         return list(terms)
 
+    def terms(self, text: str) -> Sequence[str]:
+        return self._terms(self._language(text))
+
+    def terms_batch(self, texts: Sequence[str]) -> Sequence[Sequence[str]]:
+        return [
+            self._terms(document)
+            for document in self._language.pipe(
+                texts,
+                batch_size=self.batch_size,
+                n_process=self.n_process,
+            )
+        ]
+
+    def terms_unordered_batch(self, texts: Sequence[str]) -> Sequence[Collection[str]]:
+        return self.terms_batch(texts)
+
+    def unique_terms_batch(self, texts: Sequence[str]) -> Sequence[AbstractSet[str]]:
+        return [set(terms) for terms in self.terms_batch(texts)]
+
 
 @dataclass(frozen=True, kw_only=True)
 class SpacySentenceTokenizer(SentenceTokenizer):
     language_name: str = "en_core_web_sm"
+    batch_size: Optional[int] = None
+    """
+    Number of texts to process per batch in ``sentences_batch()`` (spaCy's default if ``None``).
+    """
+    n_process: int = 1
+    """
+    Number of processes to use in ``sentences_batch()``.
+    """
 
     @cached_property
     def _language(self) -> Language:
+        # Sentence boundaries are set by the dependency parser, which only depends on the token-to-vector component.
         return spacy_load(
             name=self.language_name,
-            # exclude=["parser", "ner", "lemmatizer"],
-            # enable=["sentencizer"],
+            exclude=["tagger", "morphologizer", "attribute_ruler", "lemmatizer", "ner"],
         )
 
     def sentences(self, text: str) -> Sequence[str]:
         document = self._language(text)
         return [sentence.text for sentence in document.sents]
+
+    def sentences_batch(self, texts: Sequence[str]) -> Sequence[Sequence[str]]:
+        return [
+            [sentence.text for sentence in document.sents]
+            for document in self._language.pipe(
+                texts,
+                batch_size=self.batch_size,
+                n_process=self.n_process,
+            )
+        ]
@@ -0,0 +1,46 @@
+from asyncio import Semaphore, to_thread
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+_T = TypeVar("_T")
+
+_active_limit: ContextVar[Optional[Semaphore]] = ContextVar(
+    "concurrency_limit", default=None
+)
+
+
+@contextmanager
+def concurrency_limit(max_concurrency: int) -> Iterator[Semaphore]:
+    """
+    Limit the number of blocking calls (e.g., requests to remote services) that the asynchronous axiom and tool methods run concurrently within this context.
+    The limit is shared by all tasks started within the context, e.g., by the preferences of all queries awaited in one event loop.
+    Without a limit, concurrency is only bounded by the size of the event loop's default thread pool.
+
+    :param max_concurrency: Maximum number of concurrent blocking calls.
+    :return: The semaphore that limits the concurrency.
+    """
+    if max_concurrency < 1:
+        raise ValueError("Maximum concurrency must be at least 1.")
+    limit = Semaphore(max_concurrency)
+    token = _active_limit.set(limit)
+    try:
+        yield limit
+    finally:
+        _active_limit.reset(token)
+
+
+async def run_blocking(function: Callable[..., _T], *args: Any) -> _T:
+    """
+    Run a blocking function in a worker thread, within the active concurrency limit (see ``concurrency_limit()``).
+    The function runs in a copy of the current context, e.g., sharing the active analysis session.
+
+    :param function: The blocking function.
+    :param args: Arguments to call the function with.
+    :return: The function's result.
+    """
+    limit = _active_limit.get()
+    if limit is None:
+        return await to_thread(function, *args)
+    async with limit:
+        return await to_thread(function, *args)
@@ -0,0 +1,57 @@
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from hashlib import blake2b
+from pathlib import PurePath
+from typing import AbstractSet, Any, Mapping
+
+
+def _qualified_name(obj: Any) -> str:
+    return f"{obj.__module__}.{obj.__qualname__}"
+
+
+def _describe(obj: Any, exclude: AbstractSet[str] = frozenset()) -> str:
+    if obj is None or isinstance(obj, (bool, int, float, str, bytes, Enum, PurePath)):
+        return repr(obj)
+    elif isinstance(obj, type):
+        return _qualified_name(obj)
+    elif is_dataclass(obj):
+        # Only fields that define equality are part of the configuration,
+        # e.g., not internal caches or statistics.
+        described_fields = ", ".join(
+            f"{field.name}={_describe(getattr(obj, field.name))}"
+            for field in fields(obj)
+            if field.compare and field.name not in exclude
+        )
+        return f"{_qualified_name(type(obj))}({described_fields})"
+    elif isinstance(obj, Mapping):
+        described_items = sorted(
+            f"{_describe(key)}: {_describe(value)}" for key, value in obj.items()
+        )
+        return "{" + ", ".join(described_items) + "}"
+    elif isinstance(obj, (set, frozenset)):
+        return "{" + ", ".join(sorted(_describe(item) for item in obj)) + "}"
+    elif isinstance(obj, (list, tuple)):
+        return "[" + ", ".join(_describe(item) for item in obj) + "]"
+    elif hasattr(obj, "__qualname__") and hasattr(obj, "__module__"):
+        # Functions and other named callables.
+        return _qualified_name(obj)
+    elif type(obj).__repr__ is not object.__repr__:
+        return repr(obj)
+    else:
+        # The default representation contains the memory address, which is not stable.
+        return _qualified_name(type(obj))
+
+
+def fingerprint(obj: Any, exclude: AbstractSet[str] = frozenset()) -> str:
+    """
+    Compute a deterministic fingerprint of an object's class and configuration, e.g., of an axiom.
+
+    Unlike ``repr()``, the fingerprint is stable across runs, as it does not depend on memory addresses.
+    Dataclasses are described by their compared fields, collections by their items, and other objects by their custom representation or, otherwise, only by their class.
+
+    :param obj: The object to fingerprint.
+    :param exclude: Names of the object's fields to exclude from the fingerprint, e.g., parameters that do not affect cached values.
+    :return: Hexadecimal blake2b digest of the object's description.
+    """
+    description = _describe(obj, exclude).encode(encoding="utf-8")
+    return blake2b(description, digest_size=16).hexdigest()
@@ -1,3 +1,6 @@
+from contextlib import contextmanager
+from typing import Iterator
+
 from injector import Injector, Binder, Provider, Scope
 
 from ir_axioms.dependency_injection import injector as _default_injector
@@ -14,3 +17,15 @@ def reset_binding_scopes(injector: Injector = _default_injector) -> None:
             scope_instance: Scope = scope_provider.get(injector)
             scope_instance.configure()
         binder = binder.parent
+
+
+@contextmanager
+def restore_bindings(injector: Injector = _default_injector) -> Iterator[Injector]:
+    """Restore the bindings (and reset the binding scopes) when leaving this context, e.g., to configure bindings only temporarily in the current process."""
+    bindings = dict(injector.binder._bindings)
+    try:
+        yield injector
+    finally:
+        injector.binder._bindings.clear()
+        injector.binder._bindings.update(bindings)
+        reset_binding_scopes(injector)
@@ -0,0 +1,55 @@
+from typing import Tuple
+
+from numpy import float_, intp, triu_indices, zeros, bool_
+from numpy.typing import ArrayLike, NDArray
+
+
+def upper_triangle_indices(
+    size: int,
+    include_diagonal: bool = False,
+) -> Tuple[NDArray[intp], NDArray[intp]]:
+    """
+    Row and column indices of the upper triangle of a square matrix, in row-major order.
+
+    :param size: Number of rows (and columns) of the matrix.
+    :param include_diagonal: Whether to include the diagonal entries.
+    :return: A tuple of row indices and column indices.
+    """
+    return triu_indices(size, k=0 if include_diagonal else 1)
+
+
+def antisymmetric_matrix(
+    size: int,
+    upper_triangle: ArrayLike,
+) -> NDArray[float_]:
+    """
+    Build an antisymmetric matrix from the entries above its diagonal, i.e., mirror the negated upper triangle to the lower triangle.
+    The diagonal is always zero.
+
+    :param size: Number of rows (and columns) of the matrix.
+    :param upper_triangle: Entries above the diagonal, in the order of ``upper_triangle_indices(size)``.
+    :return: The full antisymmetric matrix.
+    """
+    rows, columns = upper_triangle_indices(size)
+    matrix = zeros((size, size), dtype=float_)
+    matrix[rows, columns] = upper_triangle
+    matrix[columns, rows] = -matrix[rows, columns]
+    return matrix
+
+
+def symmetric_mask(
+    size: int,
+    upper_triangle: ArrayLike,
+) -> NDArray[bool_]:
+    """
+    Build a symmetric mask matrix from the entries on and above its diagonal, i.e., mirror the upper triangle to the lower triangle.
+
+    :param size: Number of rows (and columns) of the matrix.
+    :param upper_triangle: Entries on and above the diagonal, in the order of ``upper_triangle_indices(size, include_diagonal=True)``.
+    :return: The full symmetric mask matrix.
+    """
+    rows, columns = upper_triangle_indices(size, include_diagonal=True)
+    matrix = zeros((size, size), dtype=bool_)
+    matrix[rows, columns] = upper_triangle
+    matrix[columns, rows] = matrix[rows, columns]
+    return matrix
@@ -0,0 +1,61 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pickle import dumps, loads  # nosec: B403
+from typing import Callable, Iterable, Iterator, Optional, Tuple, TypeVar, cast
+
+from joblib import effective_n_jobs
+
+_T = TypeVar("_T")
+
+# Function of this worker process, as set up once at start-up.
+_worker_function: Optional[Callable[..., object]] = None
+
+
+def _initialize_worker(
+    pickled_function: bytes,
+    initializer: Optional[Callable[[], None]],
+) -> None:
+    global _worker_function
+    if initializer is not None:
+        initializer()
+    # Only unpickle the function after the worker is set up.
+    _worker_function = loads(pickled_function)  # nosec: B301
+
+
+def _call_worker_function(args: Tuple) -> object:
+    if _worker_function is None:
+        raise RuntimeError("Worker process was not initialized.")
+    return _worker_function(*args)
+
+
+def map_warm_workers(
+    function: Callable[..., _T],
+    args: Iterable[Tuple],
+    n_jobs: Optional[int] = None,
+    initializer: Optional[Callable[[], None]] = None,
+) -> Iterator[_T]:
+    """
+    Apply a function to each tuple of arguments in a pool of spawned worker processes, yielding the results in order.
+
+    The function (e.g., a bound method of a transformer and thus its axioms) is sent to each worker only once at start-up, and not with every task.
+    Tools that the function loads lazily (e.g., spaCy models, index readers, or word embeddings) are thus loaded once per worker and stay warm for all following tasks.
+    As workers are spawned, the calling script must guard its entry point with ``if __name__ == "__main__":``.
+
+    :param function: The function to apply. Must be picklable.
+    :param args: Tuples of arguments to apply the function to.
+    :param n_jobs: Number of worker processes (e.g., ``-1`` for all CPUs), or ``None`` or ``1`` to apply the function in the current process.
+    :param initializer: Function to call once in each worker at start-up, before the function is unpickled (e.g., to configure dependency injection bindings). Must be picklable.
+    :return: Iterator over the function's results, in the order of the arguments.
+    """
+    if n_jobs is None or effective_n_jobs(n_jobs) == 1:
+        for arg in args:
+            yield function(*arg)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=effective_n_jobs(n_jobs),
+        mp_context=get_context("spawn"),
+        initializer=_initialize_worker,
+        initargs=(dumps(function), initializer),
+    ) as executor:
+        yield from cast(Iterator[_T], executor.map(_call_worker_function, args))
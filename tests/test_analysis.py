@@ -0,0 +1,91 @@
+from dataclasses import dataclass
+from typing import Sequence
+
+from ir_axioms.model import Document
+from ir_axioms.tools import (
+    SessionTermTokenizer,
+    SimpleTextContents,
+    SimpleTextStatistics,
+    TermTokenizer,
+    active_analysis_session,
+    analysis_session,
+)
+from tests.util import CountingTermTokenizer
+
+
+def test_session_term_tokenizer() -> None:
+    inner = CountingTermTokenizer()
+    tokenizer = SessionTermTokenizer(term_tokenizer=inner)
+
+    assert tokenizer.terms("a b a") == ["a", "b", "a"]
+    assert tokenizer.terms("a b a") == ["a", "b", "a"]
+    # Without a session, nothing is memoized.
+    assert inner.texts["a b a"] == 2
+
+    with analysis_session() as session:
+        assert tokenizer.terms("a b a") == ["a", "b", "a"]
+        assert tokenizer.unique_terms("a b a") == {"a", "b"}
+        assert list(tokenizer.terms_unordered("a b a")) == ["a", "b", "a"]
+        assert inner.texts["a b a"] == 3
+
+        # Nested sessions share the outer session.
+        with analysis_session() as nested_session:
+            assert nested_session is session
+            assert tokenizer.terms("a b a") == ["a", "b", "a"]
+        assert inner.texts["a b a"] == 3
+        assert session.hits > 0
+
+    assert active_analysis_session() is None
+    assert len(session) == 0
+
+
+def test_session_text_statistics() -> None:
+    inner = CountingTermTokenizer()
+    text_statistics: SimpleTextStatistics[Document] = SimpleTextStatistics(
+        text_contents=SimpleTextContents(),  # type: ignore[arg-type]
+        term_tokenizer=inner,
+    )
+    document1 = Document(id="d1", text="a b a")
+    document2 = Document(id="d1", text="c")
+
+    with analysis_session():
+        assert text_statistics.term_counts(document1) == {"a": 2, "b": 1}
+        assert text_statistics.term_count(document1, "a") == 2
+        assert inner.texts["a b a"] == 1
+
+    # Documents with the same ID do not collide across sessions.
+    with analysis_session():
+        assert text_statistics.term_counts(document2) == {"c": 1}
+
+
+def test_session_term_tokenizer_batch() -> None:
+    inner = CountingTermTokenizer()
+    tokenizer = SessionTermTokenizer(term_tokenizer=inner)
+
+    with analysis_session():
+        assert tokenizer.terms("a b") == ["a", "b"]
+        assert tokenizer.terms_batch(["a b", "c", "c"]) == [["a", "b"], ["c"], ["c"]]
+        assert tokenizer.unique_terms_batch(["a b", "c"]) == [{"a", "b"}, {"c"}]
+        assert inner.texts == {"a b": 1, "c": 1}
+
+
+@dataclass(frozen=True, kw_only=True)
+class _LowercaseTermTokenizer(TermTokenizer):
+    def terms(self, text: str) -> Sequence[str]:
+        return text.lower().split()
+
+
+def test_session_term_tokenizer_namespace() -> None:
+    inner = CountingTermTokenizer()
+    tokenizer = SessionTermTokenizer(term_tokenizer=inner)
+    lowercase_tokenizer = SessionTermTokenizer(term_tokenizer=_LowercaseTermTokenizer())
+
+    with analysis_session():
+        assert tokenizer.terms("A b") == ["A", "b"]
+        # Differently configured tokenizers do not share their terms.
+        assert lowercase_tokenizer.terms("A b") == ["a", "b"]
+        assert lowercase_tokenizer.terms_batch(["A b"]) == [["a", "b"]]
+        assert lowercase_tokenizer.unique_terms("A b") == {"a", "b"}
+        # Equally configured tokenizers do.
+        assert SessionTermTokenizer(term_tokenizer=inner).terms("A b") == ["A", "b"]
+        assert inner.texts["A b"] == 1
@@ -0,0 +1,117 @@
+from dataclasses import dataclass
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+
+from numpy import array
+
+from ir_axioms.axiom import (
+    Axiom,
+    CachedAxiom,
+    GreaterThanAxiom,
+    NormalizedAxiom,
+    ParallelAxiom,
+    UniformAxiom,
+)
+from ir_axioms.axiom.arithmetic import CascadeAxiom
+from ir_axioms.axiom.precondition import PreconditionMixin
+from ir_axioms.precondition import AxiomPrecondition
+from tests.util import CountingGreaterThanAxiom
+
+
+@dataclass(frozen=True, kw_only=True)
+class _PreconditionGreaterThanAxiom(PreconditionMixin[Any, int], GreaterThanAxiom[int]):
+    pass
+
+
+def test_upper_triangle_only() -> None:
+    axiom = CountingGreaterThanAxiom()
+    assert axiom.antisymmetric
+
+    preferences = axiom.preferences(None, [3, 1, 2, 2])
+
+    # Only pairs above the diagonal are computed.
+    assert axiom.calls == [(3, 1), (3, 2), (3, 2), (1, 2), (1, 2), (2, 2)]
+    assert (preferences == -preferences.T).all()
+    assert (
+        preferences
+        == array(
+            [
+                [0, 1, 1, 1],
+                [-1, 0, -1, -1],
+                [-1, 1, 0, 0],
+                [-1, 1, 0, 0],
+            ]
+        )
+    ).all()
+
+
+def test_combinators() -> None:
+    axiom: Axiom[Any, int] = GreaterThanAxiom()
+    uniform: Axiom[Any, int] = UniformAxiom(scalar=1)
+
+    assert not uniform.antisymmetric
+    assert (axiom + axiom).antisymmetric
+    assert not (axiom + uniform).antisymmetric
+    assert (-axiom).antisymmetric
+    assert not (axiom * axiom).antisymmetric
+    assert (axiom * axiom * axiom).antisymmetric
+    assert (axiom & axiom).antisymmetric
+    assert (axiom % axiom).antisymmetric
+    assert (axiom | axiom).antisymmetric
+    assert not (axiom | uniform).antisymmetric
+    assert NormalizedAxiom(axiom=axiom).antisymmetric
+    assert CascadeAxiom(axioms=[axiom, -axiom]).antisymmetric
+    assert ParallelAxiom(axiom=axiom, n_jobs=1).antisymmetric
+
+
+def test_precondition() -> None:
+    outputs = [3, 1, 2, 2]
+
+    # Only prefer pairs that are not preferred by the precondition axiom.
+    symmetric_axiom = _PreconditionGreaterThanAxiom(
+        precondition=AxiomPrecondition(axiom=GreaterThanAxiom(), expected_sign=0),
+    )
+    assert symmetric_axiom.antisymmetric
+    assert (symmetric_axiom.preferences(None, outputs) == 0).all()
+
+    # Only prefer pairs that are preferred by the precondition axiom.
+    asymmetric_axiom = _PreconditionGreaterThanAxiom(
+        precondition=AxiomPrecondition(axiom=GreaterThanAxiom(), expected_sign=1),
+    )
+    assert not asymmetric_axiom.antisymmetric
+
+    preferences = asymmetric_axiom.preferences(None, outputs)
+    assert (preferences >= 0).all()
+    assert (
+        preferences
+        == array(
+            [
+                [
+                    asymmetric_axiom.preference(None, output1, output2)
+                    for output2 in outputs
+                ]
+                for output1 in outputs
+            ]
+        )
+    ).all()
+
+
+def test_cache_flipped() -> None:
+    axiom = CountingGreaterThanAxiom()
+
+    with TemporaryDirectory() as tmp_dir:
+        cached_axiom = axiom.cached(Path(tmp_dir) / "cache")
+        assert isinstance(cached_axiom, CachedAxiom)
+        with cached_axiom:
+            assert cached_axiom.antisymmetric
+
+            assert cached_axiom.preference(None, 1, 2) == -1
+            # The flipped pair should be read from the cache.
+            assert cached_axiom.preference(None, 2, 1) == 1
+            assert axiom.calls == [(1, 2)]
+
+            preferences = cached_axiom.preferences(None, [1, 2, 3])
+            assert (preferences == -preferences.T).all()
+            assert cached_axiom.preferences(None, [3, 2, 1])[0, 2] == 1
+            assert len(axiom.calls) == 4
@@ -1,8 +1,65 @@
-from numpy import ones, full, zeros
-from pytest import approx
-
-from ir_axioms.axiom import UniformAxiom, VoteAxiom, Axiom
-from ir_axioms.model import Query, Document
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Sequence, Tuple
+
+from numpy import array, ones, full, sign, subtract, zeros
+from numpy.random import default_rng
+from pytest import approx, mark
+
+from ir_axioms.axiom import (
+    Axiom,
+    ConjunctionAxiom,
+    GreaterThanAxiom,
+    ProductAxiom,
+    ScoreAxiom,
+    SumAxiom,
+    UniformAxiom,
+    VoteAxiom,
+)
+from ir_axioms.model import Query, Document, Preference, PreferenceMatrix
+from ir_axioms.tools import AnalysisSession, active_analysis_session, analysis_session
+from tests.util import CountingGreaterThanAxiom
+
+
+@dataclass(frozen=True, kw_only=True)
+class _MatrixAxiom(Axiom[Any, int]):
+    matrix: Sequence[Sequence[float]]
+    calls: List[Tuple[int, int]] = field(default_factory=list)
+
+    def preference(
+        self,
+        input: Any,
+        output1: int,
+        output2: int,
+    ) -> Preference:
+        self.calls.append((output1, output2))
+        return self.matrix[output1][output2]
+
+
+@dataclass(frozen=True, kw_only=True)
+class _SessionAxiom(Axiom[Any, Any]):
+    sessions: List[Optional[AnalysisSession]] = field(default_factory=list)
+
+    def preference(
+        self,
+        input: Any,
+        output1: Any,
+        output2: Any,
+    ) -> Preference:
+        return 0
+
+    def preferences(
+        self,
+        input: Any,
+        outputs: Sequence[Any],
+    ) -> PreferenceMatrix:
+        self.sessions.append(active_analysis_session())
+        return zeros((len(outputs), len(outputs)))
+
+
+@dataclass(frozen=True, kw_only=True)
+class _HalfScoreAxiom(ScoreAxiom[Any, int]):
+    def score(self, input: Any, output: int) -> float:
+        return output // 2
 
 
 def test_uniform() -> None:
@@ -149,3 +206,118 @@ def test_normalize() -> None:
 
     assert (axiom1.preferences(query, [document1, document2]) == full((2, 2), 2)).all()
     assert (axiom2.preferences(query, [document1, document2]) == full((2, 2), 1)).all()
+
+
+def test_masked_preferences() -> None:
+    axiom = CountingGreaterThanAxiom()
+    outputs = [0, 1, 2]
+    mask = array(
+        [
+            [False, True, False],
+            [True, False, False],
+            [False, True, False],
+        ]
+    )
+
+    preferences = axiom.masked_preferences(None, outputs, mask)
+    assert (preferences == array([[0, -1, 0], [1, 0, 0], [0, 1, 0]])).all()
+    # Antisymmetric preferences are computed once per unordered pair.
+    assert sorted(axiom.calls) == [(0, 1), (1, 2)]
+
+    full_mask = ones((3, 3), dtype=bool)
+    assert (
+        axiom.masked_preferences(None, outputs, full_mask)
+        == axiom.preferences(None, outputs)
+    ).all()
+
+
+def test_cascade_masked() -> None:
+    fallback = CountingGreaterThanAxiom()
+    axiom = _HalfScoreAxiom() | fallback
+    outputs = [0, 1, 2, 3]
+
+    preferences = axiom.preferences(None, outputs)
+    expected = sign(subtract.outer(outputs, outputs))
+    assert (preferences == expected).all()
+    # The fallback is only evaluated where the first axiom ties.
+    assert {frozenset(pair) for pair in fallback.calls} == {
+        frozenset((0, 1)),
+        frozenset((2, 3)),
+    }
+    assert len(fallback.calls) == 2
+
+
+@mark.parametrize("minimum_votes", [0, 0.5, 0.75, 1])
+def test_vote_early_exit(minimum_votes: float) -> None:
+    generator = default_rng(seed=0)
+    matrices = generator.integers(-1, 2, (7, 5, 5)).tolist()
+    outputs = list(range(5))
+
+    axioms = [_MatrixAxiom(matrix=matrix) for matrix in matrices]
+    expected = VoteAxiom(axioms=axioms, minimum_votes=minimum_votes, early_exit=False)
+    expected_preferences = expected.preferences(None, outputs)
+    num_calls = sum(len(axiom.calls) for axiom in axioms)
+
+    axioms = [_MatrixAxiom(matrix=matrix) for matrix in matrices]
+    axiom = VoteAxiom(axioms=axioms, minimum_votes=minimum_votes)
+    assert (axiom.preferences(None, outputs) == expected_preferences).all()
+    assert sum(len(axiom.calls) for axiom in axioms) < num_calls
+    for output1 in outputs:
+        for output2 in outputs:
+            assert (
+                axiom.preference(None, output1, output2)
+                == expected_preferences[output1, output2]
+            )
+
+
+def test_and_early_exit() -> None:
+    generator = default_rng(seed=0)
+    matrices = generator.choice([-1, 1], (4, 5, 5), p=[0.2, 0.8]).tolist()
+    outputs = list(range(5))
+
+    axioms = [_MatrixAxiom(matrix=matrix) for matrix in matrices]
+    expected = ConjunctionAxiom(axioms=axioms, early_exit=False)
+    expected_preferences = expected.preferences(None, outputs)
+    num_calls = sum(len(axiom.calls) for axiom in axioms)
+
+    axioms = [_MatrixAxiom(matrix=matrix) for matrix in matrices]
+    axiom = ConjunctionAxiom(axioms=axioms)
+    assert (axiom.preferences(None, outputs) == expected_preferences).all()
+    assert sum(len(axiom.calls) for axiom in axioms) < num_calls
+    for output1 in outputs:
+        for output2 in outputs:
+            assert (
+                axiom.preference(None, output1, output2)
+                == expected_preferences[output1, output2]
+            )
+
+
+def test_concurrent() -> None:
+    generator = default_rng(seed=0)
+    matrices = generator.integers(-1, 2, (4, 5, 5)).tolist()
+    outputs = list(range(5))
+    axioms = [_MatrixAxiom(matrix=matrix) for matrix in matrices]
+
+    for combination in (SumAxiom, ProductAxiom, VoteAxiom, ConjunctionAxiom):
+        expected = combination(axioms=axioms).preferences(None, outputs)
+        actual = combination(axioms=axioms, n_jobs=2).preferences(None, outputs)
+        assert (expected == actual).all()
+
+    # Threads share the active analysis session.
+    session_axioms = [_SessionAxiom(), _SessionAxiom()]
+    axiom = SumAxiom(axioms=session_axioms, n_jobs=2) + _SessionAxiom()
+    assert isinstance(axiom, SumAxiom) and axiom.n_jobs == 2
+    with analysis_session() as session:
+        axiom.preferences(None, outputs)
+    assert all(session_axiom.sessions == [session] for session_axiom in session_axioms)
+
+
+def test_input_dependent() -> None:
+    independent: Axiom[Any, int] = GreaterThanAxiom()
+    dependent: Axiom[Any, int] = _MatrixAxiom(matrix=[[0]])
+
+    assert not independent.input_dependent
+    assert not (independent * UniformAxiom(scalar=2)).input_dependent
+    assert not (independent | -independent).input_dependent
+    assert (independent + dependent).input_dependent
+    assert (independent & +dependent).input_dependent
@@ -0,0 +1,120 @@
+from asyncio import gather, run
+from dataclasses import dataclass, field
+from threading import Lock, Thread, current_thread, main_thread
+from time import sleep
+from typing import Any, ClassVar, List
+
+from numpy import array
+from pytest import raises
+
+from ir_axioms.axiom import GreaterThanAxiom, LessThanAxiom, ScoreAxiom, SumAxiom
+from ir_axioms.axiom.precondition import PreconditionMixin
+from ir_axioms.precondition import AxiomPrecondition, Precondition
+from ir_axioms.utils.concurrency import concurrency_limit
+
+
+@dataclass(frozen=True, kw_only=True)
+class _SlowScoreAxiom(ScoreAxiom[Any, int]):
+    margin_fraction: float = 0.0
+    delay: float = 0.05
+    active: List[int] = field(default_factory=lambda: [0, 0])
+    lock: ClassVar[Lock] = Lock()
+
+    def score(self, input: Any, output: int) -> float:
+        with self.lock:
+            self.active[0] += 1
+            self.active[1] = max(self.active)
+        sleep(self.delay)
+        with self.lock:
+            self.active[0] -= 1
+        return float(output)
+
+    @property
+    def max_active(self) -> int:
+        return self.active[1]
+
+
+@dataclass(frozen=True, kw_only=True)
+class _PreconditionGreaterThanAxiom(PreconditionMixin[Any, int], GreaterThanAxiom[int]):
+    pass
+
+
+@dataclass(frozen=True, kw_only=True)
+class _ThreadRecordingPrecondition(Precondition[Any, int]):
+    threads: List[Thread] = field(default_factory=list)
+
+    def precondition(self, input: Any, output1: int, output2: int) -> bool:
+        self.threads.append(current_thread())
+        return output1 != 2 and output2 != 2
+
+
+def test_apreferences_antisymmetric() -> None:
+    axiom = GreaterThanAxiom[int]()
+    outputs = [3, 1, 2, 2]
+    assert (
+        run(axiom.apreferences("q", outputs)) == axiom.preferences("q", outputs)
+    ).all()
+    assert run(axiom.apreference("q", 3, 1)) == axiom.preference("q", 3, 1)
+
+
+def test_apreferences_combined() -> None:
+    axiom = SumAxiom[Any, int](
+        axioms=[GreaterThanAxiom(), GreaterThanAxiom(), LessThanAxiom()]
+    )
+    outputs = [3, 1, 2]
+    assert (
+        run(axiom.apreferences("q", outputs)) == axiom.preferences("q", outputs)
+    ).all()
+
+
+def test_apreferences_precondition() -> None:
+    axiom = _PreconditionGreaterThanAxiom(
+        precondition=AxiomPrecondition(axiom=GreaterThanAxiom(), expected_sign=1),
+    )
+    outputs = [3, 1, 2, 2]
+    assert (
+        run(axiom.apreferences("q", outputs)) == axiom.preferences("q", outputs)
+    ).all()
+    assert run(axiom.apreference("q", 1, 3)) == 0
+
+
+def test_apreferences_precondition_thread() -> None:
+    precondition = _ThreadRecordingPrecondition()
+    axiom = _PreconditionGreaterThanAxiom(precondition=precondition)
+    outputs = [3, 1, 2]
+    preferences = run(axiom.apreferences("q", outputs))
+    assert run(axiom.apreference("q", 3, 2)) == 0
+    # Preconditions do not block the event loop.
+    assert len(precondition.threads) > 0
+    assert main_thread() not in precondition.threads
+    assert (preferences == axiom.preferences("q", outputs)).all()
+
+
+def test_ascores() -> None:
+    axiom = _SlowScoreAxiom(delay=0.0)
+    outputs = [2, 3, 1]
+    assert (run(axiom.ascores("q", outputs)) == array([2.0, 3.0, 1.0])).all()
+    assert (
+        run(axiom.apreferences("q", outputs)) == axiom.preferences("q", outputs)
+    ).all()
+    assert run(axiom.apreference("q", 1, 2)) == -1
+
+
+def test_concurrency_limit() -> None:
+    axiom = _SlowScoreAxiom()
+
+    async def _preferences() -> None:
+        with concurrency_limit(2):
+            await gather(
+                axiom.apreferences("q1", [1, 2, 3]),
+                axiom.apreferences("q2", [4, 5, 6]),
+            )
+
+    run(_preferences())
+    assert axiom.max_active == 2
+
+
+def test_concurrency_limit_invalid() -> None:
+    with raises(ValueError):
+        with concurrency_limit(0):
+            pass
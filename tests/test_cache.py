@@ -1,12 +1,37 @@
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import timedelta
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Sequence, Any
+from typing import Any, List, Literal, Optional, Sequence, Tuple
 
-from numpy import full
+from numpy import array, bool_, full, ndarray, ones, where
+from numpy.typing import NDArray
+from pytest import importorskip, mark, raises
 
-from ir_axioms.axiom import Axiom
-from ir_axioms.model import Preference, PreferenceMatrix
+from ir_axioms.axiom import (
+    Axiom,
+    CachedAxiom,
+    DbmPreferenceCache,
+    LruPreferenceCache,
+    MatrixCachedAxiom,
+    ScoreAxiom,
+    ScoreCachedAxiom,
+    SqlitePreferenceCache,
+    UniformAxiom,
+)
+from ir_axioms.axiom.cache import PreferenceCacheEntry
+from ir_axioms.axiom.cache_maintenance import (
+    compact_preference_cache,
+    export_preference_cache,
+    import_preference_cache,
+    merge_preference_caches,
+    open_preference_cache,
+    prune_preference_cache,
+    summarize_preference_cache,
+)
+from ir_axioms.model import Document, Preference, PreferenceMatrix, Query
+from ir_axioms.utils.fingerprint import fingerprint
 
 
 @dataclass(kw_only=True)
@@ -29,6 +54,65 @@ class _MutableUniformAxiom(Axiom[Any, Any]):
         return full((len(outputs), len(outputs)), self.scalar)
 
 
+@dataclass(frozen=True, kw_only=True)
+class _CountingDifferenceAxiom(Axiom[Any, Any]):
+    masks: List[NDArray[bool_]] = field(
+        default_factory=list,
+        repr=False,
+        compare=False,
+    )
+
+    def preference(
+        self,
+        input: Any,
+        output1: Any,
+        output2: Any,
+    ) -> Preference:
+        return (len(output1) - len(output2)) / 2
+
+    def _matrix(self, outputs: Sequence[Any]) -> PreferenceMatrix:
+        return array(
+            [
+                [self.preference(None, output1, output2) for output2 in outputs]
+                for output1 in outputs
+            ]
+        )
+
+    def masked_preferences(
+        self,
+        input: Any,
+        outputs: Sequence[Any],
+        mask: NDArray[bool_],
+    ) -> PreferenceMatrix:
+        self.masks.append(mask)
+        return where(mask, self._matrix(outputs), 0)
+
+    def preferences(
+        self,
+        input: Any,
+        outputs: Sequence[Any],
+    ) -> PreferenceMatrix:
+        self.masks.append(ones((len(outputs), len(outputs)), dtype=bool_))
+        return self._matrix(outputs)
+
+
+@dataclass(frozen=True, kw_only=True)
+class _CountingInputIndependentDifferenceAxiom(_CountingDifferenceAxiom):
+    @property
+    def input_dependent(self) -> bool:
+        return False
+
+
+@dataclass(frozen=True, kw_only=True)
+class _CountingLengthScoreAxiom(ScoreAxiom[Any, str]):
+    margin_fraction: float = 0.0
+    outputs: List[str] = field(default_factory=list, repr=False, compare=False)
+
+    def score(self, input: Any, output: str) -> float:
+        self.outputs.append(output)
+        return len(output)
+
+
 def test_cache() -> Any:
     input = "i1"
     output1 = "o1"
@@ -52,25 +136,528 @@ def test_cache() -> Any:
         tmp_path = Path(tmp_dir) / "cache"
 
         cached_axiom = axiom.cached(tmp_path)
+        assert isinstance(cached_axiom, CachedAxiom)
+        with cached_axiom:
+            assert cached_axiom.preference(input, output1, output2) == 2
+            assert cached_axiom.preference(input, output2, output1) == 2
+            assert (
+                cached_axiom.preferences(input, [output1, output2]) == full((2, 2), 2)
+            ).all()
+
+            axiom.scalar = 3
+
+            # The cached preferences should still show the old scalar value.
+            assert cached_axiom.preference(input, output1, output2) == 2
+            assert cached_axiom.preference(input, output2, output1) == 2
+            assert (
+                cached_axiom.preferences(input, [output1, output2]) == full((2, 2), 2)
+            ).all()
+
+            # Newly computed preferences should pick up the new scalar value.
+            assert cached_axiom.preference(input, output3, output4) == 3
+            assert cached_axiom.preference(input, output4, output3) == 3
+            assert (
+                cached_axiom.preferences(input, [output3, output4]) == full((2, 2), 3)
+            ).all()
+
+
+def test_cache_shared_path() -> Any:
+    input = Query(id="q1", text="query")
+    outputs = [
+        Document(id="d1", text="document 1"),
+        Document(id="d2", text="document 2"),
+    ]
+
+    with TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir) / "cache"
+
+        # Different axioms can share the same cache without collisions.
+        with (
+            CachedAxiom(
+                axiom=_MutableUniformAxiom(scalar=1),
+                cache_path=tmp_path,
+            ) as cached_axiom1,
+            CachedAxiom(
+                axiom=_MutableUniformAxiom(scalar=2),
+                cache_path=tmp_path,
+            ) as cached_axiom2,
+        ):
+            assert cached_axiom1.preference(input, outputs[0], outputs[1]) == 1
+            assert cached_axiom2.preference(input, outputs[0], outputs[1]) == 2
+            assert (cached_axiom1.preferences(input, outputs) == full((2, 2), 1)).all()
+            assert (cached_axiom2.preferences(input, outputs) == full((2, 2), 2)).all()
+
+    for identity, expected in (("id_text", 4), ("id", 3)):
+        with TemporaryDirectory() as tmp_dir:
+            tmp_path = Path(tmp_dir) / "cache"
+            axiom = _MutableUniformAxiom(scalar=3)
+            with CachedAxiom(
+                axiom=axiom,
+                cache_path=tmp_path,
+                identity=identity,  # type: ignore[arg-type]
+            ) as cached_axiom:
+                assert cached_axiom.preference(input, outputs[0], outputs[1]) == 3
+
+                axiom.scalar = 4
+
+                # Only identify changed texts as new outputs if texts are hashed.
+                changed_output = Document(id="d2", text="changed document 2")
+                assert (
+                    cached_axiom.preference(input, outputs[0], changed_output)
+                    == expected
+                )
+
+
+def test_matrix_cache() -> None:
+    input = "q1"
+    axiom = _CountingDifferenceAxiom()
+
+    with TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir) / "cache"
+
+        with MatrixCachedAxiom(axiom=axiom, cache_path=tmp_path) as cached_axiom:
+            outputs = ["a", "bbb", "cc"]
+            expected = axiom.preferences(input, outputs)
+            assert len(axiom.masks) == 1
+            assert (cached_axiom.preferences(input, outputs) == expected).all()
+            assert len(axiom.masks) == 2
+
+            # Permutations and subsets are remapped from the cached matrix.
+            assert (
+                cached_axiom.preferences(input, ["cc", "a"])
+                == expected[[2, 0]][:, [2, 0]]
+            ).all()
+            assert len(axiom.masks) == 2
+
+            # Only the preferences of new outputs are computed.
+            outputs = ["bbb", "dddd", "a"]
+            assert (
+                cached_axiom.preferences(input, outputs)
+                == axiom.preferences(input, outputs)
+            ).all()
+            assert len(axiom.masks) == 4
+            assert (
+                axiom.masks[2]
+                == array(
+                    [
+                        [False, True, False],
+                        [True, True, True],
+                        [False, True, False],
+                    ]
+                )
+            ).all()
+
+        # Matrices persist in the cache file.
+        with MatrixCachedAxiom(axiom=axiom, cache_path=tmp_path) as cached_axiom:
+            assert (
+                cached_axiom.preferences(input, ["dddd", "a"])
+                == array([[0, 1.5], [-1.5, 0]])
+            ).all()
+            assert len(axiom.masks) == 4
+
+
+@dataclass(frozen=True, kw_only=True)
+class _CountingMatrixCachedAxiom(MatrixCachedAxiom[Any, Any]):
+    loaded_keys: List[bytes] = field(default_factory=list, repr=False, compare=False)
+
+    def _load_matrix(self, key: bytes) -> Optional[Tuple[Sequence[bytes], ndarray]]:
+        self.loaded_keys.append(key)
+        return super()._load_matrix(key)
+
+
+def test_matrix_cache_lookup() -> None:
+    input = "q1"
+    axiom = _CountingDifferenceAxiom()
+    output_lists = [[f"{index}a", f"{index}bb", f"{index}ccc"] for index in range(50)]
+
+    with TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir) / "cache"
+
+        cached_axiom = _CountingMatrixCachedAxiom(axiom=axiom, cache_path=tmp_path)
+        with cached_axiom:
+            for outputs in output_lists:
+                cached_axiom.preferences(input, outputs)
+            assert len(axiom.masks) == 50
+
+            # Subsets only load the matrices of their outputs, not all matrices of the input.
+            cached_axiom.loaded_keys.clear()
+            assert (
+                cached_axiom.preferences(input, ["7ccc", "7a"])
+                == array([[0, 1], [-1, 0]])
+            ).all()
+            assert len(cached_axiom.loaded_keys) == 2
+            assert len(axiom.masks) == 50
+
+            # Pairs of outputs from different matrices are computed once.
+            cached_axiom.loaded_keys.clear()
+            outputs = ["3a", "4bb", "5ccc"]
+            assert (
+                cached_axiom.preferences(input, outputs)
+                == axiom.preferences(input, outputs)
+            ).all()
+            assert len(cached_axiom.loaded_keys) == 4
+            assert len(axiom.masks) == 52
+            cached_axiom.loaded_keys.clear()
+            cached_axiom.preferences(input, ["5ccc", "3a"])
+            assert len(cached_axiom.loaded_keys) == 4
+            assert len(axiom.masks) == 52
+
+
+def test_matrix_cache_overwrite() -> None:
+    input = "q1"
+    axiom = _CountingDifferenceAxiom()
+
+    with TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir) / "cache"
+
+        cached_axiom = _CountingMatrixCachedAxiom(axiom=axiom, cache_path=tmp_path)
+        with cached_axiom:
+            cached_axiom.preferences(input, ["a", "bb", "ccc"])
+            cached_axiom.preferences(input, ["ccc", "dddd"])
+            assert len(axiom.masks) == 2
+
+            # Newer matrices of an output do not hide its older matrices.
+            assert (
+                cached_axiom.preferences(input, ["a", "ccc"])
+                == array([[0, -1], [1, 0]])
+            ).all()
+            assert len(axiom.masks) == 2
+
+            # Matrices covered by a newer matrix are no longer loaded.
+            cached_axiom.preferences(input, ["a", "bb", "ccc", "dddd", "eeeee"])
+            assert len(axiom.masks) == 3
+            cached_axiom.loaded_keys.clear()
+            cached_axiom.preferences(input, ["eeeee", "a"])
+            assert len(cached_axiom.loaded_keys) == 2
+            assert len(axiom.masks) == 3
+
+
+def test_score_cache() -> None:
+    outputs = ["aaaaaaaaaa", "aaaaaaaaa", "a"]
+    scores: List[str] = []
+
+    with TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir) / "cache"
+
+        axiom = _CountingLengthScoreAxiom(outputs=scores)
+        cached_axiom = axiom.cached(tmp_path)
+        assert isinstance(cached_axiom, ScoreCachedAxiom)
+        with cached_axiom:
+            assert (
+                cached_axiom.preferences("q1", outputs)
+                == axiom.preferences("q1", outputs)
+            ).all()
+            assert cached_axiom.preference("q1", outputs[2], "aa") == -1
+            # Each output is only scored once.
+            assert scores.count(outputs[0]) == 2
+            assert scores.count("aa") == 1
+
+        # Changing the margin re-uses the cached scores.
+        scores.clear()
+        axiom = _CountingLengthScoreAxiom(outputs=scores, margin_fraction=0.2)
+        with ScoreCachedAxiom(axiom=axiom, cache_path=tmp_path) as cached_axiom:
+            assert cached_axiom.preference("q1", outputs[0], outputs[1]) == 0
+            assert cached_axiom.preference("q1", outputs[0], outputs[2]) == 1
+            assert len(scores) == 0
+
+
+def test_score_cache_batched() -> None:
+    outputs = [f"{'a' * length}" for length in range(1, 101)]
+
+    with TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir) / "cache.sqlite"
+
+        axiom = _CountingLengthScoreAxiom()
+        cached_axiom = ScoreCachedAxiom(
+            axiom=axiom, cache_path=tmp_path, backend="sqlite", batch_size=1
+        )
+        with cached_axiom:
+            cache = cached_axiom._cache
+            assert isinstance(cache, SqlitePreferenceCache)
+            statements: List[str] = []
+            cache._connection.set_trace_callback(statements.append)
+
+            assert (cached_axiom.scores("q1", outputs) == range(1, 101)).all()
+            # The scores of all outputs are looked up with a single query.
+            assert sum(statement.startswith("SELECT") for statement in statements) == 1
+
+            statements.clear()
+            assert (cached_axiom.scores("q1", outputs) == range(1, 101)).all()
+            assert sum(statement.startswith("SELECT") for statement in statements) == 1
+            assert len(axiom.outputs) == 100
+
+
+def test_dbm_preference_cache() -> None:
+    with TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir) / "cache"
+
+        with DbmPreferenceCache.open(tmp_path, batch_size=3) as cache:
+            # Caches at the same path share the open database.
+            assert DbmPreferenceCache.open(tmp_path) is cache
+
+            cache.set_many({b"a": 1, b"b": -1})
+            # Buffered preferences can be read before they are written.
+            assert cache.get_many([b"a", b"b", b"c"]) == [1, -1, None]
+            assert len(cache._buffer) == 2
+            cache.set_many({b"c": 0.5})
+            assert len(cache._buffer) == 0
+            cache.set_many({b"d": 2})
+        assert cache.closed
+
+        with DbmPreferenceCache.open(tmp_path) as cache:
+            assert cache.get_many([b"a", b"b", b"c", b"d", b"e"]) == [
+                1,
+                -1,
+                0.5,
+                2,
+                None,
+            ]
+
+
+def test_lru_preference_cache() -> None:
+    with TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir) / "cache"
+
+        with DbmPreferenceCache.open(tmp_path, batch_size=1) as disk_cache:
+            cache = LruPreferenceCache(
+                cache=disk_cache,
+                max_entries=2,
+                policy="write-back",
+            )
+            cache.set_many({b"a": 1, b"b": -1})
+            # Dirty entries are only written when evicted.
+            assert disk_cache.get_many([b"a", b"b"]) == [None, None]
+            cache.set_many({b"c": 0})
+            assert disk_cache.get_many([b"a", b"b"]) == [1, None]
+            assert cache.statistics.evictions == 1
+
+            assert cache.get_many([b"b", b"c"]) == [-1, 0]
+            assert cache.get_many([b"a", b"d"]) == [1, None]
+            assert cache.statistics.memory_hits == 2
+            assert cache.statistics.disk_hits == 1
+            assert cache.statistics.misses == 1
+            assert cache.statistics.evictions == 2
+
+            cache.close()
+            assert disk_cache.get_many([b"a", b"b", b"c"]) == [1, -1, 0]
+
+            cache = LruPreferenceCache(
+                cache=disk_cache,
+                max_entries=None,
+                max_bytes=50,
+                policy="write-through",
+            )
+            cache.set_many({b"d": 2})
+            assert disk_cache.get_many([b"d"]) == [2]
+            cache.set_blob(b"e", bytes(100))
+            # Entries larger than the memory limit are not kept.
+            assert cache.statistics.evictions == 2
+            assert cache.get_blob(b"e") == bytes(100)
+            assert cache.statistics.disk_hits == 1
+
+            cache.set_blob(b"f", b"value")
+            assert cache.get_blobs([b"f", b"e", b"g"]) == [b"value", bytes(100), None]
+            assert cache.statistics.memory_hits == 1
+            assert cache.statistics.disk_hits == 2
+            assert cache.statistics.misses == 1
+
+
+def test_cache_memory() -> None:
+    axiom = _CountingDifferenceAxiom()
+
+    with TemporaryDirectory() as tmp_dir:
+        with CachedAxiom(
+            axiom=axiom,
+            cache_path=Path(tmp_dir) / "cache",
+            max_memory_entries=10,
+        ) as cached_axiom:
+            assert cached_axiom.preference("q1", "a", "bb") == -0.5
+            assert cached_axiom.preference("q1", "a", "bb") == -0.5
+            assert cached_axiom.statistics.memory_hits == 1
+            assert cached_axiom.statistics.misses == 1
+            assert cached_axiom.statistics.hit_rate == 0.5
+
+
+def _write_preferences(cache_path: Path, worker: int) -> None:
+    cache = SqlitePreferenceCache(path=cache_path, batch_size=10)
+    for index in range(100):
+        cache.set_many({f"{worker}-{index}".encode(): worker})
+        # Read entries of other workers concurrently.
+        cache.get_many([f"{(worker + 1) % 4}-{index}".encode()])
+    cache.close()
+
+
+def test_sqlite_preference_cache() -> None:
+    with TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir) / "cache.sqlite"
+
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            list(executor.map(_write_preferences, [tmp_path] * 4, range(4)))
+
+        with SqlitePreferenceCache(path=tmp_path) as cache:
+            keys = [
+                f"{worker}-{index}".encode()
+                for worker in range(4)
+                for index in range(100)
+            ]
+            assert cache.get_many(keys) == [
+                worker for worker in range(4) for _ in range(100)
+            ]
+            assert cache.get_blob(b"missing") is None
+
+        axiom = _CountingDifferenceAxiom()
+        with CachedAxiom(
+            axiom=axiom, cache_path=tmp_path, backend="sqlite"
+        ) as cached_axiom:
+            assert cached_axiom.preference("q1", "a", "bb") == -0.5
+            assert (
+                cached_axiom.preferences("q1", ["a", "bb"])
+                == array([[0, -0.5], [0.5, 0]])
+            ).all()
+        with CachedAxiom(
+            axiom=axiom, cache_path=tmp_path, backend="sqlite"
+        ) as cached_axiom:
+            assert cached_axiom.preference("q1", "bb", "a") == 0.5
+            assert len(axiom.masks) == 1
+
+
+def test_fingerprint() -> None:
+    assert fingerprint(_MutableUniformAxiom(scalar=1)) == fingerprint(
+        _MutableUniformAxiom(scalar=1)
+    )
+    assert fingerprint(_MutableUniformAxiom(scalar=1)) != fingerprint(
+        _MutableUniformAxiom(scalar=2)
+    )
+    assert fingerprint(_MutableUniformAxiom(scalar=1)) != fingerprint(
+        UniformAxiom(scalar=1)
+    )
+
+
+@mark.parametrize("backend", ["dbm", "sqlite"])
+def test_cache_maintenance(backend: Literal["dbm", "sqlite"]) -> None:
+    axiom = _CountingDifferenceAxiom()
+
+    with TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir) / "cache"
+
+        with CachedAxiom(
+            axiom=axiom, cache_path=tmp_path, backend=backend
+        ) as cached_axiom:
+            cached_axiom.preference("q1", "a", "bb")
+            cached_axiom.preference("q1", "a", "ccc")
+            cached_axiom.preference("q2", "a", "bb")
+            namespace = cached_axiom.namespace
+
+        with open_preference_cache(tmp_path) as cache:
+            assert isinstance(
+                cache,
+                SqlitePreferenceCache if backend == "sqlite" else DbmPreferenceCache,
+            )
+            # Entries in an unknown format are invalid.
+            cache.set_blob(b"old", b"value")
+
+            summaries = {
+                summary.namespace: summary
+                for summary in summarize_preference_cache(cache)
+            }
+            assert summaries.keys() == {namespace, None}
+            assert summaries[namespace].entries == 3
+            assert summaries[namespace].inputs == 2
+            assert summaries[namespace].size == 3 * (32 + 4)
+            assert "_CountingDifferenceAxiom" in (
+                summaries[namespace].description or ""
+            )
+            assert summaries[None].entries == 1
+
+            with raises(ValueError):
+                prune_preference_cache(cache)
+            assert prune_preference_cache(cache, invalid=True) == 1
+            assert prune_preference_cache(cache, older_than=timedelta(days=1)) == 0
+            assert (
+                prune_preference_cache(cache, namespaces=[namespace], input_ids=["q2"])
+                == 1
+            )
+            compact_preference_cache(cache)
+            assert [
+                summary.inputs for summary in summarize_preference_cache(cache)
+            ] == [1]
+
+        with CachedAxiom(
+            axiom=axiom, cache_path=tmp_path, backend=backend
+        ) as cached_axiom:
+            assert cached_axiom.preference("q1", "a", "ccc") == -1
+            assert cached_axiom.preference("q2", "a", "bb") == -0.5
+            assert len(axiom.masks) == 0
+
+
+def test_merge_preference_caches() -> None:
+    with TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir)
+
+        with (
+            DbmPreferenceCache.open(tmp_path / "cache") as cache,
+            SqlitePreferenceCache(path=tmp_path / "other.sqlite") as other_cache,
+        ):
+            cache.set_entries(
+                [
+                    PreferenceCacheEntry(key=b"a", value=b"old", created=1),
+                    PreferenceCacheEntry(key=b"b", value=b"new", created=2),
+                ]
+            )
+            other_cache.set_entries(
+                [
+                    PreferenceCacheEntry(key=b"a", value=b"new", created=2),
+                    PreferenceCacheEntry(key=b"b", value=b"old", created=1),
+                    PreferenceCacheEntry(key=b"c", value=b"new", created=1),
+                ]
+            )
+            # Newer entries win.
+            assert merge_preference_caches(cache, [other_cache]) == 2
+            assert sorted(cache.entries()) == [
+                PreferenceCacheEntry(key=b"a", value=b"new", created=2),
+                PreferenceCacheEntry(key=b"b", value=b"new", created=2),
+                PreferenceCacheEntry(key=b"c", value=b"new", created=1),
+            ]
+
+
+def test_export_preference_cache() -> None:
+    importorskip("pyarrow", exc_type=ImportError)
+
+    with TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir)
+
+        with (
+            DbmPreferenceCache.open(tmp_path / "cache") as cache,
+            SqlitePreferenceCache(path=tmp_path / "other.sqlite") as other_cache,
+        ):
+            cache.set_many({b"a": 1, b"b": -1})
+            assert export_preference_cache(cache, tmp_path / "cache.parquet") == 2
+            assert import_preference_cache(other_cache, tmp_path / "cache.parquet") == 2
+            assert sorted(other_cache.entries()) == sorted(cache.entries())
+
+
+def test_cache_input_independent() -> None:
+    outputs = ["a", "bb", "ccc"]
+    axiom = _CountingInputIndependentDifferenceAxiom()
+
+    with TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir) / "cache"
+
+        with CachedAxiom(axiom=axiom, cache_path=tmp_path) as cached_axiom:
+            assert not cached_axiom.input_dependent
+            expected = axiom.preferences("q1", outputs)
+            axiom.masks.clear()
+            assert (cached_axiom.preferences("q1", outputs) == expected).all()
+            # Preferences are shared by all inputs.
+            assert (cached_axiom.preferences("q2", outputs) == expected).all()
+            assert cached_axiom.preference("q3", "ccc", "a") == 1
+            assert len(axiom.masks) == 1
 
-        assert cached_axiom.preference(input, output1, output2) == 2
-        assert cached_axiom.preference(input, output2, output1) == 2
-        assert (
-            cached_axiom.preferences(input, [output1, output2]) == full((2, 2), 2)
-        ).all()
-
-        axiom.scalar = 3
-
-        # The cached preferences should still show the old scalar value.
-        assert cached_axiom.preference(input, output1, output2) == 2
-        assert cached_axiom.preference(input, output2, output1) == 2
-        assert (
-            cached_axiom.preferences(input, [output1, output2]) == full((2, 2), 2)
-        ).all()
-
-        # Newly computed preferences should pick up the new scalar value.
-        assert cached_axiom.preference(input, output3, output4) == 3
-        assert cached_axiom.preference(input, output4, output3) == 3
-        assert (
-            cached_axiom.preferences(input, [output3, output4]) == full((2, 2), 3)
-        ).all()
+        with MatrixCachedAxiom(axiom=axiom, cache_path=tmp_path) as cached_axiom:
+            assert (
+                cached_axiom.preferences("q1", outputs[:2]) == expected[:2, :2]
+            ).all()
+            assert (
+                cached_axiom.preferences("q2", outputs[:2]) == expected[:2, :2]
+            ).all()
+            assert len(axiom.masks) == 1
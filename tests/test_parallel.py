@@ -0,0 +1,148 @@
+from dataclasses import dataclass, field, replace
+from typing import Any, List, Sequence
+
+from numpy import arange, array, bool_, eye, ones
+from numpy.random import default_rng
+from pytest import mark
+
+from ir_axioms.axiom import Axiom, GreaterThanAxiom, ParallelAxiom
+from ir_axioms.axiom.retrieval.proximity import Prox1Axiom
+from ir_axioms.axiom.retrieval.term_frequency import Tfc1Axiom
+from ir_axioms.model import Document, Preference, PreferenceMatrix, Query
+from ir_axioms.precondition.length import LenPrecondition
+from ir_axioms.utils.lazy import lazy_inject
+from tests.util import inject_documents, whitespace_injector
+
+
+@dataclass(frozen=True, kw_only=True)
+class _DifferenceAxiom(Axiom[Any, int]):
+    def preference(
+        self,
+        input: Any,
+        output1: int,
+        output2: int,
+    ) -> Preference:
+        return output1 - 2 * output2
+
+
+@dataclass(frozen=True, kw_only=True)
+class _CountingBatchedDifferenceAxiom(_DifferenceAxiom):
+    sizes: List[int] = field(default_factory=list)
+
+    def preferences(
+        self,
+        input: Any,
+        outputs: Sequence[int],
+    ) -> PreferenceMatrix:
+        self.sizes.append(len(outputs))
+        return super().preferences(input, outputs)
+
+
+@mark.parametrize("tile_size", [None, 1, 3, 100])
+@mark.parametrize("prefer", ["threads", "processes"])
+def test_parallel_antisymmetric(tile_size: Any, prefer: Any) -> None:
+    outputs = default_rng(seed=0).permutation(20).tolist()
+    axiom: Axiom[Any, int] = GreaterThanAxiom()
+
+    with ParallelAxiom(
+        axiom=axiom,
+        n_jobs=2,
+        prefer=prefer,
+        tile_size=tile_size,
+        min_tile_size=2,
+    ) as parallel_axiom:
+        assert parallel_axiom.antisymmetric
+        assert (
+            parallel_axiom.preferences(None, outputs)
+            == axiom.preferences(None, outputs)
+        ).all()
+        # The worker pool is re-used across calls.
+        pool = parallel_axiom._pool
+        mask = default_rng(seed=1).random((20, 20)) < 0.3
+        assert (
+            parallel_axiom.masked_preferences(None, outputs, mask)
+            == axiom.masked_preferences(None, outputs, mask)
+        ).all()
+        assert parallel_axiom._pool is pool
+    assert "_pool" not in parallel_axiom.__dict__
+
+
+@mark.parametrize("tile_size", [None, 1, 4])
+def test_parallel_not_antisymmetric(tile_size: Any) -> None:
+    outputs = arange(10).tolist()
+    axiom = _DifferenceAxiom()
+
+    with ParallelAxiom(
+        axiom=axiom,
+        n_jobs=3,
+        prefer="threads",
+        tile_size=tile_size,
+    ) as parallel_axiom:
+        expected = array(
+            [[output1 - 2 * output2 for output2 in outputs] for output1 in outputs]
+        )
+        assert (parallel_axiom.preferences(None, outputs) == expected).all()
+        mask = ~eye(10, dtype=bool_)
+        assert (
+            parallel_axiom.masked_preferences(None, outputs, mask) == expected * mask
+        ).all()
+        assert (parallel_axiom.preferences(None, []) == array([]).reshape(0, 0)).all()
+
+
+@mark.parametrize("mask", [None, "diagonal", "random"])
+def test_parallel_batched(mask: Any) -> None:
+    outputs = arange(12).tolist()
+    axiom = _CountingBatchedDifferenceAxiom()
+    expected = array(
+        [[output1 - 2 * output2 for output2 in outputs] for output1 in outputs]
+    )
+    masks = {
+        None: ones((12, 12), dtype=bool_),
+        "diagonal": eye(12, dtype=bool_),
+        "random": default_rng(seed=0).random((12, 12)) < 0.3,
+    }
+
+    with ParallelAxiom(
+        axiom=axiom, n_jobs=2, prefer="threads", tile_size=3
+    ) as parallel_axiom:
+        assert (
+            parallel_axiom.masked_preferences(None, outputs, masks[mask])
+            == expected * masks[mask]
+        ).all()
+    # Each task's full matrix is used, instead of only one block of it.
+    assert sum(size**2 for size in axiom.sizes) <= 2 * len(outputs) ** 2
+
+
+def test_parallel_tile_size() -> None:
+    axiom: ParallelAxiom[Any, int] = ParallelAxiom(axiom=GreaterThanAxiom(), n_jobs=16)
+    # 64 tiles for 16 workers, but only the tiles above the diagonal are computed.
+    assert axiom._tile_size(1000) == 91
+    assert axiom._tile_size(10) == axiom.min_tile_size
+    assert ParallelAxiom(axiom=_DifferenceAxiom(), n_jobs=16)._tile_size(1000) == 125
+
+
+@mark.parametrize("axiom_type", [Prox1Axiom, Tfc1Axiom])
+def test_parallel_injected_axiom(axiom_type: Any) -> None:
+    query = Query(id="q1", text="blue car")
+    documents = [
+        Document(id="d1", text="a blue car goes through the city"),
+        Document(id="d2", text="through city blue goes car goes"),
+        Document(id="d3", text="blue car blue car"),
+        Document(id="d4", text="car blue x y z"),
+        Document(id="d5", text="nothing here"),
+    ]
+    injector = whitespace_injector()
+    inject_documents(documents, injector=injector)
+    axiom = lazy_inject(axiom_type, injector=injector)()
+    if axiom_type is Tfc1Axiom:
+        axiom = replace(
+            axiom, precondition=lazy_inject(LenPrecondition, injector=injector)()
+        )
+
+    # The default process backend pickles the injected tools (e.g., the caching term tokenizer).
+    with ParallelAxiom(axiom=axiom, n_jobs=2, min_tile_size=2) as parallel_axiom:
+        assert parallel_axiom.prefer == "processes"
+        assert (
+            parallel_axiom.preferences(query, documents)
+            == axiom.preferences(query, documents)
+        ).all()
@@ -0,0 +1,72 @@
+from dataclasses import dataclass, field
+from typing import Any, List, Sequence
+
+from numpy import float_
+from numpy.typing import NDArray
+
+from ir_axioms.axiom import (
+    Axiom,
+    NormalizedAxiom,
+    ScoreAxiom,
+    SharedAxiom,
+    SumAxiom,
+    UniformAxiom,
+    plan_axioms,
+)
+from ir_axioms.model import Document, Query
+from ir_axioms.tools import analysis_session
+
+
+@dataclass(frozen=True, kw_only=True)
+class _CountingScoreAxiom(ScoreAxiom[Any, Document]):
+    name: str
+    calls: List[Sequence[Document]] = field(
+        default_factory=list, repr=False, compare=False
+    )
+
+    def score(self, input: Any, output: Document) -> float:
+        return float(output.id)
+
+    def scores(self, input: Any, outputs: Sequence[Document]) -> NDArray[float_]:
+        self.calls.append(outputs)
+        return super().scores(input, outputs)
+
+
+def test_plan_axioms() -> None:
+    axiom1 = _CountingScoreAxiom(name="a")
+    axiom2 = _CountingScoreAxiom(name="b")
+    # An equally configured leaf is shared with the first one.
+    axiom1_copy = _CountingScoreAxiom(name="a")
+    axioms: Sequence[Axiom[Query, Document]] = [
+        axiom1,
+        axiom1 + axiom2,
+        axiom1_copy % axiom2 % UniformAxiom(scalar=1),
+        NormalizedAxiom(axiom=axiom1 + axiom2),
+        -axiom2,
+    ]
+    planned_axioms = plan_axioms(axioms)
+
+    shared_axiom1 = planned_axioms[0]
+    shared_sum = planned_axioms[1]
+    assert isinstance(shared_axiom1, SharedAxiom)
+    assert isinstance(shared_sum, SharedAxiom)
+    assert isinstance(shared_sum.axiom, SumAxiom)
+    assert list(shared_sum.axiom.axioms)[0] is shared_axiom1
+    normalized = planned_axioms[3]
+    assert isinstance(normalized, NormalizedAxiom)
+    assert normalized.axiom is shared_sum
+
+    query = Query(id="q1")
+    documents = [Document(id="3"), Document(id="1"), Document(id="2")]
+    expected = [axiom.preferences(query, documents) for axiom in axioms]
+    axiom1.calls.clear()
+    axiom2.calls.clear()
+    axiom1_copy.calls.clear()
+
+    with analysis_session():
+        actual = [axiom.preferences(query, documents) for axiom in planned_axioms]
+
+    for expected_preferences, actual_preferences in zip(expected, actual):
+        assert (expected_preferences == actual_preferences).all()
+    assert len(axiom1.calls) + len(axiom1_copy.calls) == 1
+    assert len(axiom2.calls) == 1
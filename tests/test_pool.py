@@ -0,0 +1,68 @@
+from os import getpid
+from typing import List, Tuple
+
+from ir_axioms.axiom.retrieval.proximity import Prox1Axiom
+from ir_axioms.model import Document, Query
+from ir_axioms.utils.lazy import lazy_inject
+from ir_axioms.utils.pool import map_warm_workers
+from tests.util import whitespace_injector
+
+_initialized: List[int] = []
+
+
+def _initialize() -> None:
+    _initialized.append(getpid())
+
+
+def _call(value: int) -> Tuple[int, int, int]:
+    # Return the number of initializations in this worker.
+    return value * 2, getpid(), len(_initialized)
+
+
+def test_map_warm_workers() -> None:
+    results = list(
+        map_warm_workers(
+            _call,
+            [(value,) for value in range(20)],
+            n_jobs=2,
+            initializer=_initialize,
+        )
+    )
+    # Results are in order.
+    assert [value for value, _, _ in results] == list(range(0, 40, 2))
+    # Workers are initialized only once.
+    assert all(initializations == 1 for _, _, initializations in results)
+    assert getpid() not in {pid for _, pid, _ in results}
+    assert len(_initialized) == 0
+
+
+def test_map_warm_workers_sequential() -> None:
+    results = list(map_warm_workers(_call, [(1,), (2,)], initializer=_initialize))
+    assert results == [(2, getpid(), 0), (4, getpid(), 0)]
+
+
+def test_map_warm_workers_injected_axiom() -> None:
+    query = Query(id="q1", text="blue car")
+    rankings = [
+        [
+            Document(id="d1", text="a blue car goes through the city"),
+            Document(id="d2", text="through city blue goes car goes"),
+        ],
+        [
+            Document(id="d3", text="blue car blue car"),
+            Document(id="d4", text="car blue x y z"),
+            Document(id="d5", text="nothing here"),
+        ],
+    ]
+    axiom = lazy_inject(Prox1Axiom, injector=whitespace_injector())()
+
+    # The function (and thus the injected tools) is pickled to each worker.
+    results = list(
+        map_warm_workers(
+            axiom.preferences,
+            [(query, documents) for documents in rankings],
+            n_jobs=2,
+        )
+    )
+    for documents, preferences in zip(rankings, results):
+        assert (preferences == axiom.preferences(query, documents)).all()
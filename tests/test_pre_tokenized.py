@@ -0,0 +1,91 @@
+from dataclasses import dataclass
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Mapping
+
+from ir_axioms.model import Document, TokenizedString
+from ir_axioms.tools import (
+    PreTokenizedDocumentTextContents,
+    PreTokenizedDocumentTextStatistics,
+    PreTokenizedStore,
+    PreTokenizedTermTokenizer,
+    TextContents,
+    build_pre_tokenized_store,
+)
+from tests.util import CountingTermTokenizer
+
+
+@dataclass(frozen=True, kw_only=True)
+class _MappingTextContents(TextContents[Document]):
+    texts: Mapping[str, str]
+
+    def contents(self, input: Document) -> str:
+        return self.texts[input.id]
+
+
+_DOCUMENTS = [
+    Document(id="d1", text="a b a"),
+    Document(id="d2", text=""),
+    Document(id="d3", text="c ä b"),
+]
+
+
+def test_pre_tokenized_store() -> None:
+    with TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "store"
+        inner = CountingTermTokenizer()
+        build_pre_tokenized_store(
+            path=path,
+            documents=_DOCUMENTS,
+            term_tokenizer=inner,
+            batch_size=2,
+        )
+        store = PreTokenizedStore(path=path)
+
+        assert len(store) == 3
+        assert "d2" in store
+        assert "d4" not in store
+        assert store.vocabulary == ["a", "b", "c", "ä"]
+        assert store.token_ids(0).tolist() == [0, 1, 0]
+        assert store.terms(1) == []
+        assert store.terms(2) == ["c", "ä", "b"]
+        assert store.text(2) == "c ä b"
+        assert store.term_counts(0) == {"a": 2, "b": 1}
+        assert store.text_index("c ä b") == 2
+        assert store.text_index("unknown") is None
+
+
+def test_pre_tokenized_tools() -> None:
+    with TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "store"
+        inner = CountingTermTokenizer()
+        store = build_pre_tokenized_store(
+            path=path,
+            documents=[Document(id=document.id) for document in _DOCUMENTS],
+            term_tokenizer=inner,
+            text_contents=_MappingTextContents(
+                texts={document.id: document.text or "" for document in _DOCUMENTS}
+            ),
+        )
+        assert inner.texts["a b a"] == 1
+
+        text_contents = PreTokenizedDocumentTextContents(store=store)
+        contents = text_contents.contents(Document(id="d1"))
+        assert contents == "a b a"
+        assert isinstance(contents, TokenizedString)
+        assert contents.tokens == {"a": 2, "b": 1}
+
+        tokenizer = PreTokenizedTermTokenizer(store=path, term_tokenizer=inner)
+        assert tokenizer.terms("a b a") == ["a", "b", "a"]
+        assert tokenizer.unique_terms("c ä b") == {"b", "c", "ä"}
+        assert tokenizer.terms_batch(["a b a", "q"]) == [["a", "b", "a"], ["q"]]
+        # Only the unknown text is tokenized again.
+        assert inner.texts == {"a b a": 1, "": 1, "c ä b": 1, "q": 1}
+
+        text_statistics = PreTokenizedDocumentTextStatistics(store=str(path))
+        assert text_statistics.term_counts(Document(id="d3")) == {
+            "b": 1,
+            "c": 1,
+            "ä": 1,
+        }
+        assert text_statistics.term_frequency(Document(id="d1"), "a") == 2 / 3
@@ -1,6 +1,15 @@
+from os import environ
+from subprocess import run
+from sys import executable
+
 from ir_axioms.axiom import PROX1, PROX2, PROX3, PROX4, PROX5
 from ir_axioms.model import Query, Document
 
+_PROX1_DISTANCE_SCRIPT = """
+from ir_axioms.axiom.retrieval.proximity import _average_between_query_terms
+print(_average_between_query_terms({"blue", "car"}, ["car", "blue", "x", "y", "z"]))
+"""
+
 
 def test_prox1() -> None:
     query = Query(id="q1", text="blue car")
@@ -13,6 +22,21 @@ def test_prox1() -> None:
     assert axiom.preference(query, document2, document1) == -1
 
 
+def test_prox1_hash_seed() -> None:
+    # Worker processes (e.g., of ParallelAxiom) hash strings with another seed.
+    distances = {
+        run(
+            [executable, "-c", _PROX1_DISTANCE_SCRIPT],
+            env={**environ, "PYTHONHASHSEED": str(seed)},
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        for seed in range(4)
+    }
+    assert len(distances) == 1
+
+
 def test_prox2() -> None:
     query = Query(id="q1", text="q1 q2")
     document1 = Document(id="d1", text="q1 x q2 y z a b c")
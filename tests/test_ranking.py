@@ -0,0 +1,214 @@
+from dataclasses import dataclass, field
+from typing import Any, List, Sequence, Tuple
+
+from numpy import array, float_, sign, subtract
+from numpy.typing import NDArray
+
+from ir_axioms.algorithms.preferences import LazyPreferenceMatrix
+from ir_axioms.algorithms.ranking import kwiksort, kwiksort_indices
+from ir_axioms.axiom import ORIG, Axiom, ScoreAxiom
+from ir_axioms.axiom.utils import strictly_greater
+from ir_axioms.model import Document, Preference
+from ir_axioms.tools import (
+    FirstPivotSelection,
+    MiddlePivotSelection,
+    RandomPivotSelection,
+)
+from tests.util import CountingGreaterThanAxiom
+
+
+@dataclass(frozen=True, kw_only=True)
+class _CountingScoreAxiom(ScoreAxiom[Any, int]):
+    calls: List[Sequence[int]] = field(default_factory=list)
+
+    def score(self, input: Any, output: int) -> float:
+        return output
+
+    def scores(self, input: Any, outputs: Sequence[int]) -> NDArray[float_]:
+        self.calls.append(outputs)
+        return array(outputs, dtype=float_)
+
+
+@dataclass(frozen=True, kw_only=True)
+class _CountingGroupAxiom(Axiom[Any, Document]):
+    """
+    Prefer documents from greater groups of two, i.e., ties within each group.
+    """
+
+    calls: List[Tuple[str, str]] = field(default_factory=list)
+
+    @property
+    def antisymmetric(self) -> bool:
+        return True
+
+    def preference(
+        self,
+        input: Any,
+        output1: Document,
+        output2: Document,
+    ) -> Preference:
+        self.calls.append((output1.id, output2.id))
+        return strictly_greater(int(output1.id) // 2, int(output2.id) // 2)
+
+
+def test_lazy_preference_matrix() -> None:
+    axiom = CountingGreaterThanAxiom()
+    preferences = LazyPreferenceMatrix(axiom=axiom, input=None, outputs=[1, 3, 2])
+
+    assert preferences[0, 1] == -1
+    assert preferences[1, 0] == 1
+    assert axiom.calls == [(1, 3)]
+
+    assert list(preferences.row(2)) == [1, -1, 0]
+    assert len(axiom.calls) == 3
+    assert (preferences.full() == array([[0, -1, -1], [1, 0, 1], [1, -1, 0]])).all()
+    assert len(axiom.calls) == 3
+    assert preferences.num_computed == 9
+
+
+def test_lazy_preference_matrix_batch() -> None:
+    axiom = _CountingScoreAxiom()
+    preferences = LazyPreferenceMatrix(axiom=axiom, input=None, outputs=[1, 3, 2])
+
+    assert list(preferences.column(0, [1, 2])) == [1, 1]
+    assert axiom.calls == [[1, 3, 2]]
+    assert preferences[2, 1] == -1
+    assert len(axiom.calls) == 1
+
+
+def test_lazy_preference_matrix_cascade() -> None:
+    axiom = _CountingGroupAxiom()
+    documents = [Document(id=str(id), rank=id) for id in range(10)]
+    preferences = LazyPreferenceMatrix(
+        axiom=axiom | ORIG(), input=None, outputs=documents
+    )
+
+    # Only the requested column is computed, not the square of all its outputs.
+    column = preferences.column(0, [1, 2, 3])
+    assert list(column) == [-1, 1, 1]
+    assert sorted(axiom.calls) == [("0", "1"), ("0", "2"), ("0", "3")]
+    assert preferences[0, 2] == -1
+    assert len(axiom.calls) == 3
+
+
+def test_kwiksort_cascade_evaluations() -> None:
+    documents = [Document(id=str(id), rank=id) for id in range(300)]
+
+    axiom = _CountingGroupAxiom()
+    ranking = kwiksort(
+        axiom=axiom | ORIG(),
+        input=None,
+        vertices=documents,
+        pivot_selection=RandomPivotSelection(seed=0),
+    )
+    assert [int(document.id) // 2 for document in ranking] == sorted(
+        (id // 2 for id in range(300)), reverse=True
+    )
+
+    # Each compared pair is evaluated once, and far fewer than all pairs are compared.
+    pairs = {frozenset(pair) for pair in axiom.calls}
+    assert len(pairs) == len(axiom.calls)
+    assert len(axiom.calls) < len(documents) * (len(documents) - 1) // 8
+
+
+def test_kwiksort() -> None:
+    vertices = [5, 2, 8, 1, 9, 3, 7, 4, 6, 0]
+
+    axiom = CountingGreaterThanAxiom()
+    ranking = kwiksort(
+        axiom=axiom,
+        input=None,
+        vertices=vertices,
+        pivot_selection=RandomPivotSelection(seed=0),
+    )
+    assert ranking == sorted(vertices, reverse=True)
+
+    # Each unordered pair is computed at most once.
+    pairs = {frozenset(pair) for pair in axiom.calls}
+    assert len(pairs) == len(axiom.calls)
+    assert len(axiom.calls) < len(vertices) * (len(vertices) - 1) // 2
+
+
+def test_kwiksort_shared_preferences() -> None:
+    vertices = [5, 2, 8, 1, 9]
+
+    axiom = CountingGreaterThanAxiom()
+    preferences = LazyPreferenceMatrix(axiom=axiom, input=None, outputs=vertices)
+    preferences.full()
+    num_calls = len(axiom.calls)
+
+    ranking = kwiksort(
+        axiom=axiom,
+        input=None,
+        vertices=vertices,
+        pivot_selection=FirstPivotSelection(),
+        preferences=preferences,
+    )
+    assert ranking == [9, 8, 5, 2, 1]
+    assert len(axiom.calls) == num_calls
+
+
+def test_kwiksort_matrix() -> None:
+    vertices = [5, 2, 8, 1, 9, 3, 7, 4, 6, 0]
+    matrix = sign(subtract.outer(vertices, vertices)).astype(float_)
+
+    ranking = kwiksort(
+        axiom=None,
+        input=None,
+        vertices=vertices,
+        pivot_selection=MiddlePivotSelection(),
+        preferences=matrix,
+    )
+    assert ranking == sorted(vertices, reverse=True)
+
+
+def test_kwiksort_deep() -> None:
+    # Always selecting the worst vertex as pivot partitions deeper than the recursion limit.
+    vertices = list(range(2000))
+    matrix = sign(subtract.outer(vertices, vertices)).astype(float_)
+
+    ranking = kwiksort_indices(
+        axiom=None,
+        input=None,
+        vertices=vertices,
+        pivot_selection=FirstPivotSelection(),
+        preferences=matrix,
+    )
+    assert ranking.tolist() == sorted(vertices, reverse=True)
+
+
+def test_kwiksort_batch() -> None:
+    vertices = [5, 2, 8, 1, 9, 3, 7, 4, 6, 0]
+
+    axiom = _CountingScoreAxiom()
+    ranking = kwiksort(
+        axiom=axiom,
+        input=None,
+        vertices=vertices,
+        pivot_selection=RandomPivotSelection(seed=0),
+    )
+    assert ranking == sorted(vertices, reverse=True)
+    assert len(axiom.calls) == 1
+
+
+def test_kwiksort_indices_evaluations() -> None:
+    documents = [Document(id=str(id), rank=id) for id in range(1000)]
+
+    axiom = _CountingGroupAxiom()
+    preferences = LazyPreferenceMatrix(
+        axiom=axiom | ORIG(), input=None, outputs=documents
+    )
+    ranking = kwiksort_indices(
+        axiom=None,
+        input=None,
+        vertices=documents,
+        pivot_selection=RandomPivotSelection(seed=0),
+        preferences=preferences,
+    )
+    assert [index // 2 for index in ranking.tolist()] == sorted(
+        (index // 2 for index in range(1000)), reverse=True
+    )
+
+    # Only the pivot columns are computed, with one evaluation per compared pair.
+    assert preferences.num_computed == len(documents) + 2 * len(axiom.calls)
+    assert len(axiom.calls) < 20 * len(documents)
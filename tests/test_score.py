@@ -0,0 +1,67 @@
+from dataclasses import dataclass
+from math import inf, nan
+from typing import Any, ClassVar, Mapping
+
+from ir_axioms.axiom import ScoreAxiom
+
+
+@dataclass(frozen=True, kw_only=True)
+class _LookupScoreAxiom(ScoreAxiom[Any, str]):
+    lookup: Mapping[str, float]
+    margin_fraction: float = 0.0
+
+    def score(self, input: Any, output: str) -> float:
+        return self.lookup[output]
+
+
+@dataclass(frozen=True, kw_only=True)
+class _LessLookupScoreAxiom(_LookupScoreAxiom):
+    prefer_greater: ClassVar[bool] = False
+
+
+_LOOKUP = {
+    "o1": 1.0,
+    "o2": 1.05,
+    "o3": 2.0,
+    "o4": 0.0,
+    "o5": nan,
+    "o6": inf,
+    "o7": -inf,
+    "o8": 2.0,
+}
+
+
+def _assert_consistent(axiom: _LookupScoreAxiom) -> None:
+    outputs = list(axiom.lookup.keys())
+    preferences = axiom.preferences("i1", outputs)
+    for i1, output1 in enumerate(outputs):
+        for i2, output2 in enumerate(outputs):
+            assert preferences[i1, i2] == axiom.preference("i1", output1, output2)
+
+
+def test_score_greater() -> None:
+    axiom = _LookupScoreAxiom(lookup=_LOOKUP)
+
+    assert axiom.preference("i1", "o3", "o1") == 1
+    assert axiom.preference("i1", "o1", "o3") == -1
+    assert axiom.preference("i1", "o3", "o8") == 0
+    assert axiom.preference("i1", "o5", "o1") == 0
+    _assert_consistent(axiom)
+
+
+def test_score_less() -> None:
+    axiom = _LessLookupScoreAxiom(lookup=_LOOKUP)
+
+    assert axiom.preference("i1", "o3", "o1") == -1
+    assert axiom.preference("i1", "o1", "o3") == 1
+    assert axiom.preference("i1", "o6", "o7") == -1
+    _assert_consistent(axiom)
+
+
+def test_score_margin() -> None:
+    axiom = _LookupScoreAxiom(lookup=_LOOKUP, margin_fraction=0.1)
+
+    assert axiom.preference("i1", "o2", "o1") == 0
+    assert axiom.preference("i1", "o3", "o1") == 1
+    assert axiom.preference("i1", "o6", "o3") == 1
+    _assert_consistent(axiom)
@@ -0,0 +1,84 @@
+from pathlib import Path
+from pickle import dumps, loads
+from tempfile import TemporaryDirectory
+
+from ir_axioms.axiom import PROX1
+from ir_axioms.tools import CachingTermTokenizer, SessionTermTokenizer
+from tests.util import CountingTermTokenizer
+
+
+def test_caching_term_tokenizer_lru() -> None:
+    inner = CountingTermTokenizer()
+    tokenizer = CachingTermTokenizer(term_tokenizer=inner, max_size=2)
+
+    assert tokenizer.terms("a b") == ["a", "b"]
+    assert tokenizer.terms("a b") == ["a", "b"]
+    assert tokenizer.unique_terms("a b") == {"a", "b"}
+    assert inner.texts["a b"] == 1
+
+    tokenizer.terms("c")
+    tokenizer.terms("d")
+    # The least recently used text was evicted.
+    assert tokenizer.terms("a b") == ["a", "b"]
+    assert inner.texts["a b"] == 2
+
+    assert tokenizer.statistics.memory_hits == 2
+    assert tokenizer.statistics.misses == 4
+    assert tokenizer.statistics.hit_rate == 2 / 6
+
+
+def test_caching_term_tokenizer_persistent() -> None:
+    with TemporaryDirectory() as tmp_dir:
+        cache_path = Path(tmp_dir) / "terms.sqlite"
+
+        inner = CountingTermTokenizer()
+        tokenizer = CachingTermTokenizer(term_tokenizer=inner, cache_path=cache_path)
+        assert tokenizer.terms("a b") == ["a", "b"]
+        tokenizer.close()
+
+        # A new tokenizer (e.g., in a new run) reads from disk.
+        tokenizer = CachingTermTokenizer(term_tokenizer=inner, cache_path=cache_path)
+        assert tokenizer.terms("a b") == ["a", "b"]
+        assert tokenizer.terms("a b") == ["a", "b"]
+        assert inner.texts["a b"] == 1
+        assert tokenizer.statistics.disk_hits == 1
+        assert tokenizer.statistics.memory_hits == 1
+        tokenizer.close()
+
+
+def test_caching_term_tokenizer_batch() -> None:
+    inner = CountingTermTokenizer()
+    tokenizer = CachingTermTokenizer(term_tokenizer=inner)
+
+    assert tokenizer.terms("a b") == ["a", "b"]
+    assert tokenizer.terms_batch(["a b", "c", "d e"]) == [["a", "b"], ["c"], ["d", "e"]]
+    assert tokenizer.unique_terms_batch(["c", "d e"]) == [{"c"}, {"d", "e"}]
+    assert inner.texts == {"a b": 1, "c": 1, "d e": 1}
+
+
+def test_caching_term_tokenizer_pickle() -> None:
+    with TemporaryDirectory() as tmp_dir:
+        cache_path = Path(tmp_dir) / "terms.sqlite"
+
+        tokenizer = CachingTermTokenizer(
+            term_tokenizer=CountingTermTokenizer(), cache_path=cache_path
+        )
+        assert tokenizer.terms("a b") == ["a", "b"]
+
+        # The copy (e.g., in a worker process) opens its own connection and memory cache.
+        copy: CachingTermTokenizer = loads(dumps(tokenizer))
+        assert copy == tokenizer
+        assert copy.terms("a b") == ["a", "b"]
+        assert copy.statistics.disk_hits == 1
+        assert copy.statistics.memory_hits == 0
+        copy.close()
+        tokenizer.close()
+
+
+def test_default_injected_axiom_pickle() -> None:
+    axiom = PROX1()
+    copy = loads(dumps(axiom))
+    assert type(copy) is type(axiom)
+    assert isinstance(copy.term_tokenizer, SessionTermTokenizer)
+    assert isinstance(copy.term_tokenizer.term_tokenizer, CachingTermTokenizer)
+    assert copy.term_tokenizer == axiom.term_tokenizer
@@ -0,0 +1,179 @@
+from dataclasses import dataclass
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Mapping, Union
+
+from injector import InstanceProvider, singleton
+from pytest import mark, raises
+
+from ir_axioms.axiom.retrieval.proximity import Prox1Axiom
+from ir_axioms.dependency_injection import injector
+from ir_axioms.integrations.trec import ShardedTrecRunner, read_trec_run
+from ir_axioms.model import Document, Query
+from ir_axioms.tools import SimpleTextContents, TextContents
+from ir_axioms.tools.tokenizer import SpacyTermTokenizer
+from ir_axioms.utils.injection import reset_binding_scopes
+from ir_axioms.utils.lazy import lazy_inject
+from tests.util import WhitespaceTermTokenizer, whitespace_injector
+
+_RUN = """q2 Q0 d3 2 0.5 bm25
+q2 Q0 d1 1 0.9 bm25
+q2 Q0 d2 3 0.1 bm25
+q1 Q0 d4 1 2.0 bm25
+q1 Q0 d5 2 1.0 bm25
+q3 Q0 d6 1 1.0 bm25
+"""
+
+
+def _write_run(directory: Path) -> Path:
+    run_path = directory / "run.txt"
+    run_path.write_text(_RUN)
+    return run_path
+
+
+def test_read_trec_run() -> None:
+    with TemporaryDirectory() as directory:
+        rankings = read_trec_run(_write_run(Path(directory)))
+    assert [qid for qid, _ in rankings] == ["q2", "q1", "q3"]
+    assert [document.id for document in rankings[0][1]] == ["d1", "d3", "d2"]
+    assert rankings[0][1][0].score == 0.9
+
+
+def test_kwiksort() -> None:
+    with TemporaryDirectory() as directory:
+        run_path = _write_run(Path(directory))
+        output_path = Path(directory) / "reranked.txt"
+        ShardedTrecRunner(
+            axioms=["ORIG"],
+            mode="kwiksort",
+            queries_per_shard=2,
+        ).run(run_path, output_path)
+        lines = output_path.read_text().splitlines()
+        assert not (Path(directory) / "reranked.txt.shards").exists()
+    assert [line.split()[:4] for line in lines] == [
+        ["q2", "Q0", "d1", "1"],
+        ["q2", "Q0", "d3", "2"],
+        ["q2", "Q0", "d2", "3"],
+        ["q1", "Q0", "d4", "1"],
+        ["q1", "Q0", "d5", "2"],
+        ["q3", "Q0", "d6", "1"],
+    ]
+
+
+def test_preferences_deterministic() -> None:
+    with TemporaryDirectory() as directory:
+        run_path = _write_run(Path(directory))
+        sequential_path = Path(directory) / "sequential.tsv"
+        parallel_path = Path(directory) / "parallel.tsv"
+        ShardedTrecRunner(axioms=["ORIG"], queries_per_shard=1).run(
+            run_path, sequential_path
+        )
+        ShardedTrecRunner(axioms=["ORIG"], queries_per_shard=1, n_jobs=2).run(
+            run_path, parallel_path
+        )
+        sequential = sequential_path.read_text()
+        parallel = parallel_path.read_text()
+    assert sequential == parallel
+    lines = sequential.splitlines()
+    assert lines[0] == "qid\tdocno_a\tdocno_b\tORIG"
+    assert len(lines) == 1 + 9 + 4 + 1
+    assert lines[2] == "q2\td1\td3\t1.0"
+
+
+def test_checkpoints() -> None:
+    with TemporaryDirectory() as directory:
+        run_path = _write_run(Path(directory))
+        output_path = Path(directory) / "preferences.tsv"
+        checkpoint_dir = Path(directory) / "checkpoints"
+        runner = ShardedTrecRunner(axioms=["ORIG"], queries_per_shard=2)
+        runner.run(run_path, output_path, checkpoint_dir, keep_checkpoints=True)
+        shard_paths = sorted(checkpoint_dir.glob("shard-*.txt"))
+        assert len(shard_paths) == 2
+
+        # Completed shards are not computed again.
+        shard_paths[0].write_text("checkpointed\n")
+        runner.run(run_path, output_path, checkpoint_dir, keep_checkpoints=True)
+        assert output_path.read_text().splitlines()[1] == "checkpointed"
+
+        # Checkpoints of another configuration are not mixed in.
+        with raises(ValueError):
+            ShardedTrecRunner(axioms=["ORIG"], queries_per_shard=1).run(
+                run_path, output_path, checkpoint_dir
+            )
+
+
+@dataclass(frozen=True)
+class _LookupTextContents(TextContents[Union[Query, Document]]):
+    texts: Mapping[str, str]
+
+    def contents(self, input: Union[Query, Document]) -> str:
+        return self.texts[input.id]
+
+
+_TEXTS = {
+    "q1": "blue car",
+    "q2": "blue car",
+    "q3": "blue car",
+    "d1": "a blue car goes through the city",
+    "d2": "through city blue goes car goes",
+    "d3": "blue car blue car",
+    "d4": "car blue x y z",
+    "d5": "blue a b c d car",
+    "d6": "nothing here",
+}
+
+
+@mark.parametrize("mode", ["preferences", "kwiksort"])
+def test_injected_axiom_workers(mode: Any) -> None:
+    axiom = lazy_inject(Prox1Axiom, injector=whitespace_injector())(
+        text_contents=_LookupTextContents(_TEXTS),
+    )
+    with TemporaryDirectory() as directory:
+        run_path = _write_run(Path(directory))
+        sequential_path = Path(directory) / "sequential.txt"
+        parallel_path = Path(directory) / "parallel.txt"
+        ShardedTrecRunner(axioms=[axiom], mode=mode, queries_per_shard=1).run(
+            run_path, sequential_path
+        )
+        # The axiom instance (and its injected tools) is pickled to the workers.
+        ShardedTrecRunner(axioms=[axiom], mode=mode, queries_per_shard=1, n_jobs=2).run(
+            run_path, parallel_path
+        )
+        assert sequential_path.read_text() == parallel_path.read_text()
+
+
+def _bind_lookup_texts() -> None:
+    for interface in (TextContents[Query], TextContents[Document]):
+        injector.binder.bind(
+            interface=interface,
+            to=InstanceProvider(_LookupTextContents(_TEXTS)),
+            scope=singleton,
+        )
+    injector.binder.bind(
+        interface=SpacyTermTokenizer,
+        to=InstanceProvider(WhitespaceTermTokenizer()),
+        scope=singleton,
+    )
+    reset_binding_scopes()
+
+
+def test_worker_initializer_in_process() -> None:
+    axiom = lazy_inject(Prox1Axiom, injector=whitespace_injector())(
+        text_contents=_LookupTextContents(_TEXTS),
+    )
+    with TemporaryDirectory() as directory:
+        run_path = _write_run(Path(directory))
+        expected_path = Path(directory) / "expected.txt"
+        output_path = Path(directory) / "output.txt"
+        ShardedTrecRunner(axioms=[axiom], mode="kwiksort").run(run_path, expected_path)
+        # The axiom is resolved by name with the initializer's bindings.
+        ShardedTrecRunner(
+            axioms=["PROX1"],
+            mode="kwiksort",
+            worker_initializer=_bind_lookup_texts,
+        ).run(run_path, output_path)
+        assert output_path.read_text() == expected_path.read_text()
+
+    # The bindings are not changed for the rest of the program.
+    assert isinstance(injector.get(TextContents[Query]), SimpleTextContents)
+    assert isinstance(injector.get(SpacyTermTokenizer), SpacyTermTokenizer)
@@ -1,10 +1,13 @@
-from dataclasses import dataclass
-from typing import Collection
-from injector import inject, Injector
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Collection, List, Sequence, Tuple
+from injector import inject, Injector, InstanceProvider, singleton
 
-from ir_axioms.dependency_injection import injector as _default_injector
-from ir_axioms.model import Document
+from ir_axioms.axiom import GreaterThanAxiom
+from ir_axioms.dependency_injection import DefaultModule, injector as _default_injector
+from ir_axioms.model import Document, Preference
 from ir_axioms.tools import IndexStatistics, TextContents, TermTokenizer
+from ir_axioms.tools.tokenizer import SpacyTermTokenizer
 
 
 @dataclass(frozen=True)
@@ -46,3 +49,46 @@ def inject_documents(
         interface=InMemoryDocumentCollection,
         to=InMemoryDocumentCollection(documents),
     )
+
+
+@dataclass(frozen=True)
+class WhitespaceTermTokenizer(TermTokenizer):
+    def terms(self, text: str) -> Sequence[str]:
+        return text.lower().split()
+
+
+@dataclass(frozen=True, kw_only=True)
+class CountingTermTokenizer(TermTokenizer):
+    texts: Counter = field(default_factory=Counter, repr=False, compare=False)
+
+    def terms(self, text: str) -> Sequence[str]:
+        self.texts[text] += 1
+        return text.split()
+
+
+@dataclass(frozen=True, kw_only=True)
+class CountingGreaterThanAxiom(GreaterThanAxiom[int]):
+    calls: List[Tuple[int, int]] = field(default_factory=list)
+
+    def preference(
+        self,
+        input: Any,
+        output1: int,
+        output2: int,
+    ) -> Preference:
+        self.calls.append((output1, output2))
+        return super().preference(input, output1, output2)
+
+
+def whitespace_injector() -> Injector:
+    """
+    Create an injector with the default bindings, except for tokenizing terms at whitespace instead of with spaCy.
+    The default caching and session term tokenizers still wrap the whitespace tokenizer.
+    """
+    injector = Injector(DefaultModule)
+    injector.binder.bind(
+        interface=SpacyTermTokenizer,
+        to=InstanceProvider(WhitespaceTermTokenizer()),
+        scope=singleton,
+    )
+    return injector